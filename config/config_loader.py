@@ -5,15 +5,20 @@ Extends SafePromptLoader pattern to handle all configuration needs
 """
 
 import os
+import re
+import copy
 import yaml
 import logging
+import threading
 from typing import Dict, Any, Optional
 from pathlib import Path
-from functools import lru_cache
 # Removed dotenv dependency - using direct environment variables only
 
 logger = logging.getLogger(__name__)
 
+# ${VAR_NAME} placeholders in config values
+_ENV_VAR_RE = re.compile(r'\$\{([^}]+)\}')
+
 class ConfigurationError(Exception):
     """Custom exception for configuration issues"""
     pass
@@ -44,16 +49,31 @@ class UnifiedConfigLoader:
         current_dir = Path(__file__).parent
         return str(current_dir / "data_loader_config.yaml")
     
-    def _load_dataloader_config(self) -> Dict[str, Any]:
+    def _get_section(self, section: str, default: Any = None) -> Any:
+        """Copy of one top-level config section; cheaper than copying the whole config"""
+        return copy.deepcopy(self._cached_dataloader_config().get(section, {} if default is None else default))
+    
+    def _get_env_overrides(self, section: str) -> Dict[str, Any]:
+        """Copy of this environment's overrides for one config section"""
+        environments = self._cached_dataloader_config().get('environments') or {}
+        return copy.deepcopy((environments.get(self.environment) or {}).get(section, {}))
+    
+    def _cached_dataloader_config(self) -> Dict[str, Any]:
         """
         Load and cache dataloader configuration with safety checks
         
+        The returned dict is shared; callers must not modify it
+        
         Returns:
             Parsed dataloader configuration dictionary
             
         Raises:
             ConfigurationError: If config loading/validation fails
         """
+        # Parse the YAML once per loader
+        if 'config' in self._dataloader_config_cache:
+            return self._dataloader_config_cache['config']
+        
         try:
             # Check if config file exists
             if not os.path.exists(self.dataloader_config_path):
@@ -73,6 +93,7 @@ class UnifiedConfigLoader:
             self._validate_dataloader_config(config)
             
             logger.info(f"Dataloader configuration loaded from {self.dataloader_config_path}")
+            self._dataloader_config_cache['config'] = config
             return config
             
         except yaml.YAMLError as e:
@@ -106,13 +127,10 @@ class UnifiedConfigLoader:
         Returns:
             Configuration with environment variables substituted
         """
-        import re
-        
         def substitute_value(value):
             if isinstance(value, str):
                 # Find patterns like ${VAR_NAME}
-                pattern = r'\$\{([^}]+)\}'
-                matches = re.findall(pattern, value)
+                matches = _ENV_VAR_RE.findall(value)
                 for var_name in matches:
                     env_value = os.getenv(var_name)
                     if env_value:
@@ -145,8 +163,7 @@ class UnifiedConfigLoader:
             LLM configuration dictionary with resolved values
         """
         try:
-            config = self._load_dataloader_config()
-            llm_config = config.get('llm_config', {})
+            self._cached_dataloader_config()
             
             # Resolve environment variables
             resolved_config = {}
@@ -178,17 +195,12 @@ class UnifiedConfigLoader:
             Data source configuration dictionary
         """
         try:
-            config = self._load_dataloader_config()
-            data_sources = config.get('data_sources', {})
-            
-            source_config = data_sources.get(source_name, {})
+            source_config = self._get_section('data_sources').get(source_name, {})
             
             # Apply environment-specific overrides
-            if 'environments' in config and self.environment in config['environments']:
-                env_config = config['environments'][self.environment]
-                if 'data_sources' in env_config and source_name in env_config['data_sources']:
-                    env_overrides = env_config['data_sources'][source_name]
-                    source_config.update(env_overrides)
+            env_sources = self._get_env_overrides('data_sources')
+            if source_name in env_sources:
+                source_config.update(env_sources[source_name])
             
             logger.debug(f"Data source config retrieved: {source_name}")
             return source_config
@@ -205,20 +217,16 @@ class UnifiedConfigLoader:
             Text processing configuration dictionary
         """
         try:
-            config = self._load_dataloader_config()
-            text_config = config.get('text_processing', {})
+            text_config = self._get_section('text_processing')
             
             # Apply environment-specific overrides
-            if 'environments' in config and self.environment in config['environments']:
-                env_config = config['environments'][self.environment]
-                if 'text_processing' in env_config:
-                    env_overrides = env_config['text_processing']
-                    # Deep merge configuration
-                    for key, value in env_overrides.items():
-                        if isinstance(value, dict) and key in text_config:
-                            text_config[key].update(value)
-                        else:
-                            text_config[key] = value
+            env_overrides = self._get_env_overrides('text_processing')
+            # Deep merge configuration
+            for key, value in env_overrides.items():
+                if isinstance(value, dict) and key in text_config:
+                    text_config[key].update(value)
+                else:
+                    text_config[key] = value
             
             logger.debug("Text processing config retrieved")
             return text_config
@@ -235,16 +243,13 @@ class UnifiedConfigLoader:
             Pipeline configuration dictionary
         """
         try:
-            config = self._load_dataloader_config()
-            pipeline_config = config.get('pipeline', {})
+            pipeline_config = self._get_section('pipeline')
             
             # Apply environment-specific overrides
-            if 'environments' in config and self.environment in config['environments']:
-                env_config = config['environments'][self.environment]
-                if 'pipeline' in env_config:
-                    env_overrides = env_config['pipeline']
-                    # Deep merge configuration
-                    self._deep_merge(pipeline_config, env_overrides)
+            env_overrides = self._get_env_overrides('pipeline')
+            if env_overrides:
+                # Deep merge configuration
+                self._deep_merge(pipeline_config, env_overrides)
             
             logger.debug("Pipeline config retrieved")
             return pipeline_config
@@ -293,8 +298,7 @@ class UnifiedConfigLoader:
             Entity extraction configuration dictionary
         """
         try:
-            config = self._load_dataloader_config()
-            return config.get('entity_extraction', {})
+            return self._get_section('entity_extraction')
         except Exception as e:
             logger.error(f"Failed to get entity extraction config: {str(e)}")
             return {}
@@ -307,8 +311,7 @@ class UnifiedConfigLoader:
             Neo4j configuration dictionary with resolved values
         """
         try:
-            config = self._load_dataloader_config()
-            neo4j_config = config.get('neo4j_config', {})
+            neo4j_config = self._get_section('neo4j_config')
             
             # Resolve environment variables
             resolved_config = {}
@@ -360,7 +363,12 @@ class UnifiedConfigLoader:
                     'auto_create_database': False,
                     'clear_on_startup': False,
                     'backup_before_clear': True,
-                    'max_connections': 50
+                    'max_connections': 50,
+                    'connection_acquisition_timeout': 60.0,
+                    'connection_timeout': 15.0,
+                    'max_connection_lifetime': 3600,
+                    'keep_alive': True,
+                    'write_batch_size': 10000
                 }
             }
     
@@ -372,8 +380,7 @@ class UnifiedConfigLoader:
             Data cleanup configuration dictionary
         """
         try:
-            config = self._load_dataloader_config()
-            return config.get('data_cleanup', {
+            return self._get_section('data_cleanup', {
                 'auto_cleanup_on_load': False,
                 'backup_old_data': True,
                 'cleanup_strategies': ['clear_existing_nodes']
@@ -395,11 +402,10 @@ class UnifiedConfigLoader:
         """
         try:
             # Clear dataloader config cache
-            self._load_dataloader_config.cache_clear()
             self._dataloader_config_cache.clear()
             
             # Reload dataloader config
-            self._load_dataloader_config()
+            self._cached_dataloader_config()
             
             logger.info("All configurations reloaded successfully")
             return True
@@ -410,11 +416,16 @@ class UnifiedConfigLoader:
 
 # Create global instance following your pattern
 _config_loader = None
+_config_loaders: Dict[str, UnifiedConfigLoader] = {}
+_config_loader_lock = threading.Lock()
 
 def get_config_loader(environment: str = None) -> UnifiedConfigLoader:
     """
     Get global configuration loader instance (singleton pattern)
     
+    Loaders are cached per environment, so switching back and forth between
+    environments does not re-read the YAML file.
+    
     Args:
         environment: Environment name (defaults to current environment)
         
@@ -423,8 +434,22 @@ def get_config_loader(environment: str = None) -> UnifiedConfigLoader:
     """
     global _config_loader
     
-    if _config_loader is None or (environment and environment != _config_loader.environment):
+    with _config_loader_lock:
+        if environment is None and _config_loader is not None:
+            return _config_loader
+        
         env = environment or os.getenv('ENVIRONMENT', 'production')
-        _config_loader = UnifiedConfigLoader(environment=env)
+        loader = _config_loaders.get(env)
+        if loader is None:
+            loader = _config_loaders[env] = UnifiedConfigLoader(environment=env)
+        _config_loader = loader
+    
+    return _config_loader
+
+def clear_config_loader_cache() -> None:
+    """Drop all cached configuration loaders (useful for development/testing)"""
+    global _config_loader
     
-    return _config_loader
\ No newline at end of file
+    with _config_loader_lock:
+        _config_loaders.clear()
+        _config_loader = None
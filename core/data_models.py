@@ -78,6 +78,20 @@ class DocumentEntity:
         if not self.timestamp:
             self.timestamp = datetime.now()
 
+@dataclass
+class SystemBatch:
+    """
+    Structure-of-arrays listing of every system in a data source
+
+    Built by one scan of the data source; index i of each list describes the same system
+    """
+    base_path: str
+    system_ids: List[str] = field(default_factory=list)
+    file_paths: List[List[str]] = field(default_factory=list)  # candidate files, relative to the system directory
+
+    def __len__(self) -> int:
+        return len(self.system_ids)
+
 # Type aliases for backward compatibility and flexibility
 System = SystemEntity
 Event = EventEntity 
@@ -5,13 +5,75 @@ Extensible architecture for different knowledge graph creation strategies
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Iterable, Optional, Tuple
+import asyncio
+import atexit
 import logging
 import os
-from dotenv import load_dotenv
+import threading
+from functools import lru_cache
+
+from core.neo4j_driver import driver_options
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=None)
+def _load_dotenv_once() -> bool:
+    """Apply .env over the process environment on first call; later calls are a cache hit"""
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        logger.debug("python-dotenv not installed - using process environment only")
+        return False
+    return load_dotenv(override=True)
+
+# Shared LangChain Neo4jGraph connections (each owns a driver and its pool), keyed by connection settings
+_NEO4J_GRAPHS: Dict[tuple, Any] = {}
+_NEO4J_GRAPHS_LOCK = threading.Lock()
+
+# add_graph_documents MERGEs shared entity nodes in auto-commit transactions with no retry;
+# concurrent callers (threads or async tasks) would deadlock each other, so writes go one at a time
+_GRAPH_WRITE_LOCK = threading.Lock()
+
+def _get_neo4j_graph(neo4j_config: Dict[str, Any]):
+    """
+    Get the process-wide Neo4jGraph for a connection, creating it on first use
+    
+    Builders for the same database share one driver; connections are closed at interpreter exit
+    """
+    from langchain_neo4j import Neo4jGraph
+    
+    # Same pool settings as the loader's own drivers (management.max_connections etc.)
+    options = driver_options(neo4j_config)
+    key = (neo4j_config['uri'], neo4j_config['username'], neo4j_config['password'], neo4j_config['database'],
+           tuple(sorted(options.items())))
+    with _NEO4J_GRAPHS_LOCK:
+        graph = _NEO4J_GRAPHS.get(key)
+        if graph is None:
+            graph = Neo4jGraph(
+                url=neo4j_config['uri'],
+                username=neo4j_config['username'],
+                password=neo4j_config['password'],
+                database=neo4j_config['database'],
+                refresh_schema=False,
+                driver_config=options
+            )
+            _NEO4J_GRAPHS[key] = graph
+        return graph
+
+def close_neo4j_graphs():
+    """Close every shared Neo4jGraph connection"""
+    with _NEO4J_GRAPHS_LOCK:
+        graphs = list(_NEO4J_GRAPHS.values())
+        _NEO4J_GRAPHS.clear()
+    for graph in graphs:
+        try:
+            graph.close()
+        except Exception:
+            pass
+
+atexit.register(close_neo4j_graphs)
+
 class GraphBuilder(ABC):
     """
     Abstract base class for knowledge graph builders
@@ -44,6 +106,26 @@ class GraphBuilder(ABC):
         """
         pass
     
+    def create_knowledge_graphs_batch(self, items: List[Tuple[str, Dict[str, Any]]]) -> Dict[str, bool]:
+        """
+        Create knowledge graphs for several data sources
+        
+        Args:
+            items: List of (system_id, processed_data) pairs
+        
+        Returns:
+            Dict mapping system_id to success status
+        
+        The default implementation processes items one at a time; builders
+        backed by a remote model should override it to batch the requests.
+        """
+        return {system_id: self.create_knowledge_graph(system_id, processed_data)
+                for system_id, processed_data in items}
+    
+    async def acreate_knowledge_graph(self, system_id: str, processed_data: Dict[str, Any]) -> bool:
+        """Async variant of create_knowledge_graph (runs it in a worker thread by default)"""
+        return await asyncio.to_thread(self.create_knowledge_graph, system_id, processed_data)
+    
     @abstractmethod
     def get_supported_domains(self) -> List[str]:
         """
@@ -70,28 +152,38 @@ class AIGraphBuilder(GraphBuilder):
     - Direct Neo4j integration via LangChain
     """
     
-    def __init__(self, llm_config: Dict[str, Any], neo4j_config: Dict[str, Any]):
+    def __init__(self, llm_config: Dict[str, Any], neo4j_config: Dict[str, Any],
+                 allowed_nodes: Optional[Iterable[str]] = None,
+                 allowed_relationships: Optional[Iterable[str]] = None):
         """
         Initialize AI-powered graph builder
         
         Args:
             llm_config: LLM configuration (endpoint, model, API key)
             neo4j_config: Neo4j connection configuration
+            allowed_nodes: Node types extraction is restricted to (defaults to the universal schema)
+            allowed_relationships: Relationship types extraction is restricted to (defaults to the universal schema)
         """
         # Force reload environment variables to get working API key
-        load_dotenv(override=True)
+        _load_dotenv_once()
         
         self.llm_config = llm_config
         self.neo4j_config = neo4j_config
         self.llm = None
         self.graph_transformer = None
         self.neo4j_graph = None
+        self.document_cls = None
+        # Sorted so a domain vocabulary given as a set yields a stable prompt
+        self.allowed_nodes = sorted(allowed_nodes) if allowed_nodes is not None else self._get_universal_node_types()
+        self.allowed_relationships = (sorted(allowed_relationships) if allowed_relationships is not None
+                                      else self._get_universal_relationships())
         
         try:
             from langchain_experimental.graph_transformers import LLMGraphTransformer
             from langchain_openai import ChatOpenAI
             from langchain_core.documents import Document
-            from langchain_neo4j import Neo4jGraph
+            # Kept on the instance so building each document skips the import lookup
+            self.document_cls = Document
             
             # Initialize LLM using config values
             self.llm = ChatOpenAI(
@@ -101,29 +193,23 @@ class AIGraphBuilder(GraphBuilder):
                 temperature=0  # Deterministic for consistent results
             )
             
-            # Initialize Neo4j connection
-            self.neo4j_graph = Neo4jGraph(
-                url=neo4j_config['uri'],
-                username=neo4j_config['username'],
-                password=neo4j_config['password'],
-                database=neo4j_config['database'],
-                refresh_schema=False
-            )
+            # Initialize Neo4j connection (shared with other builders for the same database)
+            self.neo4j_graph = _get_neo4j_graph(neo4j_config)
             
-            # Initialize LLM Graph Transformer with universal schema
+            # Initialize LLM Graph Transformer with the universal (or domain) schema
             self.graph_transformer = LLMGraphTransformer(
                 llm=self.llm,
-                allowed_nodes=self._get_universal_node_types(),
-                allowed_relationships=self._get_universal_relationships()
+                allowed_nodes=self.allowed_nodes,
+                allowed_relationships=self.allowed_relationships
             )
             
-            logger.info(f"AI Graph Builder initialized with {os.getenv('MODEL')}")
+            logger.info("AI Graph Builder initialized with %s", os.getenv('MODEL'))
             
         except ImportError as e:
-            logger.error(f"LangChain dependencies not available: {e}")
+            logger.error("LangChain dependencies not available: %s", e)
             raise RuntimeError("AI Graph Builder requires LangChain. Install with: pip install langchain langchain-experimental langchain-openai langchain-neo4j")
         except Exception as e:
-            logger.error(f"Failed to initialize AI Graph Builder: {e}")
+            logger.error("Failed to initialize AI Graph Builder: %s", e)
             raise RuntimeError(f"AI Graph Builder initialization failed: {e}")
     
     def _get_universal_node_types(self) -> List[str]:
@@ -197,48 +283,135 @@ class AIGraphBuilder(GraphBuilder):
             return False
         
         try:
-            # Build comprehensive context for AI analysis
-            context_text = self._build_analysis_context(system_id, processed_data)
-            
-            if not context_text.strip():
-                logger.warning(f"No content available for {system_id}")
+            document = self._build_document(system_id, processed_data)
+            if document is None:
                 return False
             
-            # Create LangChain document for processing
-            from langchain_core.documents import Document
-            document = Document(
-                page_content=context_text,
-                metadata={
-                    "source_id": system_id,
-                    "timestamp": "2024-01-01T00:00:00Z",  # Will be dynamic in production
-                    "builder_type": "ai_powered",
-                    "domain": "universal"
-                }
-            )
-            
-            logger.info(f"Creating knowledge graph for {system_id} ({len(context_text)} chars)")
-            
             # AI-powered graph creation
             graph_documents = self.graph_transformer.convert_to_graph_documents([document])
             
             if not graph_documents:
-                logger.warning(f"No graph structure extracted from {system_id}")
+                logger.warning("No graph structure extracted from %s", system_id)
                 return False
             
             # Log what was extracted
             graph_doc = graph_documents[0]
-            logger.info(f"AI extracted {len(graph_doc.nodes)} entities, {len(graph_doc.relationships)} relationships")
+            logger.info("AI extracted %d entities, %d relationships", len(graph_doc.nodes), len(graph_doc.relationships))
             
             # Store in Neo4j
-            self.neo4j_graph.add_graph_documents(graph_documents)
+            self._write_graph_documents(graph_documents)
             
-            logger.info(f"Knowledge graph created successfully for {system_id}")
+            logger.info("Knowledge graph created successfully for %s", system_id)
             return True
             
         except Exception as e:
-            logger.error(f"Knowledge graph creation failed for {system_id}: {e}")
+            logger.error("Knowledge graph creation failed for %s: %s", system_id, e)
             return False
     
+    def create_knowledge_graphs_batch(self, items: List[Tuple[str, Dict[str, Any]]]) -> Dict[str, bool]:
+        """
+        Create knowledge graphs for several data sources in one LLM dispatch
+        
+        All extraction requests are issued concurrently and the resulting
+        graph documents are written to Neo4j in a single call. From inside a
+        running event loop (Jupyter, async callers) asyncio.run() is unavailable,
+        so the sources are processed one at a time instead; await
+        acreate_knowledge_graphs_batch there to keep the concurrent dispatch.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.acreate_knowledge_graphs_batch(items))
+
+        logger.debug("Event loop already running - creating %d knowledge graphs sequentially", len(items))
+        return {system_id: self.create_knowledge_graph(system_id, processed_data) for system_id, processed_data in items}
+    
+    async def acreate_knowledge_graph(self, system_id: str, processed_data: Dict[str, Any]) -> bool:
+        """Async variant of create_knowledge_graph using the transformer's async path"""
+        results = await self.acreate_knowledge_graphs_batch([(system_id, processed_data)])
+        return results[system_id]
+    
+    async def acreate_knowledge_graphs_batch(self, items: List[Tuple[str, Dict[str, Any]]]) -> Dict[str, bool]:
+        """
+        Async variant of create_knowledge_graphs_batch
+        
+        Each document is extracted on its own, so a failed extraction marks only its
+        source False; the graph documents that were extracted are still stored.
+        """
+        results = {system_id: False for system_id, _ in items}
+        
+        if not self.graph_transformer or not self.neo4j_graph:
+            logger.error("AI Graph Builder not properly initialized")
+            return results
+        
+        try:
+            documents = [(system_id, self._build_document(system_id, processed_data)) for system_id, processed_data in items]
+            documents = [(system_id, document) for system_id, document in documents if document is not None]
+            if not documents:
+                return results
+            
+            # Concurrent AI-powered graph creation for the whole batch, one result per document
+            extracted = await asyncio.gather(
+                *(self.graph_transformer.aconvert_to_graph_documents([document]) for _, document in documents),
+                return_exceptions=True
+            )
+            
+            graph_documents = []
+            for (system_id, _), outcome in zip(documents, extracted):
+                if isinstance(outcome, Exception):
+                    logger.error("Knowledge graph creation failed for %s: %s", system_id, outcome)
+                elif not outcome:
+                    logger.warning("No graph structure extracted from %s", system_id)
+                else:
+                    graph_documents.extend(outcome)
+            
+            if not graph_documents:
+                return results
+            
+            # Store the whole batch in Neo4j; the driver call blocks, so keep it off the event loop
+            await asyncio.to_thread(self._write_graph_documents, graph_documents)
+            
+            for graph_doc in graph_documents:
+                system_id = graph_doc.source.metadata["source_id"]
+                logger.info("AI extracted %d entities, %d relationships for %s",
+                            len(graph_doc.nodes), len(graph_doc.relationships), system_id)
+                results[system_id] = True
+            
+            logger.info("Knowledge graphs created for %d/%d sources", sum(results.values()), len(results))
+            
+        except Exception as e:
+            logger.error("Batch knowledge graph creation failed: %s", e)
+        
+        return results
+    
+    def _write_graph_documents(self, graph_documents):
+        """Store graph documents in Neo4j, serialized across builders (see _GRAPH_WRITE_LOCK)"""
+        with _GRAPH_WRITE_LOCK:
+            self.neo4j_graph.add_graph_documents(graph_documents)
+    
+    def _build_document(self, system_id: str, processed_data: Dict[str, Any]):
+        """Build the LangChain document for one data source (None if there is no content)"""
+        # Build comprehensive context for AI analysis
+        context_text = self._build_analysis_context(system_id, processed_data)
+        
+        if not context_text.strip():
+            logger.warning("No content available for %s", system_id)
+            return None
+        
+        # Create LangChain document for processing
+        document = self.document_cls(
+            page_content=context_text,
+            metadata={
+                "source_id": system_id,
+                "timestamp": "2024-01-01T00:00:00Z",  # Will be dynamic in production
+                "builder_type": "ai_powered",
+                "domain": "universal"
+            }
+        )
+        
+        logger.info("Creating knowledge graph for %s (%d chars)", system_id, len(context_text))
+        return document
+    
     def _build_analysis_context(self, system_id: str, processed_data: Dict[str, Any]) -> str:
         """Build comprehensive context for AI analysis"""
         context_parts = [f"SYSTEM ANALYSIS: {system_id}"]
@@ -279,12 +452,10 @@ Extract entities that represent real infrastructure, applications, and operation
     
     def close(self):
         """Clean up AI graph builder resources"""
+        # The Neo4j connection is shared; close_neo4j_graphs() closes it at exit
         if self.neo4j_graph:
-            try:
-                self.neo4j_graph.close()
-                logger.info("AI Graph Builder connection closed")
-            except:
-                pass
+            self.neo4j_graph = None
+            logger.info("AI Graph Builder connection released")
 
 class RuleBasedGraphBuilder(GraphBuilder):
     """
@@ -308,7 +479,7 @@ class RuleBasedGraphBuilder(GraphBuilder):
         """Create graph using predefined rules and patterns"""
         # Implementation would extract entities using regex patterns,
         # configuration templates, etc.
-        logger.info(f"Creating rule-based knowledge graph for {system_id}")
+        logger.info("Creating rule-based knowledge graph for %s", system_id)
         return True
     
     def get_supported_domains(self) -> List[str]:
@@ -341,7 +512,9 @@ def create_graph_builder(builder_type: str, **config) -> GraphBuilder:
     if builder_type.lower() == 'ai':
         return AIGraphBuilder(
             llm_config=config['llm_config'],
-            neo4j_config=config['neo4j_config']
+            neo4j_config=config['neo4j_config'],
+            allowed_nodes=config.get('allowed_nodes'),
+            allowed_relationships=config.get('allowed_relationships')
         )
     elif builder_type.lower() == 'rules':
         return RuleBasedGraphBuilder(
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Shared Neo4j Drivers for Universal DataLoader
+One connection pool per connection setting, used by the graph loader and the graph builders
+"""
+
+import atexit
+import threading
+from typing import Dict, Any, Tuple
+
+try:
+    from neo4j import GraphDatabase
+    NEO4J_AVAILABLE = True
+except ImportError:
+    NEO4J_AVAILABLE = False
+
+# Shared Neo4j drivers (each owns a connection pool), keyed by uri, auth and driver options
+_DRIVER_CACHE: Dict[tuple, Any] = {}
+_DRIVER_CACHE_LOCK = threading.Lock()
+
+def driver_options(neo4j_config: Dict[str, Any]) -> Dict[str, Any]:
+    """Connection pool settings for get_driver from neo4j_config['management'] (the one place pool defaults live)"""
+    management = neo4j_config.get('management', {})
+    return {
+        'max_connection_pool_size': int(management.get('max_connections', 50)),
+        'connection_acquisition_timeout': float(management.get('connection_acquisition_timeout', 60.0)),
+        'connection_timeout': float(management.get('connection_timeout', 15.0)),
+        'max_connection_lifetime': float(management.get('max_connection_lifetime', 3600)),
+        'keep_alive': bool(management.get('keep_alive', True))
+    }
+
+def get_driver(uri: str, auth: Tuple[str, str], **kwargs):
+    """
+    Get the process-wide Neo4j driver for a connection, creating it on first use
+
+    Options not passed default to driver_options({}), so every caller with the same
+    settings gets the same cache key and pool. Drivers are closed by close_all_drivers(),
+    which runs at interpreter exit
+    """
+    options = driver_options({})
+    options.update(kwargs)
+    key = (uri, tuple(auth), tuple(sorted(options.items())))
+    with _DRIVER_CACHE_LOCK:
+        driver = _DRIVER_CACHE.get(key)
+        if driver is None:
+            driver = GraphDatabase.driver(uri, auth=auth, **options)
+            _DRIVER_CACHE[key] = driver
+        return driver
+
+def close_all_drivers():
+    """Close every cached Neo4j driver"""
+    with _DRIVER_CACHE_LOCK:
+        drivers = list(_DRIVER_CACHE.values())
+        _DRIVER_CACHE.clear()
+    for driver in drivers:
+        try:
+            driver.close()
+        except Exception:
+            pass
+
+atexit.register(close_all_drivers)
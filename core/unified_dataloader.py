@@ -6,23 +6,31 @@ Configurable, domain-agnostic data loading with LangChain LLMGraphTransformer
 
 import os
 import re
-import glob
+import asyncio
 import logging
+import fnmatch
+import mmap
+import time
+import threading
+import importlib.util
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, AsyncIterator
 from datetime import datetime
 from abc import ABC, abstractmethod
+from collections import deque
+from operator import attrgetter
+from concurrent.futures import ThreadPoolExecutor
 
 # Use configuration pattern
 from config.config_loader import get_config_loader
-from core.data_models import SystemEntity, EventEntity
+from core.data_models import SystemEntity, EventEntity, SystemBatch
+# Shared driver pool (re-exported: callers import get_driver/driver_options from here)
+from core.neo4j_driver import NEO4J_AVAILABLE, get_driver, driver_options, close_all_drivers
 
 # Import optional dependencies with fallbacks
-try:
-    from unstructured.partition.auto import partition
-    UNSTRUCTURED_AVAILABLE = True
-except ImportError:
-    UNSTRUCTURED_AVAILABLE = False
+# unstructured and instructor are not used at import time; probe for them without importing
+UNSTRUCTURED_AVAILABLE = importlib.util.find_spec('unstructured') is not None
+INSTRUCTOR_AVAILABLE = all(importlib.util.find_spec(name) is not None for name in ('instructor', 'openai'))
 
 try:
     from langchain.text_splitter import RecursiveCharacterTextSplitter
@@ -37,11 +45,10 @@ except ImportError:
     PYGROK_AVAILABLE = False
 
 try:
-    import instructor
-    from openai import OpenAI
-    INSTRUCTOR_AVAILABLE = True
+    import re2
+    RE2_AVAILABLE = True
 except ImportError:
-    INSTRUCTOR_AVAILABLE = False
+    RE2_AVAILABLE = False
 
 try:
     from core.graph_builders import GraphBuilder, create_graph_builder
@@ -58,14 +65,131 @@ try:
 except ImportError:
     LANGCHAIN_AVAILABLE = False
 
-try:
-    from neo4j import GraphDatabase
-    NEO4J_AVAILABLE = True
-except ImportError:
-    NEO4J_AVAILABLE = False
-
 logger = logging.getLogger(__name__)
 
+# (uri, database) -> database to use, from _ensure_database_exists ('neo4j' after a Community fallback)
+_ENSURED_DBS: Dict[Tuple[str, str], str] = {}
+_ENSURED_DBS_LOCK = threading.Lock()
+
+# Constraints/indexes created by Neo4jGraphLoader; the unique constraints back every MERGE
+_SCHEMA_STATEMENTS = (
+    # System constraints and indexes
+    "CREATE CONSTRAINT system_id_unique IF NOT EXISTS FOR (s:System) REQUIRE s.system_id IS UNIQUE",
+    "CREATE INDEX system_hostname_idx IF NOT EXISTS FOR (s:System) ON (s.hostname)",
+    "CREATE INDEX system_environment_idx IF NOT EXISTS FOR (s:System) ON (s.environment)",
+    # Event constraints and indexes
+    "CREATE CONSTRAINT event_id_unique IF NOT EXISTS FOR (e:Event) REQUIRE e.event_id IS UNIQUE",
+    "CREATE INDEX event_timestamp_idx IF NOT EXISTS FOR (e:Event) ON (e.timestamp)",
+    "CREATE INDEX event_severity_idx IF NOT EXISTS FOR (e:Event) ON (e.severity)",
+)
+
+# (uri, database) pairs whose schema has been created in this process
+_SCHEMA_READY: set = set()
+_SCHEMA_READY_LOCK = threading.Lock()
+
+# uri -> (monotonic timestamp, database names) from SHOW DATABASES
+_DATABASES_CACHE: Dict[str, Tuple[float, List[str]]] = {}
+_DATABASES_CACHE_LOCK = threading.Lock()
+
+# Scalar EventEntity fields written to Neo4j (timestamp is serialized separately)
+_EVENT_FIELDS = ('event_id', 'system_id', 'event_type', 'severity', 'status', 'title', 'description', 'source')
+_get_event_fields = attrgetter(*_EVENT_FIELDS)
+
+# Files at least this large are decoded straight from a read-only mapping
+_MMAP_THRESHOLD = 1024 * 1024
+
+# Default rows per UNWIND statement (one transaction each); management.write_batch_size overrides
+_WRITE_BATCH_SIZE = 10000
+
+def _compile_pattern(pattern: str):
+    """Compile with RE2 (linear-time matching) when available, else with re (also for syntax RE2 rejects)"""
+    if RE2_AVAILABLE:
+        try:
+            return re2.compile(pattern)
+        except Exception:
+            pass
+    return re.compile(pattern)
+
+# Text cleaning / parsing patterns, compiled once at import
+_ANSI_CODE_RE = _compile_pattern(r'\x1b\[[0-9;]*m')
+_WHITESPACE_RE = _compile_pattern(r'\s+')
+_DEBUG_LINE_RE = _compile_pattern(r'(?m)^.*\[DEBUG\].*$')
+_RELEASE_VERSION_RE = _compile_pattern(r'release (\d+\.\d+)')
+_RELEASE_CODENAME_RE = _compile_pattern(r'\(([^)]+)\)')
+
+# Grok pattern string -> compiled pygrok.Grok, shared across TextProcessor instances
+_GROK_CACHE: Dict[str, Any] = {}
+
+# Constant, parameterized queries: identical text on every call keeps Neo4j's plan cache warm
+_PREPARED = {
+    'systems': """
+        UNWIND $rows AS row
+        MERGE (s:System {system_id: row.system_id})
+        SET s.hostname = row.hostname,
+            s.rhel_version = row.rhel_version,
+            s.environment = row.environment,
+            s.package_count = row.package_count,
+            s.updated_at = datetime()
+        WITH s, row
+        UNWIND row.services AS service_name
+        MERGE (svc:Service {name: service_name})
+        MERGE (s)-[:RUNS]->(svc)
+    """,
+    'events': """
+        UNWIND $rows AS row
+        MERGE (e:Event {event_id: row.event_id})
+        SET e.system_id = row.system_id,
+            e.event_type = row.event_type,
+            e.timestamp = datetime(row.timestamp),
+            e.severity = row.severity,
+            e.status = row.status,
+            e.title = row.title,
+            e.description = row.description,
+            e.source = row.source,
+            e.updated_at = datetime()
+    """,
+    'has_event': """
+        UNWIND $rows AS row
+        MATCH (s:System {system_id: row.system_id}), (e:Event {event_id: row.event_id})
+        MERGE (s)-[:HAS_EVENT]->(e)
+    """,
+    # Independent subqueries; total and label-qualified counts are all answered from the count store
+    'graph_stats': """
+        CALL { MATCH (n) RETURN count(n) AS nodes }
+        CALL { MATCH ()-[r]->() RETURN count(r) AS relationships }
+        CALL { MATCH (s:System) RETURN count(s) AS systems }
+        CALL { MATCH (e:Event) RETURN count(e) AS events }
+        RETURN nodes, relationships, systems, events
+    """,
+    'verify_systems': """
+        UNWIND $ids AS id
+        OPTIONAL MATCH (s:System {system_id: id})
+        RETURN id, count(s) AS count
+    """,
+    # Deletes in bounded batches, each its own transaction (Neo4j 4.4+; needs an auto-commit session.run)
+    'clear_graph': """
+        MATCH (n)
+        CALL { WITH n DETACH DELETE n } IN TRANSACTIONS OF $batch ROWS
+    """
+}
+
+def _is_syntax_error(error: Exception) -> bool:
+    """True for a server rejecting the query text (neo4j.exceptions.CypherSyntaxError carries this code)"""
+    return getattr(error, 'code', None) == 'Neo.ClientError.Statement.SyntaxError'
+
+def _run_statement(tx, query: str):
+    """Managed-transaction run of one parameterless statement"""
+    tx.run(query).consume()
+
+def _run_write(tx, query: str, rows: List[Dict[str, Any]]):
+    """Managed-transaction write of one row batch"""
+    tx.run(query, rows=rows).consume()
+
+def _batches(rows: List[Dict[str, Any]], size: int):
+    """Yield consecutive slices of at most `size` rows"""
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
 class DataSourceAdapter(ABC):
     """Abstract adapter for different data source types"""
     
@@ -78,18 +202,43 @@ class DataSourceAdapter(ABC):
     def list_available_systems(self) -> List[str]:
         """List all available systems"""
         pass
+    
+    def has_any_system(self) -> bool:
+        """Check whether at least one system is available"""
+        return bool(self.list_available_systems())
+    
+    def refresh_systems(self):
+        """Drop any cached system listing (adapters without a cache have nothing to do)"""
+        pass
+    
+    def scan_all_systems(self) -> SystemBatch:
+        """List all systems in one pass (adapters without a cheaper scan list systems only)"""
+        system_ids = self.list_available_systems()
+        return SystemBatch(base_path='', system_ids=system_ids,
+                           file_paths=[[] for _ in system_ids])
+    
+    def read_system_files_from_batch(self, batch: SystemBatch, idx: int) -> Dict[str, str]:
+        """Read raw files for the system at position idx of a scan_all_systems() batch"""
+        return self.read_system_files(batch.system_ids[idx])
 
 class FilesystemDataSourceAdapter(DataSourceAdapter):
     """Adapter for filesystem-based data sources (your current simulated_rhel_systems)"""
     
-    def __init__(self, base_path: str, file_patterns: Dict[str, List[str]]):
+    def __init__(self, base_path: str, file_patterns: Dict[str, List[str]], list_ttl: float = 60.0):
         self.base_path = Path(base_path)
         self.file_patterns = file_patterns
+        self.list_ttl = list_ttl
+        self._systems_cache: Optional[Tuple[float, List[str]]] = None
+        # Parent directories the patterns name (as path parts); only these are ever listed
+        self._pattern_dirs = sorted({
+            tuple(pattern.strip('/').split('/')[:-1])
+            for patterns in file_patterns.values() for pattern in patterns
+        })
         
         if not self.base_path.exists():
             raise FileNotFoundError(f"Data source path not found: {self.base_path}")
         
-        logger.info(f"📁 Filesystem adapter initialized: {self.base_path}")
+        logger.info("📁 Filesystem adapter initialized: %s", self.base_path)
     
     def read_system_files(self, system_id: str) -> Dict[str, str]:
         """Read all files for a system according to configured patterns"""
@@ -97,48 +246,149 @@ class FilesystemDataSourceAdapter(DataSourceAdapter):
         if not system_path.exists():
             raise FileNotFoundError(f"System not found: {system_id}")
         
-        files = {}
+        # One listing per pattern directory, then set/pattern matching instead of a stat or glob per pattern
+        file_paths = self._list_files(str(system_path))
+        return self._read_matching(system_id, file_paths)
+    
+    def list_available_systems(self) -> List[str]:
+        """List all available system directories (cached for list_ttl seconds)"""
+        cached = self._systems_cache
+        if cached and time.monotonic() - cached[0] < self.list_ttl:
+            return list(cached[1])
         
+        try:
+            # scandir entries carry the file type, so is_dir() needs no extra stat
+            with os.scandir(self.base_path) as entries:
+                systems = [entry.name for entry in entries if entry.is_dir()]
+            logger.debug("📋 Found %d systems: %s", len(systems), systems)
+            self._systems_cache = (time.monotonic(), systems)
+            return list(systems)
+        except Exception as e:
+            logger.error(" Failed to list systems: %s", e)
+            return []
+    
+    def refresh_systems(self):
+        """Forget the cached listing so the next call rescans the data source"""
+        self._systems_cache = None
+    
+    def has_any_system(self) -> bool:
+        """Check for a system directory, stopping at the first one found"""
+        try:
+            with os.scandir(self.base_path) as entries:
+                return any(entry.is_dir() for entry in entries)
+        except OSError as e:
+            logger.error(" Failed to probe systems: %s", e)
+            return False
+    
+    def scan_all_systems(self) -> SystemBatch:
+        """List every system's candidate files (those in pattern directories) in one pass"""
+        batch = SystemBatch(base_path=str(self.base_path))
+        try:
+            with os.scandir(self.base_path) as entries:
+                system_dirs = [entry for entry in entries if entry.is_dir()]
+        except OSError as e:
+            logger.error(" Failed to scan systems: %s", e)
+            return batch
+        
+        for system_dir in system_dirs:
+            batch.system_ids.append(system_dir.name)
+            batch.file_paths.append(self._list_files(system_dir.path))
+        
+        # The scan just listed every system; let list_available_systems reuse it
+        self._systems_cache = (time.monotonic(), list(batch.system_ids))
+        logger.debug("📋 Scanned %d systems in %s", len(batch), self.base_path)
+        return batch
+    
+    def read_system_files_from_batch(self, batch: SystemBatch, idx: int) -> Dict[str, str]:
+        """Read files for one scanned system, matching patterns against the listing instead of re-globbing"""
+        return self._read_matching(batch.system_ids[idx], batch.file_paths[idx])
+    
+    def _list_files(self, system_dir: str) -> List[str]:
+        """
+        List the files ('/'-separated relative paths) in the directories the patterns name,
+        with one scandir per directory (file types need no stat)
+
+        Subtrees no pattern reaches are never entered, so the listing holds only candidates
+        """
+        file_paths = []
+        for rel_dir in self._expand_pattern_dirs(system_dir):
+            prefix = f"{rel_dir}/" if rel_dir else ''
+            try:
+                with os.scandir(os.path.join(system_dir, rel_dir)) as entries:
+                    file_paths.extend(prefix + entry.name for entry in entries if entry.is_file())
+            except FileNotFoundError:
+                # Nothing to match in a directory this system doesn't have
+                continue
+            except OSError as e:
+                logger.warning("⚠️ Failed to list %s: %s", os.path.join(system_dir, rel_dir), e)
+        return file_paths
+    
+    def _expand_pattern_dirs(self, system_dir: str) -> List[str]:
+        """Resolve the pattern directories (wildcard parts included) to existing relative paths"""
+        rel_dirs = []
+        for dir_parts in self._pattern_dirs:
+            candidates = ['']
+            for part in dir_parts:
+                if not any(char in part for char in '*?['):
+                    candidates = [f"{rel_dir}/{part}" if rel_dir else part for rel_dir in candidates]
+                    continue
+                expanded = []
+                for rel_dir in candidates:
+                    try:
+                        with os.scandir(os.path.join(system_dir, rel_dir)) as entries:
+                            expanded.extend(f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                                            for entry in entries
+                                            if entry.is_dir() and self._matches([entry.name], [part]))
+                    except OSError:
+                        continue
+                candidates = expanded
+            rel_dirs.extend(candidates)
+        # Overlapping wildcard and literal directories are listed once
+        return list(dict.fromkeys(rel_dirs))
+    
+    def _read_matching(self, system_id: str, file_paths: List[str]) -> Dict[str, str]:
+        """Read the listed files that match the configured patterns"""
+        system_path = self.base_path / system_id
+        listing = [(rel_path, rel_path.split('/')) for rel_path in file_paths]
+        present = set(file_paths)
+        
+        files = {}
         # Read files according to configured patterns
         for pattern_type, patterns in self.file_patterns.items():
             for pattern in patterns:
-                matching_files = self._find_files(system_path, pattern)
-                for file_path in matching_files:
+                if not any(char in pattern for char in '*?['):
+                    # Direct file path: set membership instead of a stat
+                    matches = [pattern] if pattern in present else []
+                else:
+                    pattern_parts = pattern.strip('/').split('/')
+                    matches = [rel_path for rel_path, rel_parts in listing if self._matches(rel_parts, pattern_parts)]
+                for rel_path in matches:
                     try:
-                        content = file_path.read_text(encoding='utf-8', errors='ignore')
-                        relative_path = file_path.relative_to(system_path)
-                        files[str(relative_path)] = content
+                        files[rel_path] = self._read_text(system_path / rel_path)
                     except Exception as e:
-                        logger.warning(f"⚠️ Failed to read {file_path}: {e}")
-                        files[str(file_path.relative_to(system_path))] = f"Error: {e}"
+                        logger.warning("⚠️ Failed to read %s: %s", system_path / rel_path, e)
+                        files[rel_path] = f"Error: {e}"
         
-        logger.debug(f"📄 Read {len(files)} files from {system_id}")
+        logger.debug("📄 Read %d files from %s", len(files), system_id)
         return files
     
-    def list_available_systems(self) -> List[str]:
-        """List all available system directories"""
-        try:
-            systems = [d.name for d in self.base_path.iterdir() if d.is_dir()]
-            logger.debug(f"📋 Found {len(systems)} systems: {systems}")
-            return systems
-        except Exception as e:
-            logger.error(f" Failed to list systems: {e}")
-            return []
+    @staticmethod
+    def _read_text(file_path: Path) -> str:
+        """Read a file as UTF-8; large files are decoded straight from an mmap (line endings kept as-is)"""
+        if file_path.stat().st_size < _MMAP_THRESHOLD:
+            return file_path.read_text(encoding='utf-8', errors='ignore')
+        with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # str() decodes from the buffer directly, skipping the bytes copy f.read() would make
+            return str(mm, 'utf-8', errors='ignore')
     
-    def _find_files(self, base_path: Path, pattern: str) -> List[Path]:
-        """Find files matching a pattern"""
-        try:
-            if '*' in pattern:
-                # Use glob for patterns with wildcards
-                full_pattern = str(base_path / pattern)
-                return [Path(p) for p in glob.glob(full_pattern)]
-            else:
-                # Direct file path
-                file_path = base_path / pattern
-                return [file_path] if file_path.exists() else []
-        except Exception as e:
-            logger.warning(f"⚠️ Pattern matching failed for {pattern}: {e}")
-            return []
+    @staticmethod
+    def _matches(rel_parts: List[str], pattern_parts: List[str]) -> bool:
+        """Glob-style match: wildcards never cross a path separator or match hidden names"""
+        return len(rel_parts) == len(pattern_parts) and all(
+            fnmatch.fnmatchcase(part, pattern_part)
+            and not (part.startswith('.') and not pattern_part.startswith('.'))
+            for part, pattern_part in zip(rel_parts, pattern_parts)
+        )
 
 class TextProcessor:
     """Configurable text processor using open source tools"""
@@ -163,11 +413,13 @@ class TextProcessor:
         if PYGROK_AVAILABLE and 'log_patterns' in self.parsing_config:
             for pattern_name, pattern in self.parsing_config['log_patterns'].items():
                 try:
-                    self.grok_patterns[pattern_name] = pygrok.Grok(pattern)
+                    if pattern not in _GROK_CACHE:
+                        _GROK_CACHE[pattern] = pygrok.Grok(pattern)
+                    self.grok_patterns[pattern_name] = _GROK_CACHE[pattern]
                 except Exception as e:
-                    logger.warning(f"⚠️ Failed to compile grok pattern {pattern_name}: {e}")
+                    logger.warning("⚠️ Failed to compile grok pattern %s: %s", pattern_name, e)
         
-        logger.info(f"⚙️ Text processor initialized with {len(self.grok_patterns)} patterns")
+        logger.info("⚙️ Text processor initialized with %d patterns", len(self.grok_patterns))
     
     def process_files(self, raw_files: Dict[str, str]) -> Dict[str, Any]:
         """Process raw files into structured, clean text"""
@@ -201,13 +453,13 @@ class TextProcessor:
                 }
                 
             except Exception as e:
-                logger.error(f" Failed to process {file_path}: {e}")
+                logger.error(" Failed to process %s: %s", file_path, e)
                 processed[file_path] = {
                     'error': str(e),
                     'raw_content': content[:1000]  # First 1000 chars for debugging
                 }
         
-        logger.info(f"⚙️ Processed {len(processed)} files")
+        logger.info("⚙️ Processed %d files", len(processed))
         return processed
     
     def _clean_text(self, text: str) -> str:
@@ -216,15 +468,15 @@ class TextProcessor:
         
         if self.cleaning_config.get('remove_ansi_codes', True):
             # Remove ANSI color codes
-            cleaned = re.sub(r'\x1b\[[0-9;]*m', '', cleaned)
+            cleaned = _ANSI_CODE_RE.sub('', cleaned)
         
         if self.cleaning_config.get('normalize_whitespace', True):
             # Normalize whitespace
-            cleaned = re.sub(r'\s+', ' ', cleaned)
+            cleaned = _WHITESPACE_RE.sub(' ', cleaned)
         
         if self.cleaning_config.get('remove_debug_logs', True):
             # Remove debug log lines
-            cleaned = re.sub(r'^.*\[DEBUG\].*$', '', cleaned, flags=re.MULTILINE)
+            cleaned = _DEBUG_LINE_RE.sub('', cleaned)
         
         return cleaned.strip()
     
@@ -263,6 +515,11 @@ class TextProcessor:
     def _parse_log_file(self, content: str) -> Dict[str, Any]:
         """Parse log files using grok patterns"""
         events = []
+        # str.count scans in C; equals len(content.split('\n')) without building the list
+        total_lines = content.count('\n') + 1
+        
+        if not self.grok_patterns:
+            return {'parsed_events': events, 'total_events': 0, 'total_lines': total_lines}
         
         for line in content.split('\n'):
             if not line.strip():
@@ -285,7 +542,7 @@ class TextProcessor:
         return {
             'parsed_events': events,
             'total_events': len(events),
-            'total_lines': len(content.split('\n'))
+            'total_lines': total_lines
         }
     
     def _parse_config_file(self, content: str) -> Dict[str, Any]:
@@ -322,8 +579,8 @@ class TextProcessor:
     
     def _parse_release_info(self, content: str) -> Dict[str, Any]:
         """Parse Red Hat release information"""
-        version_match = re.search(r'release (\d+\.\d+)', content)
-        codename_match = re.search(r'\(([^)]+)\)', content)
+        version_match = _RELEASE_VERSION_RE.search(content)
+        codename_match = _RELEASE_CODENAME_RE.search(content)
         
         return {
             'full_release': content.strip(),
@@ -376,7 +633,8 @@ class LangChainAIExtractor:
                 username=neo4j_config['username'],
                 password=neo4j_config['password'],
                 database=neo4j_config['database'],
-                refresh_schema=False
+                refresh_schema=False,
+                driver_config=driver_options(neo4j_config)
             )
             
             # Initialize LLM Graph Transformer with generic, flexible schema
@@ -387,10 +645,10 @@ class LangChainAIExtractor:
                 node_properties=self._get_generic_node_properties()
             )
             
-            logger.info(f"🧠 LangChain AI extractor initialized with {llm_config['model']}")
+            logger.info("🧠 LangChain AI extractor initialized with %s", llm_config['model'])
             
         except Exception as e:
-            logger.error(f" Failed to initialize LangChain AI extractor: {e}")
+            logger.error(" Failed to initialize LangChain AI extractor: %s", e)
             self.llm = None
             self.graph_transformer = None
     
@@ -479,7 +737,7 @@ class LangChainAIExtractor:
             context_text = self._build_extraction_context(system_id, processed_data)
             
             if not context_text.strip():
-                logger.warning(f"⚠️ No content to extract for {system_id}")
+                logger.warning("⚠️ No content to extract for %s", system_id)
                 return False
             
             # Create LangChain document
@@ -492,27 +750,27 @@ class LangChainAIExtractor:
                 }
             )
             
-            logger.info(f"🔍 Extracting entities from {system_id} ({len(context_text)} chars)")
+            logger.info("🔍 Extracting entities from %s (%d chars)", system_id, len(context_text))
             
             # Convert to graph documents using LLM
             graph_documents = self.graph_transformer.convert_to_graph_documents([document])
             
             if not graph_documents:
-                logger.warning(f"⚠️ No graph documents extracted from {system_id}")
+                logger.warning("⚠️ No graph documents extracted from %s", system_id)
                 return False
             
             # Log extraction results
             graph_doc = graph_documents[0]
-            logger.info(f" Extracted {len(graph_doc.nodes)} nodes, {len(graph_doc.relationships)} relationships")
+            logger.info(" Extracted %d nodes, %d relationships", len(graph_doc.nodes), len(graph_doc.relationships))
             
             # Load directly to Neo4j - following LangChain example exactly
             self.neo4j_graph.add_graph_documents(graph_documents)
             
-            logger.info(f"🗄️ Loaded graph data for {system_id} to Neo4j")
+            logger.info("🗄️ Loaded graph data for %s to Neo4j", system_id)
             return True
             
         except Exception as e:
-            logger.error(f" AI extraction failed for {system_id}: {e}")
+            logger.error(" AI extraction failed for %s: %s", system_id, e)
             return False
     
     def _build_extraction_context(self, system_id: str, processed_data: Dict[str, Any]) -> str:
@@ -576,29 +834,29 @@ class Neo4jGraphLoader:
         self.neo4j_config = neo4j_config
         self.driver = None
         self.database = neo4j_config.get('database', 'neo4j')
+        self.write_batch_size = max(1, int(neo4j_config.get('management', {}).get('write_batch_size', _WRITE_BATCH_SIZE)))
         
         if NEO4J_AVAILABLE:
             try:
-                self.driver = GraphDatabase.driver(
+                self.driver = get_driver(
                     neo4j_config['uri'],
-                    auth=(neo4j_config['username'], neo4j_config['password'])
+                    (neo4j_config['username'], neo4j_config['password']),
+                    **driver_options(neo4j_config)
                 )
                 
                 # Create database if it doesn't exist (and auto_create is enabled)
                 if self._should_auto_create_database():
                     self._ensure_database_exists()
                 
-                # Test connection to target database
+                # Test connection to target database, then initialize schema on the same session
                 with self.driver.session(database=self.database) as session:
-                    session.run("RETURN 1")
-                
-                logger.info(f"🗄️ Neo4j graph loader connected: {neo4j_config['uri']}/{self.database}")
-                
-                # Initialize schema
-                self._create_indexes_and_constraints()
+                    session.execute_read(lambda tx: tx.run("RETURN 1").consume())
+                    logger.info("🗄️ Neo4j graph loader connected: %s/%s", neo4j_config['uri'], self.database)
+                    
+                    self._create_indexes_and_constraints(session)
                 
             except Exception as e:
-                logger.error(f" Failed to connect to Neo4j: {e}")
+                logger.error(" Failed to connect to Neo4j: %s", e)
                 self.driver = None
         else:
             logger.warning("⚠️ Neo4j driver not available - graph loading disabled")
@@ -624,89 +882,97 @@ class Neo4jGraphLoader:
                 # Create relationships
                 relationships_created = self._create_relationships(session, systems, events)
                 
-                logger.info(f" Graph loading complete: {systems_loaded} systems, {events_loaded} events, {relationships_created} relationships")
-                return True
+                logger.info(" Graph loading complete: %d systems, %d events, %d relationships", systems_loaded, events_loaded, relationships_created)
                 
         except Exception as e:
-            logger.error(f" Graph loading failed: {e}")
+            logger.error(" Graph loading failed: %s", e)
             return False
+        
+        # Opt-in read-back (two extra round trips); it only logs and never changes the result
+        if self.neo4j_config.get('management', {}).get('verify_after_load', False):
+            self._report_load(systems)
+        return True
     
-    def _create_indexes_and_constraints(self):
-        """Create Neo4j indexes and constraints for performance"""
-        if not self.driver:
-            return
+    def _create_indexes_and_constraints(self, session):
+        """Create Neo4j indexes and constraints for performance (once per uri/database)"""
+        key = (self.neo4j_config['uri'], self.database)
+        with _SCHEMA_READY_LOCK:
+            if key in _SCHEMA_READY:
+                return
+        
+        def create_schema(tx):
+            for statement in _SCHEMA_STATEMENTS:
+                tx.run(statement).consume()
         
         try:
-            with self.driver.session(database=self.database) as session:
-                # System constraints and indexes
-                session.run("CREATE CONSTRAINT system_id_unique IF NOT EXISTS FOR (s:System) REQUIRE s.system_id IS UNIQUE")
-                session.run("CREATE INDEX system_hostname_idx IF NOT EXISTS FOR (s:System) ON (s.hostname)")
-                session.run("CREATE INDEX system_environment_idx IF NOT EXISTS FOR (s:System) ON (s.environment)")
-                
-                # Event constraints and indexes
-                session.run("CREATE CONSTRAINT event_id_unique IF NOT EXISTS FOR (e:Event) REQUIRE e.event_id IS UNIQUE")
-                session.run("CREATE INDEX event_timestamp_idx IF NOT EXISTS FOR (e:Event) ON (e.timestamp)")
-                session.run("CREATE INDEX event_severity_idx IF NOT EXISTS FOR (e:Event) ON (e.severity)")
-                
-                logger.debug("🗄️ Neo4j schema initialized")
-                
+            # All DDL in one transaction, before the first MERGE needs the constraints
+            session.execute_write(create_schema)
         except Exception as e:
-            logger.warning(f"⚠️ Failed to create indexes: {e}")
+            # One rejected statement (e.g. a constraint over duplicate ids) rolls back the rest;
+            # create them one at a time so every statement that can succeed does
+            logger.debug("Schema transaction failed (%s), creating statements one at a time", e)
+            created = 0
+            for statement in _SCHEMA_STATEMENTS:
+                try:
+                    session.execute_write(_run_statement, statement)
+                    created += 1
+                except Exception as statement_error:
+                    logger.warning("⚠️ Failed to create index: %s", statement_error)
+            if not created:
+                # Nothing went through (e.g. connection trouble); retry on the next construction
+                return
+        
+        # Cached even if a statement was rejected: it would fail the same way on every retry
+        with _SCHEMA_READY_LOCK:
+            _SCHEMA_READY.add(key)
+        logger.debug("🗄️ Neo4j schema initialized")
     
     def _clear_existing_data(self, session):
-        """Clear existing data from Neo4j"""
+        """Clear existing data from Neo4j (errors are logged and re-raised so nothing loads onto a half-cleared graph)"""
+        # Backup before clearing if configured
+        if self.neo4j_config.get('management', {}).get('backup_before_clear', True):
+            logger.info("💾 Creating backup before clearing data...")
+            # In a real implementation, you'd export data here
+            
+        logger.info("🧹 Clearing existing graph data...")
         try:
-            # Backup before clearing if configured
-            if self.neo4j_config.get('management', {}).get('backup_before_clear', True):
-                logger.info("💾 Creating backup before clearing data...")
-                # In a real implementation, you'd export data here
-                
-            logger.info("🧹 Clearing existing graph data...")
-            session.run("MATCH (n) DETACH DELETE n")
-            logger.info(" Graph data cleared")
+            try:
+                summary = session.run(_PREPARED['clear_graph'], batch=self.write_batch_size).consume()
+            except Exception as e:
+                if not _is_syntax_error(e):
+                    raise
+                # Servers before 4.4 reject CALL ... IN TRANSACTIONS; only then delete in one transaction
+                logger.debug("Batched delete unsupported (%s), clearing in one transaction", e)
+                summary = session.run("MATCH (n) DETACH DELETE n").consume()
+            logger.info(" Graph data cleared (%d nodes deleted)", summary.counters.nodes_deleted)
             
         except Exception as e:
-            logger.error(f" Failed to clear data: {e}")
+            logger.error(" Failed to clear data: %s", e)
+            raise
     
     def _load_systems(self, session, systems: List[SystemEntity]) -> int:
-        """Load system nodes into Neo4j"""
+        """Load system nodes (and their services) into Neo4j"""
         if not systems:
             return 0
         
+        rows = [{
+            'system_id': system.system_id,
+            'hostname': getattr(system, 'hostname', system.name),
+            'rhel_version': getattr(system, 'rhel_version', system.version),
+            'environment': system.environment,
+            'package_count': getattr(system, 'package_count', None),
+            'services': list(system.services)
+        } for system in systems]
+        
         loaded_count = 0
-        for system in systems:
+        for batch in _batches(rows, self.write_batch_size):
             try:
-                # Create system node
-                session.run("""
-                    MERGE (s:System {system_id: $system_id})
-                    SET s.hostname = $hostname,
-                        s.rhel_version = $rhel_version,
-                        s.environment = $environment,
-                        s.package_count = $package_count,
-                        s.updated_at = datetime()
-                """, {
-                    'system_id': system.system_id,
-                    'hostname': system.hostname,
-                    'rhel_version': system.rhel_version,
-                    'environment': system.environment,
-                    'package_count': system.package_count
-                })
-                
-                # Create service nodes and relationships
-                for service in system.services:
-                    session.run("""
-                        MERGE (s:System {system_id: $system_id})
-                        MERGE (svc:Service {name: $service_name})
-                        MERGE (s)-[:RUNS]->(svc)
-                    """, {
-                        'system_id': system.system_id,
-                        'service_name': service
-                    })
-                
-                loaded_count += 1
+                # Create system nodes, then service nodes and relationships
+                session.execute_write(_run_write, _PREPARED['systems'], batch)
+                loaded_count += len(batch)
                 
             except Exception as e:
-                logger.error(f" Failed to load system {system.system_id}: {e}")
+                logger.error(" Failed to load %d systems: %s", len(batch), e)
         
         return loaded_count
     
@@ -715,60 +981,93 @@ class Neo4jGraphLoader:
         if not events:
             return 0
         
+        rows = [
+            dict(zip(_EVENT_FIELDS, _get_event_fields(event)),
+                 timestamp=event.timestamp.isoformat() if event.timestamp else None)
+            for event in events
+        ]
+        
         loaded_count = 0
-        for event in events:
+        for batch in _batches(rows, self.write_batch_size):
             try:
-                session.run("""
-                    MERGE (e:Event {event_id: $event_id})
-                    SET e.system_id = $system_id,
-                        e.event_type = $event_type,
-                        e.timestamp = datetime($timestamp),
-                        e.severity = $severity,
-                        e.status = $status,
-                        e.title = $title,
-                        e.description = $description,
-                        e.source = $source,
-                        e.updated_at = datetime()
-                """, {
-                    'event_id': event.event_id,
-                    'system_id': event.system_id,
-                    'event_type': event.event_type,
-                    'timestamp': event.timestamp.isoformat() if event.timestamp else None,
-                    'severity': event.severity,
-                    'status': event.status,
-                    'title': event.title,
-                    'description': event.description,
-                    'source': event.source
-                })
-                
-                loaded_count += 1
+                session.execute_write(_run_write, _PREPARED['events'], batch)
+                loaded_count += len(batch)
                 
             except Exception as e:
-                logger.error(f" Failed to load event {event.event_id}: {e}")
+                logger.error(" Failed to load %d events: %s", len(batch), e)
         
         return loaded_count
     
     def _create_relationships(self, session, systems: List[SystemEntity], events: List[EventEntity]) -> int:
         """Create relationships between systems and events"""
+        if not events:
+            return 0
+        
+        rows = [{'system_id': event.system_id, 'event_id': event.event_id} for event in events]
+        
         relationships_created = 0
+        for batch in _batches(rows, self.write_batch_size):
+            try:
+                # Connect events to systems; both endpoints resolve via the unique constraints
+                session.execute_write(_run_write, _PREPARED['has_event'], batch)
+                relationships_created += len(batch)
+                
+            except Exception as e:
+                logger.error(" Failed to create relationships: %s", e)
         
+        return relationships_created
+    
+    def list_databases(self, ttl: float = 30.0) -> List[str]:
+        """List database names on the server, reusing a result younger than ttl seconds"""
+        if not self.driver:
+            return []
+        
+        key = self.neo4j_config['uri']
+        with _DATABASES_CACHE_LOCK:
+            cached = _DATABASES_CACHE.get(key)
+        if cached and time.monotonic() - cached[0] < ttl:
+            return list(cached[1])
+        
+        with self.driver.session(database="system") as session:
+            names = session.execute_read(lambda tx: tx.run("SHOW DATABASES YIELD name").value("name"))
+        with _DATABASES_CACHE_LOCK:
+            _DATABASES_CACHE[key] = (time.monotonic(), names)
+        return list(names)
+    
+    def _report_load(self, systems: List[SystemEntity]):
+        """Warn about loaded systems that don't read back, then log the graph totals (each check only logs)"""
         try:
-            # Connect events to systems
-            for event in events:
-                session.run("""
-                    MATCH (s:System {system_id: $system_id})
-                    MATCH (e:Event {event_id: $event_id})
-                    MERGE (s)-[:HAS_EVENT]->(e)
-                """, {
-                    'system_id': event.system_id,
-                    'event_id': event.event_id
-                })
-                relationships_created += 1
-                
+            counts = self.verify_systems([system.system_id for system in systems])
+            missing = sorted(system_id for system_id, count in counts.items() if not count)
+            if missing:
+                logger.warning("⚠️ %d systems missing after load: %s", len(missing), ', '.join(missing))
         except Exception as e:
-            logger.error(f" Failed to create relationships: {e}")
+            logger.warning("⚠️ Load verification failed: %s", e)
         
-        return relationships_created
+        try:
+            stats = self.get_graph_stats()
+            logger.info("📊 Graph totals: %d nodes, %d relationships (%d systems, %d events)",
+                        stats['nodes'], stats['relationships'], stats['systems'], stats['events'])
+        except Exception as e:
+            logger.warning("⚠️ Graph stats unavailable: %s", e)
+    
+    def verify_systems(self, system_ids: List[str]) -> Dict[str, int]:
+        """Count System nodes for many ids in one parameterized round trip"""
+        if not self.driver or not system_ids:
+            return {}
+        
+        with self.driver.session(database=self.database) as session:
+            records = session.execute_read(lambda tx: list(tx.run(_PREPARED['verify_systems'], ids=list(system_ids))))
+        return {record['id']: record['count'] for record in records}
+    
+    def get_graph_stats(self) -> Dict[str, int]:
+        """Count nodes, relationships, System and Event nodes in the target database with one query"""
+        if not self.driver:
+            return {'nodes': 0, 'relationships': 0, 'systems': 0, 'events': 0}
+        
+        with self.driver.session(database=self.database) as session:
+            record = session.execute_read(lambda tx: tx.run(_PREPARED['graph_stats']).single())
+        return dict(record)
     
     def _should_auto_create_database(self) -> bool:
         """Check if database should be auto-created"""
@@ -781,43 +1080,56 @@ class Neo4jGraphLoader:
         
         # For default databases, just verify they exist
         if self.database.lower() in ['neo4j', 'system']:
-            logger.info(f"🗄️ Using default database: {self.database}")
+            logger.info("🗄️ Using default database: %s", self.database)
+            return
+        
+        # Skip the SHOW DATABASES round-trip if this database was already ensured (or fell back)
+        key = (self.neo4j_config['uri'], self.database)
+        with _ENSURED_DBS_LOCK:
+            resolved = _ENSURED_DBS.get(key)
+        if resolved is not None:
+            logger.debug("🗄️ Database already ensured: %s -> %s", self.database, resolved)
+            self.database = resolved
+            self.neo4j_config['database'] = resolved
             return
         
         try:
-            # Connect to system database to check/create database
-            with self.driver.session(database="system") as session:
-                # Check if database exists
-                result = session.run(
-                    "SHOW DATABASES YIELD name WHERE name = $db_name",
-                    db_name=self.database
-                )
-                
-                if not result.single():
-                    # Database doesn't exist, try to create it
-                    logger.info(f"🏗️ Creating database: {self.database}")
-                    session.run(f"CREATE DATABASE `{self.database}`")
-                    logger.info(f" Database created: {self.database}")
-                else:
-                    logger.info(f"🗄️ Database already exists: {self.database}")
+            # Check if database exists
+            if self.database not in self.list_databases():
+                # Database doesn't exist, try to create it
+                logger.info("🏗️ Creating database: %s", self.database)
+                # Name passed as a parameter: no quoting, and a stale listing can't make it fail
+                with self.driver.session(database="system") as session:
+                    session.run("CREATE DATABASE $name IF NOT EXISTS", name=self.database).consume()
+                with _DATABASES_CACHE_LOCK:
+                    _DATABASES_CACHE.pop(self.neo4j_config['uri'], None)
+                logger.info(" Database created: %s", self.database)
+            else:
+                logger.info("🗄️ Database already exists: %s", self.database)
+            
+            with _ENSURED_DBS_LOCK:
+                _ENSURED_DBS[key] = self.database
                     
         except Exception as e:
             error_msg = str(e)
             if "UnsupportedAdministrationCommand" in error_msg:
-                logger.warning(f"⚠️ Neo4j Community Edition detected - cannot create custom databases")
-                logger.info(f"💡 Falling back to default database: neo4j")
+                logger.warning("⚠️ Neo4j Community Edition detected - cannot create custom databases")
+                logger.info("💡 Falling back to default database: neo4j")
+                # Remember the fallback so later loaders skip the failing CREATE DATABASE
+                with _ENSURED_DBS_LOCK:
+                    _ENSURED_DBS[key] = "neo4j"
                 # Update database to use default
                 self.database = "neo4j"
                 self.neo4j_config['database'] = "neo4j"
             else:
-                logger.warning(f"⚠️ Could not create database {self.database}: {e}")
+                logger.warning("⚠️ Could not create database %s: %s", self.database, e)
                 logger.info("💡 You may need to create the database manually or use Neo4j Enterprise")
 
     def close(self):
-        """Close Neo4j connection"""
+        """Release the Neo4j connection (the shared driver stays open until close_all_drivers)"""
         if self.driver:
-            self.driver.close()
-            logger.info("🗄️ Neo4j connection closed")
+            self.driver = None
+            logger.info("🗄️ Neo4j connection released")
 
 class UniversalDataLoader:
     """
@@ -846,7 +1158,7 @@ class UniversalDataLoader:
         self._initialize_text_processor()
         self._initialize_graph_builder()
         
-        logger.info(f"🚀 UniversalDataLoader initialized for {self.environment}")
+        logger.info("🚀 UniversalDataLoader initialized for %s", self.environment)
     
     def _initialize_data_source(self):
         """Initialize data source adapter based on configuration"""
@@ -891,79 +1203,187 @@ class UniversalDataLoader:
         self.graph_loader = None
         logger.info("🗄️ AI-only mode: LangChain handles Neo4j directly (no separate graph loader needed)")
     
-    def load_system_data(self, system_id: str) -> Tuple[List[SystemEntity], List[EventEntity]]:
+    def load_system_data(self, system_id: str, return_entities: bool = False) -> Tuple[List[SystemEntity], List[EventEntity]]:
         """
         Load and process data for a single system
         
         Args:
             system_id: System identifier
+            return_entities: Build basic SystemEntity objects for the return value.
+                The graph is already written to Neo4j, so this is opt-in.
             
         Returns:
-            Tuple of (systems, patch_events)
+            Tuple of (systems, patch_events); empty lists unless return_entities is set
+        """
+        return self._load_system(system_id, lambda: self.data_source.read_system_files(system_id), return_entities)
+    
+    def load_system_data_from_batch(self, batch: SystemBatch, idx: int,
+                                    return_entities: bool = False) -> Tuple[List[SystemEntity], List[EventEntity]]:
+        """
+        Load and process the system at position idx of a scan_all_systems() batch
+        
+        Same as load_system_data, but reuses the batch's file listing instead of re-walking the system directory
         """
-        logger.info(f"📊 Loading data for system: {system_id}")
+        system_id = batch.system_ids[idx]
+        return self._load_system(system_id, lambda: self.data_source.read_system_files_from_batch(batch, idx), return_entities)
+    
+    def _load_system(self, system_id: str, read_files, return_entities: bool) -> Tuple[List[SystemEntity], List[EventEntity]]:
+        """Run phases 1-4 for one system; read_files performs the raw ingestion"""
+        logger.info("📊 Loading data for system: %s", system_id)
         
         try:
             # Phase 1: Raw data ingestion
-            raw_files = self.data_source.read_system_files(system_id)
-            logger.debug(f"📁 Loaded {len(raw_files)} raw files")
+            raw_files = read_files()
+            logger.debug("📁 Loaded %d raw files", len(raw_files))
             
             # Phase 2: Text processing (if enabled)
-            if self.text_processor:
-                processed_data = self.text_processor.process_files(raw_files)
-                logger.debug(f"⚙️ Processed {len(processed_data)} files")
-            else:
-                processed_data = {path: {'cleaned_content': content} for path, content in raw_files.items()}
+            processed_data = self._process_raw_files(system_id, raw_files)
             
-            # Phase 3 & 4: AI-Powered Knowledge Graph Creation
-            if not self.graph_builder:
-                logger.error(f" Knowledge graph builder not available for {system_id} - requires AI configuration")
-                raise RuntimeError("Knowledge graph builder required. Check LLM configuration and dependencies.")
-            
-            # Create knowledge graph using AI analysis
+            # Phase 3 & 4: Create knowledge graph using AI analysis
             graph_creation_success = self.graph_builder.create_knowledge_graph(system_id, processed_data)
+            return self._graph_result(system_id, processed_data, graph_creation_success, return_entities)
             
-            if graph_creation_success:
-                logger.info(f" Knowledge graph created successfully for {system_id}")
-                # Create basic system info for return value compatibility
-                systems = self._create_basic_system_info(system_id, processed_data)
-                events = []
-                return systems, events
-            else:
-                logger.error(f" Knowledge graph creation failed for {system_id}")
-                raise RuntimeError(f"Knowledge graph creation failed for {system_id}. Check LLM connection, APOC plugin, and Neo4j setup.")
+        except RuntimeError as e:
+            # Re-raise runtime errors (knowledge graph creation failures) for visibility
+            logger.error(" Knowledge graph creation failed for %s: %s", system_id, e)
+            raise e
+        except Exception as e:
+            logger.error(" Unexpected error for %s: %s", system_id, e)
+            return [], []
+    
+    async def aload_system_data(self, system_id: str, return_entities: bool = False) -> Tuple[List[SystemEntity], List[EventEntity]]:
+        """
+        Async variant of load_system_data
+        
+        File reads and text processing run in a worker thread; extraction uses the
+        graph builder's async path, so several systems (and other I/O) can overlap.
+        """
+        logger.info("📊 Loading data for system: %s", system_id)
+        
+        try:
+            raw_files = await asyncio.to_thread(self.data_source.read_system_files, system_id)
+            logger.debug("📁 Loaded %d raw files", len(raw_files))
             
+            processed_data = await asyncio.to_thread(self._process_raw_files, system_id, raw_files)
+            
+            graph_creation_success = await self.graph_builder.acreate_knowledge_graph(system_id, processed_data)
+            return self._graph_result(system_id, processed_data, graph_creation_success, return_entities)
             
         except RuntimeError as e:
-            # Re-raise runtime errors (knowledge graph creation failures) for visibility
-            logger.error(f" Knowledge graph creation failed for {system_id}: {e}")
+            logger.error(" Knowledge graph creation failed for %s: %s", system_id, e)
             raise e
         except Exception as e:
-            logger.error(f" Unexpected error for {system_id}: {e}")
+            logger.error(" Unexpected error for %s: %s", system_id, e)
+            return [], []
+    
+    async def aiter_system_data(self, return_entities: bool = False,
+                                prefetch: int = 2) -> AsyncIterator[Tuple[str, List[SystemEntity], List[EventEntity]]]:
+        """
+        Stream every system through phases 1-4, yielding (system_id, systems, events) in listing order
+        
+        Files for the next `prefetch` systems are read and processed in worker threads
+        while the current system waits on AI extraction, so disk I/O overlaps LLM latency.
+        """
+        batch = await asyncio.to_thread(self.scan_all_systems)
+        logger.info("📋 Streaming data for %d systems (prefetch=%d)", len(batch), prefetch)
+        
+        def read_and_process(idx):
+            raw_files = self.data_source.read_system_files_from_batch(batch, idx)
+            logger.debug("📁 Loaded %d raw files", len(raw_files))
+            return self._process_raw_files(batch.system_ids[idx], raw_files)
+        
+        pending = deque()
+        next_idx = 0
+        try:
+            while next_idx < len(batch) or pending:
+                while next_idx < len(batch) and len(pending) <= max(prefetch, 0):
+                    pending.append(asyncio.create_task(asyncio.to_thread(read_and_process, next_idx)))
+                    next_idx += 1
+                
+                system_id = batch.system_ids[next_idx - len(pending)]
+                logger.info("📊 Loading data for system: %s", system_id)
+                try:
+                    processed_data = await pending.popleft()
+                    graph_creation_success = await self.graph_builder.acreate_knowledge_graph(system_id, processed_data)
+                    systems, events = self._graph_result(system_id, processed_data, graph_creation_success, return_entities)
+                except RuntimeError as e:
+                    logger.error(" Knowledge graph creation failed for %s: %s", system_id, e)
+                    raise e
+                except Exception as e:
+                    logger.error(" Unexpected error for %s: %s", system_id, e)
+                    systems, events = [], []
+                yield system_id, systems, events
+        finally:
+            # Stopped early (error or caller broke out): don't leave prefetches running
+            for task in pending:
+                task.cancel()
+    
+    def _process_raw_files(self, system_id: str, raw_files: Dict[str, str]) -> Dict[str, Any]:
+        """Phase 2 (text processing, if enabled), then check a graph builder is available"""
+        if self.text_processor:
+            processed_data = self.text_processor.process_files(raw_files)
+            logger.debug("⚙️ Processed %d files", len(processed_data))
+        else:
+            processed_data = {path: {'cleaned_content': content} for path, content in raw_files.items()}
+        
+        # Phase 3 & 4: AI-Powered Knowledge Graph Creation
+        if not self.graph_builder:
+            logger.error(" Knowledge graph builder not available for %s - requires AI configuration", system_id)
+            raise RuntimeError("Knowledge graph builder required. Check LLM configuration and dependencies.")
+        
+        return processed_data
+    
+    def _graph_result(self, system_id: str, processed_data: Dict[str, Any], graph_creation_success: bool,
+                      return_entities: bool) -> Tuple[List[SystemEntity], List[EventEntity]]:
+        """Turn the graph builder's outcome into load_system_data's return value"""
+        if not graph_creation_success:
+            logger.error(" Knowledge graph creation failed for %s", system_id)
+            raise RuntimeError(f"Knowledge graph creation failed for {system_id}. Check LLM connection, APOC plugin, and Neo4j setup.")
+        
+        logger.info(" Knowledge graph created successfully for %s", system_id)
+        if not return_entities:
             return [], []
+        # Create basic system info for return value compatibility
+        systems = self._create_basic_system_info(system_id, processed_data)
+        events = []
+        return systems, events
     
-    def load_all_systems(self) -> Tuple[List[SystemEntity], List[EventEntity]]:
+    def load_all_systems(self, return_entities: bool = False) -> Tuple[List[SystemEntity], List[EventEntity]]:
         """
         Load data for all available systems
         
+        Args:
+            return_entities: Collect basic SystemEntity objects (see load_system_data)
+        
         Returns:
             Tuple of (all_systems, all_patch_events)
         """
-        available_systems = self.data_source.list_available_systems()
-        logger.info(f"📋 Loading data for {len(available_systems)} systems")
+        batch = self.scan_all_systems()
+        logger.info("📋 Loading data for %d systems", len(batch))
         
         all_systems = []
         all_events = []
         
-        for system_id in available_systems:
-            systems, events = self.load_system_data(system_id)
+        # Opt-in: overlap the I/O-bound file reads and LLM calls (graph builders serialize the Neo4j writes)
+        max_workers = self._get_ingestion_workers()
+        
+        def load(idx):
+            return self.load_system_data_from_batch(batch, idx, return_entities=return_entities)
+        
+        if max_workers > 1 and len(batch) > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(batch))) as pool:
+                results = list(pool.map(load, range(len(batch))))
+        else:
+            results = [load(idx) for idx in range(len(batch))]
+        
+        for systems, events in results:
             all_systems.extend(systems)
             all_events.extend(events)
         
         # Data already loaded to Neo4j during individual system processing (LangChain approach)
         # No separate batch loading needed - it's done during AI extraction
         
-        logger.info(f" Batch processing complete: {len(all_systems)} systems, {len(all_events)} events")
+        logger.info(" Batch processing complete: %d systems, %d events", len(all_systems), len(all_events))
         logger.info("🗄️ Graph data already loaded during AI extraction (LangChain approach)")
         return all_systems, all_events
     
@@ -971,6 +1391,29 @@ class UniversalDataLoader:
         """List all available systems"""
         return self.data_source.list_available_systems()
     
+    async def alist_available_systems(self) -> List[str]:
+        """Async variant of list_available_systems (directory listing runs in a worker thread)"""
+        return await asyncio.to_thread(self.data_source.list_available_systems)
+    
+    def has_any_system(self) -> bool:
+        """Check whether the data source has at least one system, without listing them all"""
+        return self.data_source.has_any_system()
+    
+    def refresh_systems(self):
+        """Rescan the data source on the next list_available_systems() call"""
+        self.data_source.refresh_systems()
+    
+    def scan_all_systems(self) -> SystemBatch:
+        """List all systems and their files in a single directory walk"""
+        return self.data_source.scan_all_systems()
+    
+    def _get_ingestion_workers(self) -> int:
+        """Number of systems to load concurrently (1 unless pipeline.phases.ingestion.concurrent_systems is set)"""
+        ingestion_config = self.config_loader.get_pipeline_config().get('phases', {}).get('ingestion', {})
+        if not ingestion_config.get('concurrent_systems', False):
+            return 1
+        return max(1, int(ingestion_config.get('max_workers', 4)))
+    
     def _create_basic_system_info(self, system_id: str, processed_data: Dict[str, Any]) -> List[SystemEntity]:
         """Create basic system info without AI (fallback)"""
         # Parse basic info from the processed data
@@ -987,8 +1430,7 @@ class UniversalDataLoader:
                 # Parse RHEL version from redhat-release
                 if 'redhat-release' in file_path and content:
                     if 'release' in content:
-                        import re
-                        match = re.search(r'release (\d+\.\d+)', content)
+                        match = _RELEASE_VERSION_RE.search(content)
                         if match:
                             rhel_version = match.group(1)
                 
@@ -1043,7 +1485,7 @@ def create_sample_data() -> Tuple[List[SystemEntity], List[EventEntity]]:
     """
     logger.info("🔄 Using universal data loader (backward compatibility)")
     loader = UniversalDataLoader()
-    return loader.load_all_systems()
+    return loader.load_all_systems(return_entities=True)
 
 # Main factory function for easy integration
 def get_universal_loader(environment: str = None) -> UniversalDataLoader:
@@ -4,81 +4,62 @@ Examples: Extending Universal DataLoader for Different Domains
 Shows how to customize the AI graph builder for specific use cases
 """
 
+import asyncio
+from functools import partial
 from typing import Dict, Any, List
 from core.graph_builders import GraphBuilder, create_graph_builder
 
-# Example 1: Security Domain Extension
-def create_security_graph_builder(llm_config: Dict[str, Any], neo4j_config: Dict[str, Any]) -> GraphBuilder:
+# Domain vocabularies (built once at import; O(1) membership checks)
+SECURITY_NODES = frozenset({
+    "Incident", "Vulnerability", "Threat", "Attack", "Malware",
+    "Firewall", "IDS", "SIEM", "SOC", "Analyst",
+    "IOC", "TTP", "MITRE_ATT&CK", "CVE", "Evidence"
+})
+SECURITY_RELS = frozenset({
+    "EXPLOITS", "MITIGATES", "DETECTS", "BLOCKS", "ESCALATES",
+    "INVESTIGATES", "RESPONDS_TO", "CORRELATES_WITH", "INDICATES",
+    "ATTRIBUTED_TO", "TARGETS", "COMPROMISES", "EXFILTRATES"
+})
+
+BUSINESS_NODES = frozenset({
+    "Process", "Workflow", "Task", "Decision", "Gateway",
+    "Actor", "Role", "Department", "System", "Document",
+    "KPI", "Metric", "SLA", "Compliance", "Risk"
+})
+BUSINESS_RELS = frozenset({
+    "PERFORMS", "APPROVES", "REVIEWS", "ESCALATES_TO", "REPORTS_TO",
+    "DEPENDS_ON", "TRIGGERS", "COMPLETES", "VALIDATES", "MEASURES"
+})
+
+IOT_NODES = frozenset({
+    "Sensor", "Actuator", "Gateway", "Controller", "HMI",
+    "SCADA", "PLC", "Machine", "Production_Line", "Factory",
+    "Reading", "Alert", "Maintenance", "Calibration", "Recipe"
+})
+IOT_RELS = frozenset({
+    "MONITORS", "CONTROLS", "CALIBRATES", "MAINTAINS", "PRODUCES",
+    "TRANSMITS_TO", "RECEIVES_FROM", "TRIGGERS_ALARM", "SCHEDULES"
+})
+
+def _make_domain_builder(nodes: frozenset, relationships: frozenset,
+                         llm_config: Dict[str, Any], neo4j_config: Dict[str, Any]) -> GraphBuilder:
     """
-    Create a graph builder optimized for security data
+    Create an AI graph builder restricted to one domain vocabulary
     
-    This example shows how to customize the AI for security incident analysis
+    This demonstrates the extensibility pattern: the universal builder, with its
+    LLMGraphTransformer schema replaced by domain-specific nodes/relationships
     """
-    # Create AI graph builder with security-specific configuration
-    builder = create_graph_builder('ai', llm_config=llm_config, neo4j_config=neo4j_config)
-    
-    # Security-specific node types (extends the universal set)
-    security_nodes = [
-        "Incident", "Vulnerability", "Threat", "Attack", "Malware",
-        "Firewall", "IDS", "SIEM", "SOC", "Analyst",
-        "IOC", "TTP", "MITRE_ATT&CK", "CVE", "Evidence"
-    ]
-    
-    # Security-specific relationships
-    security_relationships = [
-        "EXPLOITS", "MITIGATES", "DETECTS", "BLOCKS", "ESCALATES",
-        "INVESTIGATES", "RESPONDS_TO", "CORRELATES_WITH", "INDICATES",
-        "ATTRIBUTED_TO", "TARGETS", "COMPROMISES", "EXFILTRATES"
-    ]
-    
-    # You could extend the builder's allowed nodes/relationships here
-    # This demonstrates the extensibility pattern
-    
-    return builder
+    return create_graph_builder('ai', llm_config=llm_config, neo4j_config=neo4j_config,
+                                allowed_nodes=nodes, allowed_relationships=relationships)
 
-# Example 2: Business Process Extension  
-def create_business_process_builder(llm_config: Dict[str, Any], neo4j_config: Dict[str, Any]) -> GraphBuilder:
-    """
-    Create a graph builder optimized for business process documentation
-    """
-    builder = create_graph_builder('ai', llm_config=llm_config, neo4j_config=neo4j_config)
-    
-    # Business-specific nodes
-    business_nodes = [
-        "Process", "Workflow", "Task", "Decision", "Gateway",
-        "Actor", "Role", "Department", "System", "Document",
-        "KPI", "Metric", "SLA", "Compliance", "Risk"
-    ]
-    
-    # Business-specific relationships
-    business_relationships = [
-        "PERFORMS", "APPROVES", "REVIEWS", "ESCALATES_TO", "REPORTS_TO",
-        "DEPENDS_ON", "TRIGGERS", "COMPLETES", "VALIDATES", "MEASURES"
-    ]
-    
-    return builder
+# Example 1: Security Domain Extension (incident analysis)
+create_security_graph_builder = partial(_make_domain_builder, SECURITY_NODES, SECURITY_RELS)
 
-# Example 3: IoT/Industrial Extension
-def create_iot_industrial_builder(llm_config: Dict[str, Any], neo4j_config: Dict[str, Any]) -> GraphBuilder:
-    """
-    Create a graph builder optimized for IoT and industrial systems
-    """
-    builder = create_graph_builder('ai', llm_config=llm_config, neo4j_config=neo4j_config)
-    
-    # IoT/Industrial nodes
-    iot_nodes = [
-        "Sensor", "Actuator", "Gateway", "Controller", "HMI",
-        "SCADA", "PLC", "Machine", "Production_Line", "Factory",
-        "Reading", "Alert", "Maintenance", "Calibration", "Recipe"
-    ]
-    
-    # IoT/Industrial relationships
-    iot_relationships = [
-        "MONITORS", "CONTROLS", "CALIBRATES", "MAINTAINS", "PRODUCES",
-        "TRANSMITS_TO", "RECEIVES_FROM", "TRIGGERS_ALARM", "SCHEDULES"
-    ]
-    
-    return builder
+# Example 2: Business Process Extension (workflow documentation)
+create_business_process_builder = partial(_make_domain_builder, BUSINESS_NODES, BUSINESS_RELS)
+
+# Example 3: IoT/Industrial Extension (manufacturing systems)
+create_iot_industrial_builder = partial(_make_domain_builder, IOT_NODES, IOT_RELS)
 
 # Example 4: Multi-Domain Usage
 def demo_multi_domain_usage():
@@ -124,15 +105,20 @@ def demo_multi_domain_usage():
     business_builder = create_business_process_builder(llm_config, neo4j_config)
     iot_builder = create_iot_industrial_builder(llm_config, neo4j_config)
     
-    # Process each domain with its specialized builder
-    print("🔒 Processing security data...")
-    security_builder.create_knowledge_graph('security_incident_001', security_data)
+    # Process all domains concurrently, each with its specialized builder
+    print("🔒💼🏭 Processing security, business and IoT data...")
+    
+    async def process_all_domains():
+        return await asyncio.gather(
+            security_builder.acreate_knowledge_graph('security_incident_001', security_data),
+            business_builder.acreate_knowledge_graph('purchase_process', business_data),
+            iot_builder.acreate_knowledge_graph('factory_floor_01', iot_data)
+        )
     
-    print("💼 Processing business data...")  
-    business_builder.create_knowledge_graph('purchase_process', business_data)
+    asyncio.run(process_all_domains())
     
-    print("🏭 Processing IoT data...")
-    iot_builder.create_knowledge_graph('factory_floor_01', iot_data)
+    # Several documents for one domain go through a single batched dispatch:
+    # security_builder.create_knowledge_graphs_batch([('incident_001', data_1), ('incident_002', data_2)])
     
     # Clean up
     security_builder.close()
@@ -166,23 +152,26 @@ def integrate_with_dataloader_config():
         print(f"   {domain}: {config['builder_type']} with {len(config['specialized_nodes'])} custom nodes")
 
 # Example 6: Factory Pattern for Builder Selection
+def _default_builder(llm_config: Dict[str, Any], neo4j_config: Dict[str, Any]) -> GraphBuilder:
+    """Universal AI graph builder (no domain-specific vocabulary)"""
+    return create_graph_builder('ai', llm_config=llm_config, neo4j_config=neo4j_config)
+
+# Domain -> builder factory dispatch table (built once at import)
+_DOMAIN_BUILDERS = {
+    'security': create_security_graph_builder,
+    'business': create_business_process_builder,
+    'iot': create_iot_industrial_builder,
+    'infrastructure': _default_builder,
+    'universal': _default_builder
+}
+
 def create_domain_aware_builder(domain: str, llm_config: Dict[str, Any], neo4j_config: Dict[str, Any]) -> GraphBuilder:
     """
     Factory function that creates the right builder based on data domain
     
     This shows how you could automatically select builders based on content analysis
     """
-    
-    domain_builders = {
-        'security': create_security_graph_builder,
-        'business': create_business_process_builder,
-        'iot': create_iot_industrial_builder,
-        'infrastructure': lambda llm, neo4j: create_graph_builder('ai', llm_config=llm, neo4j_config=neo4j),  # Default
-        'universal': lambda llm, neo4j: create_graph_builder('ai', llm_config=llm, neo4j_config=neo4j)  # Default
-    }
-    
-    builder_factory = domain_builders.get(domain, domain_builders['universal'])
-    return builder_factory(llm_config, neo4j_config)
+    return _DOMAIN_BUILDERS.get(domain, _default_builder)(llm_config, neo4j_config)
 
 def main():
     """
@@ -218,10 +207,9 @@ def main():
     print("    Easy to add new domains")
     
     print("\n🔧 To extend for your domain:")
-    print("   1. Create your custom builder function")
-    print("   2. Define domain-specific nodes and relationships")
-    print("   3. Use create_graph_builder() with your config")
-    print("   4. Add to domain_builders factory dict")
+    print("   1. Define domain-specific nodes and relationships (frozensets)")
+    print("   2. Bind them: partial(_make_domain_builder, YOUR_NODES, YOUR_RELS)")
+    print("   3. Add to _DOMAIN_BUILDERS dispatch table")
     
     # Uncomment to run actual demo (requires valid LLM/Neo4j config)
     # integrate_with_dataloader_config()
@@ -69,6 +69,7 @@ setup(
         "full": [
             "unstructured>=0.10.0",
             "pygrok>=1.0.0",
+            "google-re2>=1.1",
             "pypdf>=3.0.0",
             "beautifulsoup4>=4.11.0",
             "markdown>=3.4.0",
@@ -0,0 +1,74 @@
+"""Tests for the per-environment configuration loader cache"""
+
+import pytest
+
+from config.config_loader import clear_config_loader_cache, get_config_loader
+
+
+@pytest.fixture(autouse=True)
+def fresh_loaders():
+    clear_config_loader_cache()
+    yield
+    clear_config_loader_cache()
+
+
+def test_loader_is_cached_per_environment():
+    development = get_config_loader('development')
+    testing = get_config_loader('testing')
+
+    assert get_config_loader('development') is development
+    assert get_config_loader('testing') is testing
+    assert development is not testing
+    assert (development.environment, testing.environment) == ('development', 'testing')
+
+
+def test_default_environment_comes_from_env(monkeypatch):
+    monkeypatch.setenv('ENVIRONMENT', 'testing')
+
+    loader = get_config_loader()
+
+    assert loader.environment == 'testing'
+    assert get_config_loader() is loader
+
+
+def test_clear_cache_creates_new_loaders():
+    development = get_config_loader('development')
+
+    clear_config_loader_cache()
+
+    assert get_config_loader('development') is not development
+
+
+def test_environment_overrides_apply_per_loader():
+    development = get_config_loader('development').get_pipeline_config()
+    production = get_config_loader('production').get_pipeline_config()
+
+    assert development['ai_extraction']['max_retries'] == 1
+    assert production['ai_extraction']['max_retries'] == 5
+    assert get_config_loader('testing').get_data_source_config('rhel_systems')['base_path'] == "test_data/mock_systems"
+
+
+def test_getters_return_copies():
+    loader = get_config_loader('development')
+
+    pipeline = loader.get_pipeline_config()
+    pipeline['ai_extraction']['max_retries'] = 99
+    pipeline['injected'] = True
+    neo4j = loader.get_neo4j_config()
+    neo4j['management']['max_connections'] = -1
+
+    assert loader.get_pipeline_config()['ai_extraction']['max_retries'] == 1
+    assert 'injected' not in loader.get_pipeline_config()
+    assert loader.get_neo4j_config()['management']['max_connections'] != -1
+    # Overrides from another environment never leak into the shared parsed YAML
+    assert get_config_loader('production').get_pipeline_config()['ai_extraction']['max_retries'] == 5
+
+
+def test_neo4j_config_resolves_environment_variables(monkeypatch):
+    monkeypatch.setenv('NEO4J_URI', 'neo4j://example.test:7687')
+    monkeypatch.setenv('NEO4J_DATABASE', 'graphs')
+
+    neo4j = get_config_loader('development').get_neo4j_config()
+
+    assert neo4j['uri'] == 'neo4j://example.test:7687'
+    assert neo4j['database'] == 'graphs'
@@ -0,0 +1,73 @@
+"""The example domain builders must hand their vocabulary to the LLMGraphTransformer"""
+
+import sys
+import types
+
+import pytest
+
+from core import graph_builders
+
+
+class _FakeTransformer:
+    def __init__(self, llm, allowed_nodes, allowed_relationships):
+        self.llm = llm
+        self.allowed_nodes = allowed_nodes
+        self.allowed_relationships = allowed_relationships
+
+
+class _FakeGraph:
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+    def close(self):
+        pass
+
+
+def _module(name, **attrs):
+    module = types.ModuleType(name)
+    module.__dict__.update(attrs)
+    return module
+
+
+@pytest.fixture(autouse=True)
+def fake_langchain(monkeypatch):
+    """Stand-ins for the LangChain classes AIGraphBuilder constructs (no LLM or Neo4j needed)"""
+    fakes = {
+        'langchain_experimental': _module('langchain_experimental'),
+        'langchain_experimental.graph_transformers': _module('langchain_experimental.graph_transformers',
+                                                               LLMGraphTransformer=_FakeTransformer),
+        'langchain_openai': _module('langchain_openai', ChatOpenAI=lambda **kwargs: kwargs),
+        'langchain_core': _module('langchain_core'),
+        'langchain_core.documents': _module('langchain_core.documents', Document=dict),
+        'langchain_neo4j': _module('langchain_neo4j', Neo4jGraph=_FakeGraph),
+    }
+    for name, module in fakes.items():
+        monkeypatch.setitem(sys.modules, name, module)
+    graph_builders.close_neo4j_graphs()
+    yield
+    graph_builders.close_neo4j_graphs()
+
+
+LLM_CONFIG = {'base_url': 'http://llm.test/v1', 'api_key': 'key', 'model': 'test-model'}
+NEO4J_CONFIG = {'uri': 'neo4j://localhost:7687', 'username': 'neo4j', 'password': 'password', 'database': 'neo4j'}
+
+
+def test_domain_builders_carry_domain_schema():
+    from examples import extending_for_domains as ex
+
+    cases = [
+        (ex.create_security_graph_builder, ex.SECURITY_NODES, ex.SECURITY_RELS),
+        (ex.create_business_process_builder, ex.BUSINESS_NODES, ex.BUSINESS_RELS),
+        (ex.create_iot_industrial_builder, ex.IOT_NODES, ex.IOT_RELS),
+    ]
+    for factory, nodes, relationships in cases:
+        builder = factory(LLM_CONFIG, NEO4J_CONFIG)
+        assert builder.graph_transformer.allowed_nodes == sorted(nodes)
+        assert builder.graph_transformer.allowed_relationships == sorted(relationships)
+
+
+def test_default_builder_keeps_universal_schema():
+    builder = graph_builders.create_graph_builder('ai', llm_config=LLM_CONFIG, neo4j_config=NEO4J_CONFIG)
+
+    assert builder.graph_transformer.allowed_nodes == builder._get_universal_node_types()
+    assert builder.graph_transformer.allowed_relationships == builder._get_universal_relationships()
@@ -0,0 +1,160 @@
+"""Tests for FilesystemDataSourceAdapter over a tmp_path system tree"""
+
+import pytest
+
+import core.unified_dataloader as unified_dataloader
+from core.unified_dataloader import FilesystemDataSourceAdapter
+
+FILE_PATTERNS = {
+    'release': ['etc/redhat-release', 'etc/not-there'],
+    'logs': ['var/log/*.log', 'var/log/messages'],
+    'packages': ['var/lib/rpm/*'],
+}
+
+TREE = {
+    'web-01': {
+        'etc/redhat-release': "Red Hat Enterprise Linux release 9.2 (Plow)",
+        'var/log/yum.log': "Updated: httpd",
+        'var/log/messages': "kernel: boot",
+        'var/log/.hidden.log': "not matched by *",
+        'var/log/audit/audit.log': "type=SYSCALL (wildcards don't cross /)",
+        'var/lib/rpm/packages.txt': "kernel-5.14",
+    },
+    'db-01': {
+        'etc/redhat-release': "Red Hat Enterprise Linux release 8.8 (Ootpa)",
+        'var/log/messages': "mysqld: ready",
+    },
+}
+
+
+def _write_tree(base, tree):
+    for system_id, files in tree.items():
+        for rel_path, content in files.items():
+            path = base / system_id / rel_path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content)
+
+
+@pytest.fixture
+def data_path(tmp_path):
+    _write_tree(tmp_path, TREE)
+    (tmp_path / "README.txt").write_text("a file next to the systems is not a system")
+    return tmp_path
+
+
+def test_reads_only_matching_files(data_path):
+    adapter = FilesystemDataSourceAdapter(str(data_path), FILE_PATTERNS)
+
+    files = adapter.read_system_files('web-01')
+
+    assert files == {
+        'etc/redhat-release': TREE['web-01']['etc/redhat-release'],
+        'var/log/yum.log': TREE['web-01']['var/log/yum.log'],
+        'var/log/messages': TREE['web-01']['var/log/messages'],
+        'var/lib/rpm/packages.txt': TREE['web-01']['var/lib/rpm/packages.txt'],
+    }
+
+
+def test_batch_reads_match_per_system_reads(data_path):
+    adapter = FilesystemDataSourceAdapter(str(data_path), FILE_PATTERNS)
+
+    batch = adapter.scan_all_systems()
+
+    assert sorted(batch.system_ids) == sorted(TREE)
+    for idx, system_id in enumerate(batch.system_ids):
+        assert adapter.read_system_files_from_batch(batch, idx) == adapter.read_system_files(system_id)
+        # Only directories a pattern names are listed (var/log/audit is not one of them)
+        assert sorted(batch.file_paths[idx]) == sorted(
+            path for path in TREE[system_id] if path.rsplit('/', 1)[0] in ('etc', 'var/log', 'var/lib/rpm'))
+
+
+def test_unnamed_subtrees_are_not_listed(data_path, monkeypatch):
+    listed = []
+    real_scandir = unified_dataloader.os.scandir
+    monkeypatch.setattr(unified_dataloader.os, 'scandir', lambda path: listed.append(path) or real_scandir(path))
+    adapter = FilesystemDataSourceAdapter(str(data_path), FILE_PATTERNS)
+
+    adapter.read_system_files('web-01')
+
+    system_path = data_path / 'web-01'
+    assert sorted(listed) == sorted(str(system_path / rel_dir) for rel_dir in ('etc', 'var/log', 'var/lib/rpm'))
+
+
+def test_wildcard_directories_are_expanded(data_path):
+    adapter = FilesystemDataSourceAdapter(str(data_path), {'logs': ['var/*/audit/*.log', 'var/lo?/messages']})
+
+    assert adapter.read_system_files('web-01') == {
+        'var/log/audit/audit.log': TREE['web-01']['var/log/audit/audit.log'],
+        'var/log/messages': TREE['web-01']['var/log/messages'],
+    }
+
+
+def test_large_files_read_through_mmap(data_path, monkeypatch):
+    monkeypatch.setattr(unified_dataloader, '_MMAP_THRESHOLD', 8)
+    adapter = FilesystemDataSourceAdapter(str(data_path), FILE_PATTERNS)
+
+    assert adapter.read_system_files('db-01') == TREE['db-01']
+
+
+def test_missing_system_raises(data_path):
+    adapter = FilesystemDataSourceAdapter(str(data_path), FILE_PATTERNS)
+
+    with pytest.raises(FileNotFoundError):
+        adapter.read_system_files('nope-01')
+
+
+def test_listing_is_cached_until_ttl_or_refresh(data_path, monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(unified_dataloader.time, 'monotonic', lambda: clock[0])
+    adapter = FilesystemDataSourceAdapter(str(data_path), FILE_PATTERNS, list_ttl=60.0)
+
+    assert sorted(adapter.list_available_systems()) == ['db-01', 'web-01']
+    (data_path / 'app-01').mkdir()
+
+    # Within the TTL the cached listing is served
+    clock[0] += 30
+    assert 'app-01' not in adapter.list_available_systems()
+
+    # Past the TTL the directory is rescanned
+    clock[0] += 31
+    assert 'app-01' in adapter.list_available_systems()
+
+    # refresh_systems() invalidates immediately
+    (data_path / 'cache-01').mkdir()
+    assert 'cache-01' not in adapter.list_available_systems()
+    adapter.refresh_systems()
+    assert 'cache-01' in adapter.list_available_systems()
+
+
+def test_listing_returns_copies(data_path):
+    adapter = FilesystemDataSourceAdapter(str(data_path), FILE_PATTERNS)
+
+    adapter.list_available_systems().append('injected')
+
+    assert 'injected' not in adapter.list_available_systems()
+
+
+def test_scan_refreshes_listing_cache(data_path):
+    adapter = FilesystemDataSourceAdapter(str(data_path), FILE_PATTERNS)
+    adapter.list_available_systems()
+    (data_path / 'app-01').mkdir()
+
+    adapter.scan_all_systems()
+
+    assert 'app-01' in adapter.list_available_systems()
+
+
+def test_has_any_system(tmp_path):
+    adapter = FilesystemDataSourceAdapter(str(tmp_path), FILE_PATTERNS)
+    assert not adapter.has_any_system()
+
+    (tmp_path / "README.txt").write_text("files are not systems")
+    assert not adapter.has_any_system()
+
+    (tmp_path / "web-01").mkdir()
+    assert adapter.has_any_system()
+
+
+def test_missing_base_path_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        FilesystemDataSourceAdapter(str(tmp_path / "absent"), FILE_PATTERNS)
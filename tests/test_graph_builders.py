@@ -0,0 +1,142 @@
+"""Tests for core.graph_builders that need no LLM or Neo4j connection"""
+
+import asyncio
+import threading
+import time
+
+from core.graph_builders import AIGraphBuilder
+
+
+def _bare_ai_builder():
+    """AIGraphBuilder without __init__ (which needs LangChain and live endpoints)"""
+    return AIGraphBuilder.__new__(AIGraphBuilder)
+
+
+def test_batch_without_running_loop_uses_async_dispatch():
+    builder = _bare_ai_builder()
+    dispatched = []
+
+    async def fake_batch(items):
+        dispatched.extend(system_id for system_id, _ in items)
+        return {system_id: True for system_id, _ in items}
+
+    builder.acreate_knowledge_graphs_batch = fake_batch
+
+    assert builder.create_knowledge_graphs_batch([("a", {}), ("b", {})]) == {"a": True, "b": True}
+    assert dispatched == ["a", "b"]
+
+
+def test_batch_inside_running_loop_falls_back_to_sequential():
+    builder = _bare_ai_builder()
+    calls = []
+
+    def fake_create(system_id, processed_data):
+        calls.append(system_id)
+        return system_id != "bad"
+
+    builder.create_knowledge_graph = fake_create
+
+    async def caller():
+        return builder.create_knowledge_graphs_batch([("good", {}), ("bad", {})])
+
+    assert asyncio.run(caller()) == {"good": True, "bad": False}
+    assert calls == ["good", "bad"]
+
+
+def test_graph_writes_are_serialized():
+    active = []
+    overlaps = []
+
+    class _Graph:
+        def add_graph_documents(self, graph_documents):
+            active.append(graph_documents)
+            overlaps.append(len(active))
+            time.sleep(0.01)
+            active.remove(graph_documents)
+
+    builders = [_bare_ai_builder() for _ in range(4)]
+    for builder in builders:
+        builder.neo4j_graph = _Graph()
+
+    threads = [threading.Thread(target=builder._write_graph_documents, args=([object()],)) for builder in builders]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert overlaps == [1, 1, 1, 1]
+
+
+class _Document:
+    def __init__(self, page_content, metadata):
+        self.page_content = page_content
+        self.metadata = metadata
+
+
+class _GraphDocument:
+    def __init__(self, source):
+        self.source = source
+        self.nodes = ['node']
+        self.relationships = []
+
+
+class _Transformer:
+    """Extracts one graph document per source; sources in `failing` raise"""
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.calls = []
+
+    async def aconvert_to_graph_documents(self, documents):
+        self.calls.append([document.metadata["source_id"] for document in documents])
+        if documents[0].metadata["source_id"] in self.failing:
+            raise ValueError("malformed LLM response")
+        return [_GraphDocument(document) for document in documents]
+
+
+class _RecordingGraph:
+    def __init__(self):
+        self.writes = []
+        self.threads = []
+
+    def add_graph_documents(self, graph_documents):
+        self.writes.append([graph_doc.source.metadata["source_id"] for graph_doc in graph_documents])
+        self.threads.append(threading.current_thread())
+
+
+def _async_ai_builder(transformer):
+    builder = _bare_ai_builder()
+    builder.graph_transformer = transformer
+    builder.neo4j_graph = _RecordingGraph()
+    builder.document_cls = _Document
+    return builder
+
+
+def _processed(content):
+    return {'etc/redhat-release': {'cleaned_content': content}}
+
+
+def test_async_batch_maps_results_by_source_id():
+    builder = _async_ai_builder(_Transformer(failing={'db-01'}))
+    items = [('web-01', _processed("RHEL 9")), ('db-01', _processed("RHEL 8")), ('app-01', _processed("RHEL 9"))]
+
+    results = asyncio.run(builder.acreate_knowledge_graphs_batch(items))
+
+    # One failing extraction costs only its own source
+    assert results == {'web-01': True, 'db-01': False, 'app-01': True}
+    assert builder.graph_transformer.calls == [['web-01'], ['db-01'], ['app-01']]
+    assert builder.neo4j_graph.writes == [['web-01', 'app-01']]
+
+
+def test_async_batch_writes_off_the_event_loop():
+    builder = _async_ai_builder(_Transformer())
+
+    async def caller():
+        loop_thread = threading.current_thread()
+        results = await builder.acreate_knowledge_graphs_batch([('web-01', _processed("RHEL 9"))])
+        return loop_thread, results
+
+    loop_thread, results = asyncio.run(caller())
+
+    assert results == {'web-01': True}
+    assert builder.neo4j_graph.threads and builder.neo4j_graph.threads[0] is not loop_thread
@@ -0,0 +1,262 @@
+"""Tests for Neo4jGraphLoader queries against an in-memory stand-in driver"""
+
+import logging
+from types import SimpleNamespace
+
+import pytest
+
+from core.data_models import SystemEntity
+import core.unified_dataloader as unified_dataloader
+from core.unified_dataloader import Neo4jGraphLoader, _PREPARED, _SCHEMA_STATEMENTS
+
+
+class _FakeResult:
+    def __init__(self, records):
+        self.records = records
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def value(self, key):
+        return [record[key] for record in self.records]
+
+    def single(self):
+        return self.records[0] if self.records else None
+
+    def consume(self):
+        return SimpleNamespace(counters=SimpleNamespace(nodes_deleted=len(self.records)))
+
+
+class _FakeTx:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def run(self, query, **params):
+        self.driver.queries.append((query, params))
+        if query in self.driver.failures:
+            raise self.driver.failures[query]
+        return _FakeResult(self.driver.answer(query, params))
+
+
+class _FakeSession:
+    def __init__(self, driver):
+        self.tx = _FakeTx(driver)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute_read(self, work, *args):
+        return work(self.tx, *args)
+
+    execute_write = execute_read
+
+    def run(self, query, **params):
+        return self.tx.run(query, **params)
+
+
+class _FakeDriver:
+    """Records every query; verify_systems finds only ids in `existing`, queries in `failures` raise"""
+
+    def __init__(self, existing=(), failures=None):
+        self.existing = set(existing)
+        self.failures = failures or {}
+        self.queries = []
+        self.databases = []
+
+    def session(self, database=None):
+        self.databases.append(database)
+        return _FakeSession(self)
+
+    def answer(self, query, params):
+        if query == _PREPARED['verify_systems']:
+            return [{'id': system_id, 'count': int(system_id in self.existing)} for system_id in params['ids']]
+        if query == SHOW_DATABASES:
+            return [{'name': 'neo4j'}, {'name': 'system'}]
+        if query == _PREPARED['graph_stats']:
+            return [{'nodes': 7, 'relationships': 5, 'systems': 2, 'events': 3}]
+        return []
+
+
+class _Neo4jError(Exception):
+    """Stand-in for neo4j.exceptions.Neo4jError (classified by status code)"""
+
+    def __init__(self, code, message=''):
+        super().__init__(message or code)
+        self.code = code
+
+
+CLEAR_ALL = "MATCH (n) DETACH DELETE n"
+SHOW_DATABASES = "SHOW DATABASES YIELD name"
+CREATE_DATABASE = "CREATE DATABASE $name IF NOT EXISTS"
+
+
+def _loader(driver):
+    """Neo4jGraphLoader without __init__ (which connects to a server)"""
+    loader = Neo4jGraphLoader.__new__(Neo4jGraphLoader)
+    loader.neo4j_config = {'uri': 'neo4j://localhost:7687', 'management': {}}
+    loader.database = 'graphs'
+    loader.write_batch_size = 100
+    loader.driver = driver
+    return loader
+
+
+def test_verify_systems_counts_in_one_query():
+    driver = _FakeDriver(existing={'web-01'})
+
+    counts = _loader(driver).verify_systems(['web-01', 'db-01'])
+
+    assert counts == {'web-01': 1, 'db-01': 0}
+    assert driver.queries == [(_PREPARED['verify_systems'], {'ids': ['web-01', 'db-01']})]
+    assert driver.databases == ['graphs']
+
+
+def test_verify_systems_without_driver_or_ids():
+    assert _loader(None).verify_systems(['web-01']) == {}
+
+    driver = _FakeDriver()
+    assert _loader(driver).verify_systems([]) == {}
+    assert driver.queries == []
+
+
+def test_load_skips_verification_by_default():
+    driver = _FakeDriver(existing={'web-01'})
+
+    assert _loader(driver).load_systems_and_events([SystemEntity(system_id='web-01')], [])
+
+    assert all(query != _PREPARED['verify_systems'] for query, _ in driver.queries)
+
+
+def test_load_verification_only_logs(caplog):
+    systems = [SystemEntity(system_id='web-01'), SystemEntity(system_id='db-01')]
+    loader = _loader(_FakeDriver(existing={'web-01'}))
+    loader.neo4j_config['management'] = {'verify_after_load': True}
+
+    with caplog.at_level(logging.WARNING, logger='core.unified_dataloader'):
+        # The writes ran, so the load succeeds; the missing system is reported
+        assert loader.load_systems_and_events(systems, [])
+    assert "missing after load: db-01" in caplog.text
+
+    caplog.clear()
+    loader.driver.failures[_PREPARED['verify_systems']] = RuntimeError("read timed out")
+    with caplog.at_level(logging.WARNING, logger='core.unified_dataloader'):
+        assert loader.load_systems_and_events(systems, [])
+    assert "Load verification failed: read timed out" in caplog.text
+
+
+def test_graph_stats_keys():
+    driver = _FakeDriver()
+
+    assert _loader(driver).get_graph_stats() == {'nodes': 7, 'relationships': 5, 'systems': 2, 'events': 3}
+    assert driver.queries == [(_PREPARED['graph_stats'], {})]
+
+
+def test_graph_stats_without_driver():
+    assert _loader(None).get_graph_stats() == {'nodes': 0, 'relationships': 0, 'systems': 0, 'events': 0}
+
+
+def test_load_reports_graph_stats_when_verifying(caplog):
+    driver = _FakeDriver(existing={'web-01'})
+    loader = _loader(driver)
+
+    assert loader.load_systems_and_events([SystemEntity(system_id='web-01')], [])
+    assert (_PREPARED['graph_stats'], {}) not in driver.queries
+
+    loader.neo4j_config['management'] = {'verify_after_load': True}
+    with caplog.at_level(logging.INFO, logger='core.unified_dataloader'):
+        assert loader.load_systems_and_events([SystemEntity(system_id='web-01')], [])
+    assert "Graph totals: 7 nodes, 5 relationships (2 systems, 3 events)" in caplog.text
+
+
+def test_failing_graph_stats_do_not_fail_the_load(caplog):
+    driver = _FakeDriver(existing={'web-01'}, failures={_PREPARED['graph_stats']: RuntimeError("count store busy")})
+    loader = _loader(driver)
+    loader.neo4j_config['management'] = {'verify_after_load': True}
+
+    with caplog.at_level(logging.WARNING, logger='core.unified_dataloader'):
+        assert loader.load_systems_and_events([SystemEntity(system_id='web-01')], [])
+    assert "Graph stats unavailable: count store busy" in caplog.text
+
+
+@pytest.fixture
+def fresh_schema_cache(monkeypatch):
+    monkeypatch.setattr(unified_dataloader, '_SCHEMA_READY', set())
+
+
+def _schema_runs(driver):
+    return [query for query, _ in driver.queries if query in _SCHEMA_STATEMENTS]
+
+
+def test_schema_created_once_per_database(fresh_schema_cache):
+    driver = _FakeDriver()
+
+    _loader(driver)._create_indexes_and_constraints(driver.session())
+    _loader(driver)._create_indexes_and_constraints(driver.session())
+
+    assert _schema_runs(driver) == list(_SCHEMA_STATEMENTS)
+
+
+def test_rejected_constraint_keeps_the_other_indexes(fresh_schema_cache):
+    rejected = _SCHEMA_STATEMENTS[0]
+    driver = _FakeDriver(failures={rejected: _Neo4jError('Neo.ClientError.Schema.ConstraintCreationFailed')})
+
+    _loader(driver)._create_indexes_and_constraints(driver.session())
+
+    # The one-transaction attempt stops at the constraint; every statement is then tried on its own
+    assert _schema_runs(driver) == [rejected] + list(_SCHEMA_STATEMENTS)
+    # The rejection is deterministic, so later loaders don't retry it
+    driver.queries.clear()
+    _loader(driver)._create_indexes_and_constraints(driver.session())
+    assert driver.queries == []
+
+
+def test_schema_retried_when_nothing_was_created(fresh_schema_cache):
+    error = _Neo4jError('Neo.TransientError.General.DatabaseUnavailable')
+    driver = _FakeDriver(failures={statement: error for statement in _SCHEMA_STATEMENTS})
+
+    _loader(driver)._create_indexes_and_constraints(driver.session())
+    driver.failures.clear()
+    _loader(driver)._create_indexes_and_constraints(driver.session())
+
+    assert _schema_runs(driver)[-len(_SCHEMA_STATEMENTS):] == list(_SCHEMA_STATEMENTS)
+    assert ('neo4j://localhost:7687', 'graphs') in unified_dataloader._SCHEMA_READY
+
+
+@pytest.fixture
+def fresh_database_caches(monkeypatch):
+    monkeypatch.setattr(unified_dataloader, '_ENSURED_DBS', {})
+    monkeypatch.setattr(unified_dataloader, '_DATABASES_CACHE', {})
+
+
+def test_community_fallback_is_remembered(fresh_database_caches):
+    driver = _FakeDriver(failures={
+        CREATE_DATABASE: _Neo4jError('Neo.ClientError.Statement.UnsupportedAdministrationCommand'),
+    })
+
+    first = _loader(driver)
+    first._ensure_database_exists()
+    assert first.database == 'neo4j'
+    assert [query for query, _ in driver.queries] == [SHOW_DATABASES, CREATE_DATABASE]
+
+    # A later loader for the same database falls back without SHOW DATABASES or CREATE DATABASE
+    driver.queries.clear()
+    unified_dataloader._DATABASES_CACHE.clear()
+    second = _loader(driver)
+    second._ensure_database_exists()
+    assert second.database == 'neo4j'
+    assert second.neo4j_config['database'] == 'neo4j'
+    assert driver.queries == []
+
+
+def test_created_database_is_remembered(fresh_database_caches):
+    driver = _FakeDriver()
+
+    _loader(driver)._ensure_database_exists()
+    driver.queries.clear()
+    loader = _loader(driver)
+    loader._ensure_database_exists()
+
+    assert loader.database == 'graphs'
+    assert driver.queries == []
@@ -0,0 +1,56 @@
+"""Tests for the shared Neo4j driver cache (GraphDatabase is replaced, no server needed)"""
+
+import pytest
+
+import core.neo4j_driver as neo4j_driver
+from core.neo4j_driver import close_all_drivers, driver_options, get_driver
+
+
+class _FakeDriver:
+    def __init__(self, uri, auth, **options):
+        self.uri, self.auth, self.options = uri, auth, options
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class _FakeGraphDatabase:
+    driver = _FakeDriver
+
+
+@pytest.fixture(autouse=True)
+def fake_graph_database(monkeypatch):
+    monkeypatch.setattr(neo4j_driver, 'GraphDatabase', _FakeGraphDatabase, raising=False)
+    close_all_drivers()
+    yield
+    close_all_drivers()
+
+
+def test_default_options_match_driver_options():
+    driver = get_driver('neo4j://localhost:7687', ('neo4j', 'password'))
+
+    assert driver.options == driver_options({})
+
+
+def test_defaults_and_config_options_share_one_driver():
+    auth = ('neo4j', 'password')
+    config = {'management': {'max_connections': 50, 'connection_acquisition_timeout': 60.0}}
+
+    assert get_driver('neo4j://localhost:7687', auth) is get_driver('neo4j://localhost:7687', auth, **driver_options(config))
+
+
+def test_different_options_get_separate_drivers():
+    auth = ('neo4j', 'password')
+    small_pool = driver_options({'management': {'max_connections': 5}})
+
+    assert get_driver('neo4j://localhost:7687', auth) is not get_driver('neo4j://localhost:7687', auth, **small_pool)
+
+
+def test_close_all_drivers_closes_and_forgets():
+    driver = get_driver('neo4j://localhost:7687', ('neo4j', 'password'))
+
+    close_all_drivers()
+
+    assert driver.closed
+    assert get_driver('neo4j://localhost:7687', ('neo4j', 'password')) is not driver
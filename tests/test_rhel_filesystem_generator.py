@@ -0,0 +1,40 @@
+"""Seeded runs of the RHEL filesystem generator must not depend on the worker count"""
+
+import random
+
+import pytest
+
+from utils import rhel_filesystem_generator as generator_module
+from utils.rhel_filesystem_generator import RHELFilesystemGenerator
+
+
+class _FixedDatetime(generator_module.datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2024, 9, 30, 12, 0, 0)
+
+
+@pytest.fixture(autouse=True)
+def fixed_clock(monkeypatch):
+    monkeypatch.setattr(generator_module, 'datetime', _FixedDatetime)
+
+
+def _generate(base_path, max_workers, seed=1234):
+    random.seed(seed)
+    RHELFilesystemGenerator(str(base_path), num_systems=12).generate_all_systems(max_workers=max_workers)
+    return {str(path.relative_to(base_path)): path.read_bytes()
+            for path in sorted(base_path.rglob('*')) if path.is_file()}
+
+
+def test_seeded_output_is_independent_of_workers(tmp_path, capsys):
+    serial = _generate(tmp_path / 'serial', max_workers=1)
+    serial_out = capsys.readouterr().out
+    concurrent = _generate(tmp_path / 'concurrent', max_workers=8)
+
+    assert serial and serial == concurrent
+    # Progress is printed by the caller in system order, not by the workers
+    assert capsys.readouterr().out == serial_out
+
+
+def test_different_seeds_give_different_trees(tmp_path):
+    assert _generate(tmp_path / 'a', max_workers=4, seed=1) != _generate(tmp_path / 'b', max_workers=4, seed=2)
@@ -0,0 +1,29 @@
+"""Tests for UniversalDataLoader settings that need no data source, LLM or Neo4j"""
+
+from core.unified_dataloader import UniversalDataLoader
+
+
+class _PipelineConfig:
+    def __init__(self, ingestion):
+        self.ingestion = ingestion
+
+    def get_pipeline_config(self):
+        return {'phases': {'ingestion': self.ingestion}}
+
+
+def _loader(ingestion):
+    """UniversalDataLoader without __init__ (which builds every component)"""
+    loader = UniversalDataLoader.__new__(UniversalDataLoader)
+    loader.config_loader = _PipelineConfig(ingestion)
+    return loader
+
+
+def test_systems_load_serially_by_default():
+    # parallel_processing alone (set in the shipped YAML) does not turn on concurrent loading
+    assert _loader({'parallel_processing': True, 'max_workers': 4})._get_ingestion_workers() == 1
+
+
+def test_concurrent_systems_is_opt_in():
+    assert _loader({'concurrent_systems': True, 'max_workers': 3})._get_ingestion_workers() == 3
+    assert _loader({'concurrent_systems': True})._get_ingestion_workers() == 4
+    assert _loader({'concurrent_systems': True, 'max_workers': 0})._get_ingestion_workers() == 1
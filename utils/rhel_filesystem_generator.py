@@ -7,10 +7,137 @@ Simulates enterprise RHEL environments without needing SSH access to real system
 import os
 import random
 import json
+import shutil
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from itertools import accumulate
 from datetime import datetime, timedelta
 from typing import Dict, List, Any
 from pathlib import Path
 
+# Base packages on every system, and the pool extra packages are sampled from
+BASE_PACKAGES = ("kernel", "glibc", "openssl", "systemd", "openssh")
+ADDITIONAL_PACKAGES = (
+    "bash-5.1.8-4.el9", "coreutils-8.32-31.el9", "grep-3.6-5.el9",
+    "sed-4.8-9.el9", "gawk-5.1.0-6.el9", "tar-1.34-3.el9",
+    "vim-enhanced-8.2.2637-16.el9", "wget-1.21.1-7.el9"
+)
+
+# Non-prop_ config keys exported as Server node properties
+SERVER_NODE_FIELDS = frozenset({"environment", "criticality", "datacenter"})
+
+# Environment -> (hostname suffix, IP prefix) for generated enterprise systems
+ENVIRONMENT_NAMING = {
+    "production": ("prod", "10.1"),
+    "staging": ("stage", "10.2"),
+    "development": ("dev", "192.168"),
+    "testing": ("test", "172.16"),
+    "dr": ("dr", "172.16")
+}
+
+# Directories every system needs (parents included), created once per system
+SYSTEM_DIRS = (
+    "etc/yum.repos.d", "etc/rhsm", "etc/security", "etc/oval", "etc/pam.d", "etc/sudoers.d",
+    "etc/sysconfig/network-scripts", "etc/firewalld/zones",
+    "var/lib/rpm", "var/lib/yum/history", "var/lib/insights/client-results", "var/lib/openscap",
+    "var/log/audit", "var/log/sa", "var/metrics",
+    "usr/lib/systemd/system", "proc", "root"
+)
+
+# Availability SLA per criticality level
+SLA_BY_CRITICALITY = {
+    "critical": "99.99",
+    "high": "99.95",
+    "medium": "99.9",
+    "low": "99.5"
+}
+
+# Static file contents, identical on every system (bytes, written as-is)
+LIMITS_CONF = b"""# /etc/security/limits.conf
+#
+# Security limits for RHEL systems
+root soft nofile 65536
+root hard nofile 65536
+* soft nofile 4096
+* hard nofile 8192
+
+# Memory limits
+* soft memlock unlimited
+* hard memlock unlimited
+"""
+
+PAM_SSHD_CONF = b"""#%PAM-1.0
+auth       required     pam_sepermit.so
+auth       substack     password-auth
+auth       include      postlogin
+# Used with polkit to reauthorize users in remote sessions
+-auth      optional     pam_reauthorize.so prepare
+account    required     pam_nologin.so
+account    include      password-auth
+password   include      password-auth
+# pam_selinux.so close should be the first session rule
+session    required     pam_selinux.so close
+session    required     pam_loginuid.so
+# pam_selinux.so open should only be followed by sessions to be executed in the user context
+session    required     pam_selinux.so open env_params
+session    required     pam_namespace.so
+session    optional     pam_keyinit.so force revoke
+session    include      password-auth
+session    include      postlogin
+# Used with polkit to reauthorize users in remote sessions
+-session   optional     pam_reauthorize.so prepare"""
+
+SUDOERS_APPLICATION_USERS = b"""# Application service accounts
+apache ALL=(ALL) NOPASSWD: /bin/systemctl restart httpd, /bin/systemctl reload httpd
+mysql ALL=(ALL) NOPASSWD: /bin/systemctl restart mysql, /bin/systemctl stop mysql
+# Emergency access for platform team
+%platform_engineering ALL=(ALL) ALL
+# Monitoring user
+monitoring ALL=(ALL) NOPASSWD: /bin/ps, /bin/netstat, /bin/ss, /usr/bin/top
+"""
+
+FIREWALLD_PUBLIC_ZONE = b"""<?xml version="1.0" encoding="utf-8"?>
+<zone>
+  <short>Public</short>
+  <description>For use in public areas</description>
+  <service name="ssh"/>
+  <service name="http"/>
+  <service name="https"/>
+  <port port="8080" protocol="tcp"/>
+  <rule family="ipv4">
+    <source address="192.168.100.0/24"/>
+    <drop/>
+  </rule>
+</zone>"""
+
+ETC_PASSWD = b"""root:x:0:0:root:/root:/bin/bash
+bin:x:1:1:bin:/bin:/sbin/nologin
+daemon:x:2:2:daemon:/sbin:/sbin/nologin
+adm:x:3:4:adm:/var/adm:/sbin/nologin
+lp:x:4:7:lp:/var/spool/lpd:/sbin/nologin
+sync:x:5:0:sync:/sbin:/bin/sync
+shutdown:x:6:0:shutdown:/sbin:/sbin/shutdown
+halt:x:7:0:halt:/sbin:/sbin/halt
+mail:x:8:12:mail:/var/spool/mail:/sbin/nologin
+operator:x:11:0:operator:/root:/sbin/nologin
+games:x:12:100:games:/usr/games:/sbin/nologin
+ftp:x:14:50:FTP User:/var/ftp:/sbin/nologin
+nobody:x:65534:65534:Kernel Overflow User:/:/sbin/nologin
+dbus:x:81:81:System message bus:/:/sbin/nologin
+systemd-coredump:x:999:997:systemd Core Dumper:/:/sbin/nologin
+systemd-resolve:x:193:193:systemd Resolver:/:/sbin/nologin
+tss:x:59:59:Account used for TPM access:/dev/null:/sbin/nologin
+polkitd:x:998:996:User for polkitd:/:/sbin/nologin
+libstoragemgmt:x:997:995:daemon account for libstoragemgmt:/var/run/lsm:/sbin/nologin
+cockpit-ws:x:996:994:User for cockpit web service:/nonexisting:/sbin/nologin
+cockpit-wsinstance:x:995:993:User for cockpit-ws instances:/nonexisting:/sbin/nologin
+sssd:x:994:992:User for sssd:/:/sbin/nologin
+sshd:x:74:74:Privilege-separated SSH:/var/empty/sshd:/sbin/nologin
+chrony:x:993:991::/var/lib/chrony:/sbin/nologin
+apache:x:48:48:Apache:/usr/share/httpd:/sbin/nologin
+mysql:x:27:27:MySQL Server:/var/lib/mysql:/sbin/nologin
+monitoring:x:1001:1001:Monitoring User:/home/monitoring:/bin/bash"""
+
 class RHELFilesystemGenerator:
     """Generates realistic RHEL filesystem content for development/testing and Graph RAG agents"""
     
@@ -28,6 +155,7 @@ class RHELFilesystemGenerator:
         
         # Initialize packages and metadata
         self._initialize_packages()
+        self._hosts_cache = None
     
     def _get_hardcoded_systems(self):
         """Original hardcoded systems for small deployments"""
@@ -201,6 +329,10 @@ class RHELFilesystemGenerator:
             ("8.8", "4.18.0-477.27.1.el8_8.x86_64", 0.1)
         ]
         
+        # Cumulative weights built once; random.choices would otherwise re-accumulate them per draw
+        env_cum_weights = list(accumulate(env_weights))
+        rhel_cum_weights = list(accumulate(w[2] for w in rhel_versions))
+        
         # Generate systems
         system_counter = 1
         for i in range(num_systems):
@@ -208,39 +340,22 @@ class RHELFilesystemGenerator:
             system_type = random.choice(system_types)
             
             # Select environment (weighted towards production)
-            environment = random.choices(environments, weights=env_weights)[0]
+            environment = random.choices(environments, cum_weights=env_cum_weights)[0]
             
             # Generate system name
-            if environment == "production":
-                system_name = f"{system_type['prefix']}-prod-{system_counter:02d}"
-            elif environment == "staging":
-                system_name = f"{system_type['prefix']}-stage-{system_counter:02d}"
-            elif environment == "development":
-                system_name = f"{system_type['prefix']}-dev-{system_counter:02d}"
-            elif environment == "testing":
-                system_name = f"{system_type['prefix']}-test-{system_counter:02d}"
-            else:  # dr
-                system_name = f"{system_type['prefix']}-dr-{system_counter:02d}"
+            env_suffix, ip_base = ENVIRONMENT_NAMING[environment]
+            system_name = f"{system_type['prefix']}-{env_suffix}-{system_counter:02d}"
             
             # Select RHEL version (weighted)
-            rhel_info = random.choices(rhel_versions, weights=[w[2] for w in rhel_versions])[0]
+            rhel_info = random.choices(rhel_versions, cum_weights=rhel_cum_weights)[0]
             
             # Generate realistic hardware specs
             cpu_cores = random.randint(*system_type["cpu_range"])
             memory_gb = random.choice([8, 16, 32, 64, 96, 128, 192, 256])
             disk_gb = random.choice([100, 200, 500, 1000, 2000, 4000])
             
-            # Generate IP address based on datacenter and environment
+            # Generate IP address based on datacenter and environment (prefix from ENVIRONMENT_NAMING)
             datacenter = random.choice(datacenters)
-            if environment == "production":
-                ip_base = "10.1"
-            elif environment == "staging":
-                ip_base = "10.2"
-            elif environment == "development":
-                ip_base = "192.168"
-            else:
-                ip_base = "172.16"
-            
             subnet = random.randint(1, 254)
             host = random.randint(10, 250)
             ip_address = f"{ip_base}.{subnet}.{host}"
@@ -259,14 +374,6 @@ class RHELFilesystemGenerator:
             else:
                 criticality = "low"
             
-            # Generate SLA based on criticality
-            sla_map = {
-                "critical": "99.99",
-                "high": "99.95",
-                "medium": "99.9",
-                "low": "99.5"
-            }
-            
             systems[system_name] = {
                 "environment": environment,
                 "rhel_version": rhel_info[0],
@@ -282,7 +389,7 @@ class RHELFilesystemGenerator:
                 "prop_disk_gb": str(disk_gb),
                 "prop_business_service": business_service,
                 "prop_team_owner": team_owner,
-                "prop_sla_availability": sla_map[criticality]
+                "prop_sla_availability": SLA_BY_CRITICALITY[criticality]
             }
             
             system_counter += 1
@@ -409,18 +516,35 @@ class RHELFilesystemGenerator:
             {"source": "security_001", "target": "web-prod-01", "type": "TARGETED", "prop_endpoint": "/api/users"},
         ]
     
-    def generate_all_systems(self):
-        """Generate realistic files for all simulated systems (enhanced for Graph RAG agents)"""
+    def generate_all_systems(self, max_workers: int = 8):
+        """Generate realistic files for all simulated systems (enhanced for Graph RAG agents)
+
+        Systems live in separate subtrees, so they are generated concurrently. Each system
+        draws from its own random.Random seeded from one draw of the module-level generator,
+        so a seeded run (random.seed(n)) gives the same trees for any max_workers
+        """
         print(f"🏗️ Generating {len(self.systems)} realistic RHEL systems for Graph RAG agents...")
         
         # Progress tracking for large deployments
         total_systems = len(self.systems)
-        for i, (system_id, config) in enumerate(self.systems.items(), 1):
-            if total_systems > 10:
-                print(f"   📁 Generating {system_id} ({config['environment']}) - {i}/{total_systems}")
-            else:
-                print(f"   📁 Generating {system_id} ({config['environment']})...")
-            self.generate_system_files(system_id, config)
+        base_seed = random.getrandbits(64)
+        
+        def generate(item):
+            system_id, config = item
+            return self.generate_system_files(system_id, config, random.Random(f"{base_seed}:{system_id}"))
+        
+        # Shared /etc/hosts text is built before the workers start
+        self._hosts_content()
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, total_systems))) as pool:
+            # Progress is printed here, in system order; map() re-raises the first worker exception
+            items = list(self.systems.items())
+            for i, ((system_id, config), removed) in enumerate(zip(items, pool.map(generate, items)), 1):
+                for line in removed:
+                    print(line)
+                if total_systems > 10:
+                    print(f"   📁 Generated {system_id} ({config['environment']}) - {i}/{total_systems}")
+                else:
+                    print(f"   📁 Generated {system_id} ({config['environment']})")
         
         # Generate agent-compatible metadata (NEW)
         self.generate_agent_metadata()
@@ -428,50 +552,59 @@ class RHELFilesystemGenerator:
         print(" All simulated RHEL systems generated successfully!")
         print("🤖 Agent-compatible metadata generated for Graph RAG")
     
-    def generate_system_files(self, system_id: str, config: Dict):
-        """Generate all critical files for a single system"""
+    def generate_system_files(self, system_id: str, config: Dict, rng: random.Random = None) -> List[str]:
+        """
+        Generate all critical files for a single system
+
+        rng defaults to one seeded from the module-level random. Returns the cleanup
+        messages, which the caller prints so concurrent systems don't interleave output
+        """
+        if rng is None:
+            rng = random.Random(random.getrandbits(64))
         system_path = self.base_path / system_id
         
+        # One pass over the directory layout instead of a mkdir in every _generate_* method
+        for directory in SYSTEM_DIRS:
+            (system_path / directory).mkdir(parents=True, exist_ok=True)
+        
         # Generate all critical file types
         self._generate_redhat_release(system_path, config)
         self._generate_yum_config(system_path, config)
-        self._generate_yum_repos(system_path, config)
+        self._generate_yum_repos(system_path, config, rng)
         self._generate_rhsm_config(system_path, config)
-        self._generate_rpm_database(system_path, config)
-        self._generate_yum_logs(system_path, config)
-        self._generate_dnf_logs(system_path, config)
-        self._generate_system_logs(system_path, config)
-        self._generate_audit_logs(system_path, config)
-        self._generate_yum_history(system_path, config)
+        self._generate_rpm_database(system_path, config, rng)
+        self._generate_yum_logs(system_path, config, rng)
+        self._generate_dnf_logs(system_path, config, rng)
+        self._generate_system_logs(system_path, config, rng)
+        self._generate_audit_logs(system_path, config, rng)
+        self._generate_yum_history(system_path, config, rng)
         self._generate_systemd_services(system_path, config)
-        self._generate_proc_files(system_path, config)
+        self._generate_proc_files(system_path, config, rng)
         self._generate_security_configs(system_path, config)
         
         # Generate agent-compatible operational data (NEW)
-        self._generate_agent_operational_logs(system_path, config, system_id)
-        self._generate_performance_metrics(system_path, config)
+        self._generate_agent_operational_logs(system_path, config, system_id, rng)
+        self._generate_performance_metrics(system_path, config, rng)
         self._generate_network_topology_files(system_path, config)
         
         # Generate authentic RHEL compliance data (NEW)
-        self._generate_authentic_compliance_data(system_path, config)
+        self._generate_authentic_compliance_data(system_path, config, rng)
         
         # Generate specialized agent data (NEW - for Graph RAG agents)
         self._generate_security_agent_data(system_path, config, system_id)
-        self._generate_performance_agent_data(system_path, config)
-        self._generate_compliance_agent_data(system_path, config)
+        self._generate_performance_agent_data(system_path, config, rng)
+        self._generate_compliance_agent_data(system_path, config, rng)
         self._generate_approval_gate_data(system_path, config)
         
         # Clean up any fake directories and files that don't exist on real RHEL (AUTHENTICITY FIX)
-        self._cleanup_fake_directories(system_path)
-        self._cleanup_fake_files(system_path)
+        return self._cleanup_fake_directories(system_path) + self._cleanup_fake_files(system_path)
     
     def _generate_redhat_release(self, system_path: Path, config: Dict):
         """Generate /etc/redhat-release"""
         release_file = system_path / "etc" / "redhat-release"
-        release_file.parent.mkdir(parents=True, exist_ok=True)
         
         content = f"Red Hat Enterprise Linux release {config['rhel_version']} (Plow)"
-        release_file.write_text(content)
+        release_file.write_bytes(content.encode())
     
     def _generate_yum_config(self, system_path: Path, config: Dict):
         """Generate /etc/yum.conf"""
@@ -508,18 +641,19 @@ bandwidth=1024
 exclude=kernel* firefox* thunderbird*
 {"installroot=/mnt/sysimage" if config.get("environment") == "staging" else ""}
 """
-        yum_conf.write_text(content)
+        yum_conf.write_bytes(content.encode())
     
-    def _generate_yum_repos(self, system_path: Path, config: Dict):
+    def _generate_yum_repos(self, system_path: Path, config: Dict, rng: random.Random):
         """Generate /etc/yum.repos.d/*.repo files"""
         repos_dir = system_path / "etc" / "yum.repos.d"
-        repos_dir.mkdir(parents=True, exist_ok=True)
+        rhel_version = config['rhel_version']
+        major = rhel_version.split('.', 1)[0]
         
         # Red Hat repositories
         rhel_repo = repos_dir / "redhat.repo"
-        rhel_content = f"""[rhel-{config['rhel_version']}-for-x86_64-baseos-rpms]
-name=Red Hat Enterprise Linux {config['rhel_version']} for x86_64 - BaseOS (RPMs)
-baseurl=https://cdn.redhat.com/content/dist/rhel{config['rhel_version'].split('.')[0]}/
+        rhel_content = f"""[rhel-{rhel_version}-for-x86_64-baseos-rpms]
+name=Red Hat Enterprise Linux {rhel_version} for x86_64 - BaseOS (RPMs)
+baseurl=https://cdn.redhat.com/content/dist/rhel{major}/
 enabled=1
 gpgcheck=1
 gpgkey=file:///etc/pki/rpm-gpg/RPM-GPG-KEY-redhat-release
@@ -530,33 +664,32 @@ sslclientcert=/etc/pki/entitlement/cert.pem
 metadata_expire=86400
 enabled_metadata=1
 
-[rhel-{config['rhel_version']}-for-x86_64-appstream-rpms]
-name=Red Hat Enterprise Linux {config['rhel_version']} for x86_64 - AppStream (RPMs)
-baseurl=https://cdn.redhat.com/content/dist/rhel{config['rhel_version'].split('.')[0]}/
+[rhel-{rhel_version}-for-x86_64-appstream-rpms]
+name=Red Hat Enterprise Linux {rhel_version} for x86_64 - AppStream (RPMs)
+baseurl=https://cdn.redhat.com/content/dist/rhel{major}/
 enabled=1
 gpgcheck=1
 gpgkey=file:///etc/pki/rpm-gpg/RPM-GPG-KEY-redhat-release
 sslverify=1
 metadata_expire=86400
 """
-        rhel_repo.write_text(rhel_content)
+        rhel_repo.write_bytes(rhel_content.encode())
         
         # EPEL repository (if applicable)
-        if random.choice([True, False]):
+        if rng.choice([True, False]):
             epel_repo = repos_dir / "epel.repo"
             epel_content = f"""[epel]
-name=Extra Packages for Enterprise Linux {config['rhel_version'].split('.')[0]} - x86_64
-baseurl=https://download.fedoraproject.org/pub/epel/{config['rhel_version'].split('.')[0]}/Everything/x86_64/
+name=Extra Packages for Enterprise Linux {major} - x86_64
+baseurl=https://download.fedoraproject.org/pub/epel/{major}/Everything/x86_64/
 enabled=1
 gpgcheck=1
-gpgkey=file:///etc/pki/rpm-gpg/RPM-GPG-KEY-EPEL-{config['rhel_version'].split('.')[0]}
+gpgkey=file:///etc/pki/rpm-gpg/RPM-GPG-KEY-EPEL-{major}
 """
-            epel_repo.write_text(epel_content)
+            epel_repo.write_bytes(epel_content.encode())
     
     def _generate_rhsm_config(self, system_path: Path, config: Dict):
         """Generate /etc/rhsm/rhsm.conf"""
         rhsm_conf = system_path / "etc" / "rhsm" / "rhsm.conf"
-        rhsm_conf.parent.mkdir(parents=True, exist_ok=True)
         
         content = f"""[server]
 hostname=subscription.rhsm.redhat.com
@@ -578,86 +711,79 @@ full_refresh_on_yum=1
 [logging]
 default_log_level=INFO
 """
-        rhsm_conf.write_text(content)
+        rhsm_conf.write_bytes(content.encode())
     
-    def _generate_rpm_database(self, system_path: Path, config: Dict):
+    def _generate_rpm_database(self, system_path: Path, config: Dict, rng: random.Random):
         """Generate RPM database info"""
         rpm_dir = system_path / "var" / "lib" / "rpm"
-        rpm_dir.mkdir(parents=True, exist_ok=True)
         
         # Generate a realistic package list
         packages_file = rpm_dir / "packages.txt"
-        package_list = []
+        packages = self.packages
         
         # Include system packages based on services
-        for service in config['services']:
-            if service in self.packages:
-                package_list.append(f"{service}-{self.packages[service]}")
+        package_list = [f"{service}-{packages[service]}" for service in config['services'] if service in packages]
         
         # Add common system packages
-        for pkg in ["kernel", "glibc", "openssl", "systemd", "openssh"]:
-            if pkg in self.packages:
-                package_list.append(f"{pkg}-{self.packages[pkg]}")
+        package_list.extend(f"{pkg}-{packages[pkg]}" for pkg in BASE_PACKAGES if pkg in packages)
         
         # Add random additional packages
-        additional_packages = [
-            "bash-5.1.8-4.el9", "coreutils-8.32-31.el9", "grep-3.6-5.el9",
-            "sed-4.8-9.el9", "gawk-5.1.0-6.el9", "tar-1.34-3.el9",
-            "vim-enhanced-8.2.2637-16.el9", "wget-1.21.1-7.el9"
-        ]
-        package_list.extend(random.sample(additional_packages, 5))
+        package_list.extend(rng.sample(ADDITIONAL_PACKAGES, 5))
         
-        packages_file.write_text("\n".join(sorted(package_list)))
+        packages_file.write_bytes("\n".join(sorted(package_list)).encode())
     
-    def _generate_yum_logs(self, system_path: Path, config: Dict):
+    def _generate_yum_logs(self, system_path: Path, config: Dict, rng: random.Random):
         """Generate /var/log/yum.log"""
         log_file = system_path / "var" / "log" / "yum.log"
-        log_file.parent.mkdir(parents=True, exist_ok=True)
         
         log_entries = []
         
+        # Success/failure based on system and patch type
+        base_success_rate = 0.9 if config['environment'] == 'staging' else 0.85
+        
+        now = datetime.now()
         # Generate realistic patch events over the last 90 days
         for i in range(20):
-            days_ago = random.randint(1, 90)
-            timestamp = datetime.now() - timedelta(days=days_ago)
+            days_ago = rng.randint(1, 90)
+            timestamp = now - timedelta(days=days_ago)
             
             # Pick a random patch
-            patch = random.choice(self.patches)
+            patch = rng.choice(self.patches)
             packages = patch['packages']
             
-            # Success/failure based on system and patch type
-            success_rate = 0.9 if config['environment'] == 'staging' else 0.85
+            success_rate = base_success_rate
             if patch['id'] == 'RHSA-2024-1234':  # Known problematic patch
                 success_rate = 0.7
             
-            success = random.random() < success_rate
+            success = rng.random() < success_rate
+            stamp = timestamp.strftime('%b %d %H:%M:%S')
             
             for package in packages:
                 if package in self.packages:
                     if success:
                         log_entries.append(
-                            f"{timestamp.strftime('%b %d %H:%M:%S')} Updated: {package}-{self.packages[package]}"
+                            f"{stamp} Updated: {package}-{self.packages[package]}"
                         )
                     else:
                         log_entries.append(
-                            f"{timestamp.strftime('%b %d %H:%M:%S')} Failed: {package}-{self.packages[package]} - Transaction failed"
+                            f"{stamp} Failed: {package}-{self.packages[package]} - Transaction failed"
                         )
         
-        log_file.write_text("\n".join(sorted(log_entries, reverse=True)))
+        log_file.write_bytes("\n".join(sorted(log_entries, reverse=True)).encode())
     
-    def _generate_dnf_logs(self, system_path: Path, config: Dict):
+    def _generate_dnf_logs(self, system_path: Path, config: Dict, rng: random.Random):
         """Generate /var/log/dnf.log for RHEL 8+"""
-        if config['rhel_version'].startswith('8') or config['rhel_version'].startswith('9'):
+        if config['rhel_version'].startswith(('8', '9')):
             log_file = system_path / "var" / "log" / "dnf.log"
-            log_file.parent.mkdir(parents=True, exist_ok=True)
             
             # Similar to yum.log but with DNF format
             log_entries = []
+            now = datetime.now()
             for i in range(15):
-                days_ago = random.randint(1, 60)
-                timestamp = datetime.now() - timedelta(days=days_ago)
+                days_ago = rng.randint(1, 60)
+                timestamp = now - timedelta(days=days_ago)
                 
-                patch = random.choice(self.patches)
+                patch = rng.choice(self.patches)
                 log_entries.append(
                     f"{timestamp.isoformat()} INFO dnf: {patch['id']} transaction started"
                 )
@@ -665,80 +791,82 @@ default_log_level=INFO
                     f"{timestamp.isoformat()} INFO dnf: {len(patch['packages'])} packages to update"
                 )
             
-            log_file.write_text("\n".join(sorted(log_entries, reverse=True)))
+            log_file.write_bytes("\n".join(sorted(log_entries, reverse=True)).encode())
     
-    def _generate_system_logs(self, system_path: Path, config: Dict):
+    def _generate_system_logs(self, system_path: Path, config: Dict, rng: random.Random):
         """Generate /var/log/messages"""
         log_file = system_path / "var" / "log" / "messages"
-        log_file.parent.mkdir(parents=True, exist_ok=True)
         
         log_entries = []
+        hostname = config.get('hostname', 'localhost')
         
+        now = datetime.now()
         # Generate system events related to patching
         for i in range(30):
-            days_ago = random.randint(1, 30)
-            timestamp = datetime.now() - timedelta(days=days_ago)
+            days_ago = rng.randint(1, 30)
+            timestamp = now - timedelta(days=days_ago)
+            stamp = timestamp.strftime('%b %d %H:%M:%S')
             
             events = [
-                f"{timestamp.strftime('%b %d %H:%M:%S')} {config.get('hostname', 'localhost')} systemd[1]: Started dnf automatic.",
-                f"{timestamp.strftime('%b %d %H:%M:%S')} {config.get('hostname', 'localhost')} kernel: SELinux: policy loaded",
-                f"{timestamp.strftime('%b %d %H:%M:%S')} {config.get('hostname', 'localhost')} systemd[1]: Reloading.",
-                f"{timestamp.strftime('%b %d %H:%M:%S')} {config.get('hostname', 'localhost')} yum[12345]: Updated: httpd-2.4.53-11.el9_2.5.x86_64"
+                f"{stamp} {hostname} systemd[1]: Started dnf automatic.",
+                f"{stamp} {hostname} kernel: SELinux: policy loaded",
+                f"{stamp} {hostname} systemd[1]: Reloading.",
+                f"{stamp} {hostname} yum[12345]: Updated: httpd-2.4.53-11.el9_2.5.x86_64"
             ]
-            log_entries.extend(random.sample(events, 2))
+            log_entries.extend(rng.sample(events, 2))
         
-        log_file.write_text("\n".join(sorted(log_entries, reverse=True)))
+        log_file.write_bytes("\n".join(sorted(log_entries, reverse=True)).encode())
     
-    def _generate_audit_logs(self, system_path: Path, config: Dict):
+    def _generate_audit_logs(self, system_path: Path, config: Dict, rng: random.Random):
         """Generate /var/log/audit/audit.log"""
         audit_dir = system_path / "var" / "log" / "audit"
-        audit_dir.mkdir(parents=True, exist_ok=True)
         
         log_file = audit_dir / "audit.log"
         
         # Generate SELinux and security events
         log_entries = []
+        # Audit records carry epoch seconds: plain integer deltas, no datetime per entry
+        now_epoch = int(datetime.now().timestamp())
         for i in range(50):
-            timestamp = int((datetime.now() - timedelta(days=random.randint(1, 7))).timestamp())
+            timestamp = now_epoch - rng.randint(1, 7) * 86400
             
             events = [
                 f"type=SOFTWARE_UPDATE msg=audit({timestamp}.123:456): pid=1234 uid=0 auid=0 ses=1 subj=system_u:system_r:rpm_t:s0 msg='software update: package=httpd version=2.4.53-11.el9_2.5 result=success'",
                 f"type=SYSCALL msg=audit({timestamp}.456:789): arch=c000003e syscall=2 success=yes exit=3 a0=7fff12345678 a1=0 a2=1b6 a3=0 items=1 ppid=1 pid=1234 auid=0 uid=0 gid=0 euid=0 suid=0 fsuid=0 egid=0 sgid=0 fsgid=0 tty=pts0 ses=1 comm=yum exe=/usr/bin/python3.9",
                 f"type=SERVICE_START msg=audit({timestamp}.789:012): pid=1 uid=0 auid=4294967295 ses=4294967295 subj=system_u:system_r:init_t:s0 msg='unit=httpd comm=systemd exe=/usr/lib/systemd/systemd hostname=? addr=? terminal=? res=success'"
             ]
-            log_entries.append(random.choice(events))
+            log_entries.append(rng.choice(events))
         
-        log_file.write_text("\n".join(sorted(log_entries, reverse=True)))
+        log_file.write_bytes("\n".join(sorted(log_entries, reverse=True)).encode())
     
-    def _generate_yum_history(self, system_path: Path, config: Dict):
+    def _generate_yum_history(self, system_path: Path, config: Dict, rng: random.Random):
         """Generate /var/lib/yum/history/ transaction data"""
         history_dir = system_path / "var" / "lib" / "yum" / "history"
-        history_dir.mkdir(parents=True, exist_ok=True)
         
         # Generate history database simulation
         history_file = history_dir / "history.txt"
         
         history_entries = []
+        now = datetime.now()
         for i in range(1, 21):
-            days_ago = random.randint(1, 180)
-            timestamp = datetime.now() - timedelta(days=days_ago)
+            days_ago = rng.randint(1, 180)
+            timestamp = now - timedelta(days=days_ago)
             
-            patch = random.choice(self.patches)
-            action = "Update" if random.random() > 0.1 else "Install"
+            patch = rng.choice(self.patches)
+            action = "Update" if rng.random() > 0.1 else "Install"
             
             history_entries.append(
-                f"    {i:2d} | {action:12s} | {timestamp.strftime('%Y-%m-%d %H:%M')} | {len(patch['packages']):3d} |  {random.randint(10, 500):3d} k"
+                f"    {i:2d} | {action:12s} | {timestamp.strftime('%Y-%m-%d %H:%M')} | {len(patch['packages']):3d} |  {rng.randint(10, 500):3d} k"
             )
         
-        header = "ID | Command Line                 | Date and time    | Action(s) | Altered\n"
-        header += "------------------------------------------------------------------------------------\n"
+        header = ("ID | Command Line                 | Date and time    | Action(s) | Altered\n"
+                  "------------------------------------------------------------------------------------\n")
         
-        history_file.write_text(header + "\n".join(history_entries))
+        history_file.write_bytes((header + "\n".join(history_entries)).encode())
     
     def _generate_systemd_services(self, system_path: Path, config: Dict):
         """Generate systemd service files"""
         systemd_dir = system_path / "usr" / "lib" / "systemd" / "system"
-        systemd_dir.mkdir(parents=True, exist_ok=True)
         
         # Generate service files for each service in the config
         for service in config['services']:
@@ -759,67 +887,50 @@ Restart=always
 [Install]
 WantedBy=multi-user.target
 """
-            service_file.write_text(service_content)
+            service_file.write_bytes(service_content.encode())
     
-    def _generate_proc_files(self, system_path: Path, config: Dict):
+    def _generate_proc_files(self, system_path: Path, config: Dict, rng: random.Random):
         """Generate /proc filesystem simulation"""
         proc_dir = system_path / "proc"
-        proc_dir.mkdir(parents=True, exist_ok=True)
         
         # Generate kernel version
         version_file = proc_dir / "version"
-        version_file.write_text(
+        version_file.write_bytes((
             f"Linux version {config['kernel']} (mockbuild@x86-64-01.build.example.com) "
             f"(gcc (GCC) 11.3.1 20220421 (Red Hat 11.3.1-2)) #1 SMP PREEMPT Wed Aug 17 15:54:38 EDT 2023"
-        )
+        ).encode())
         
         # Generate uptime with agent-searchable content
         uptime_file = proc_dir / "uptime"
-        uptime_days = random.randint(1, 365)
-        uptime_seconds = uptime_days * 24 * 3600 + random.randint(0, 86400)
-        uptime_file.write_text(f"{uptime_seconds}.12 {uptime_seconds//2}.34")
+        uptime_days = rng.randint(1, 365)
+        uptime_seconds = uptime_days * 24 * 3600 + rng.randint(0, 86400)
+        uptime_file.write_bytes(f"{uptime_seconds}.12 {uptime_seconds//2}.34".encode())
         
         # Generate additional proc files for agents
         meminfo_file = proc_dir / "meminfo"
         total_mem = int(config.get('prop_memory_gb', '32')) * 1024 * 1024  # KB
-        used_mem = total_mem * random.randint(60, 85) // 100
+        used_mem = total_mem * rng.randint(60, 85) // 100
         meminfo_content = f"""MemTotal:    {total_mem} kB
 MemFree:     {total_mem - used_mem} kB
-MemAvailable: {total_mem - used_mem + random.randint(1000, 5000)} kB
-Buffers:     {random.randint(100000, 500000)} kB
-Cached:      {random.randint(1000000, 3000000)} kB"""
-        meminfo_file.write_text(meminfo_content)
+MemAvailable: {total_mem - used_mem + rng.randint(1000, 5000)} kB
+Buffers:     {rng.randint(100000, 500000)} kB
+Cached:      {rng.randint(1000000, 3000000)} kB"""
+        meminfo_file.write_bytes(meminfo_content.encode())
         
         # Generate command line
         cmdline_file = proc_dir / "cmdline"
-        cmdline_file.write_text(
-            f"BOOT_IMAGE=(hd0,gpt2)/vmlinuz-{config['kernel']} root=UUID=12345678-1234-1234-1234-123456789012 ro rhgb quiet"
-        )
+        cmdline_file.write_bytes(f"BOOT_IMAGE=(hd0,gpt2)/vmlinuz-{config['kernel']} root=UUID=12345678-1234-1234-1234-123456789012 ro rhgb quiet".encode())
     
     def _generate_security_configs(self, system_path: Path, config: Dict):
         """Generate security and compliance configuration files"""
         security_dir = system_path / "etc" / "security"
-        security_dir.mkdir(parents=True, exist_ok=True)
         
         # Generate security limits
         limits_file = security_dir / "limits.conf"
-        limits_content = """# /etc/security/limits.conf
-#
-# Security limits for RHEL systems
-root soft nofile 65536
-root hard nofile 65536
-* soft nofile 4096
-* hard nofile 8192
-
-# Memory limits
-* soft memlock unlimited
-* hard memlock unlimited
-"""
-        limits_file.write_text(limits_content)
+        limits_file.write_bytes(LIMITS_CONF)
         
         # Generate OVAL directory (security compliance)
         oval_dir = system_path / "etc" / "oval"
-        oval_dir.mkdir(parents=True, exist_ok=True)
         
         oval_file = oval_dir / "rhel_definitions.xml"
         oval_content = f"""<?xml version="1.0" encoding="UTF-8"?>
@@ -839,12 +950,11 @@ root hard nofile 65536
     </definitions>
 </oval_definitions>
 """
-        oval_file.write_text(oval_content)
+        oval_file.write_bytes(oval_content.encode())
     
-    def _generate_agent_operational_logs(self, system_path: Path, config: Dict, system_id: str):
+    def _generate_agent_operational_logs(self, system_path: Path, config: Dict, system_id: str, rng: random.Random):
         """Generate operational logs with agent-searchable incident and troubleshooting context (NEW)"""
         log_dir = system_path / "var" / "log"
-        log_dir.mkdir(parents=True, exist_ok=True)
         
         # Application logs with troubleshooting context for vector search
         if "app-prod-01" in system_id:
@@ -858,16 +968,16 @@ root hard nofile 65536
                 "2024-09-10 09:20:12 ERROR [DatabasePool] All 50 connections in pool exhausted, queuing requests",
                 "2024-09-10 10:30:00 INFO [DatabasePool] Connection pool size increased to 100, service restored"
             ]
-            app_log.write_text("\n".join(app_logs))
+            app_log.write_bytes("\n".join(app_logs).encode())
         
         # Generate REAL RHEL security logs (authentic /var/log/secure)
-        self._generate_authentic_rhel_security_logs(log_dir, config, system_id)
+        self._generate_authentic_rhel_security_logs(log_dir, config, system_id, rng)
         
         # Generate authentic SELinux denials
-        self._generate_selinux_denials(log_dir, config)
+        self._generate_selinux_denials(log_dir, config, rng)
         
         # Generate httpd security events (where WAF logs would actually be)
-        self._generate_httpd_security_logs(log_dir, config, system_id)
+        self._generate_httpd_security_logs(log_dir, config, system_id, rng)
         
         # Remove any fake security.log that shouldn't exist on RHEL
         fake_security_log = log_dir / "security.log"
@@ -877,45 +987,45 @@ root hard nofile 65536
         # Performance logs for agent analysis
         performance_log = log_dir / "performance.log"
         perf_logs = [
-            f"2024-09-25 10:00:00 INFO [Metrics] CPU usage: {random.randint(15, 85)}%, Memory: {random.randint(60, 90)}%, Disk I/O: {random.randint(10, 50)} MB/s",
-            f"2024-09-25 11:00:00 INFO [Metrics] Response time average: {random.randint(150, 500)}ms, Active connections: {random.randint(100, 1000)}",
-            f"2024-09-25 12:00:00 WARN [Metrics] High memory usage detected: {random.randint(85, 95)}% on {config.get('prop_hostname', system_id)}"
+            f"2024-09-25 10:00:00 INFO [Metrics] CPU usage: {rng.randint(15, 85)}%, Memory: {rng.randint(60, 90)}%, Disk I/O: {rng.randint(10, 50)} MB/s",
+            f"2024-09-25 11:00:00 INFO [Metrics] Response time average: {rng.randint(150, 500)}ms, Active connections: {rng.randint(100, 1000)}",
+            f"2024-09-25 12:00:00 WARN [Metrics] High memory usage detected: {rng.randint(85, 95)}% on {config.get('prop_hostname', system_id)}"
         ]
-        performance_log.write_text("\n".join(perf_logs))
+        performance_log.write_bytes("\n".join(perf_logs).encode())
 
-    def _generate_performance_metrics(self, system_path: Path, config: Dict):
+    def _generate_performance_metrics(self, system_path: Path, config: Dict, rng: random.Random):
         """Generate performance metrics for agent analysis (NEW)"""
         metrics_dir = system_path / "var" / "metrics"
-        metrics_dir.mkdir(parents=True, exist_ok=True)
         
         # System metrics in JSON format for agent queries
         system_metrics = {
             "hostname": config.get('prop_hostname', 'unknown'),
             "environment": config['environment'],
-            "cpu_usage_percent": random.randint(15, 85),
-            "memory_used_gb": int(config.get('prop_memory_gb', '32')) * random.randint(60, 90) // 100,
+            "cpu_usage_percent": rng.randint(15, 85),
+            "memory_used_gb": int(config.get('prop_memory_gb', '32')) * rng.randint(60, 90) // 100,
             "memory_total_gb": int(config.get('prop_memory_gb', '32')),
-            "disk_used_percent": random.randint(45, 75),
-            "load_average_1min": round(random.uniform(0.5, 4.0), 2),
-            "network_throughput_mbps": random.randint(100, 1000),
-            "active_connections": random.randint(50, 500),
+            "disk_used_percent": rng.randint(45, 75),
+            "load_average_1min": round(rng.uniform(0.5, 4.0), 2),
+            "network_throughput_mbps": rng.randint(100, 1000),
+            "active_connections": rng.randint(50, 500),
             "last_updated": datetime.now().isoformat()
         }
         
-        (metrics_dir / "system_metrics.json").write_text(json.dumps(system_metrics, indent=2))
+        (metrics_dir / "system_metrics.json").write_bytes(json.dumps(system_metrics, indent=2).encode())
 
     def _generate_network_topology_files(self, system_path: Path, config: Dict):
         """Generate network configuration with topology awareness for agent queries (NEW)"""
         network_dir = system_path / "etc" / "sysconfig" / "network-scripts"
-        network_dir.mkdir(parents=True, exist_ok=True)
         
         # Enhanced network interface config
         ifcfg_eth0 = network_dir / "ifcfg-eth0"
+        ip_address = config.get('prop_ip', '10.1.1.100')
+        octets = ip_address.split('.')
         ifcfg_content = f"""DEVICE=eth0
 BOOTPROTO=static
-IPADDR={config.get('prop_ip', '10.1.1.100')}
+IPADDR={ip_address}
 NETMASK=255.255.255.0
-GATEWAY=10.{config.get('prop_ip', '10.1.1.100').split('.')[1]}.{config.get('prop_ip', '10.1.1.100').split('.')[2]}.1
+GATEWAY=10.{octets[1]}.{octets[2]}.1
 DNS1=8.8.8.8
 ONBOOT=yes
 TYPE=Ethernet
@@ -923,18 +1033,21 @@ TYPE=Ethernet
 # Environment: {config['environment']}
 # Business Service: {config.get('prop_business_service', 'Unknown')}
 """
-        ifcfg_eth0.write_text(ifcfg_content)
+        ifcfg_eth0.write_bytes(ifcfg_content.encode())
         
         # Generate hosts file with all system relationships
         hosts_file = system_path / "etc" / "hosts"
-        hosts_content = "127.0.0.1 localhost\n"
-        
-        # Add all systems for agent dependency queries
-        for sys_id, sys_config in self.systems.items():
-            if 'prop_ip' in sys_config:
-                hosts_content += f"{sys_config['prop_ip']} {sys_config.get('prop_hostname', sys_id)}\n"
-        
-        hosts_file.write_text(hosts_content)
+        hosts_file.write_bytes(self._hosts_content())
+    
+    def _hosts_content(self) -> bytes:
+        """/etc/hosts listing every system; identical for all systems, so it is joined and encoded once per run"""
+        if self._hosts_cache is None:
+            lines = ["127.0.0.1 localhost"]
+            # Add all systems for agent dependency queries
+            lines.extend(f"{sys_config['prop_ip']} {sys_config.get('prop_hostname', sys_id)}"
+                         for sys_id, sys_config in self.systems.items() if 'prop_ip' in sys_config)
+            self._hosts_cache = ("\n".join(lines) + "\n").encode()
+        return self._hosts_cache
 
     def generate_agent_metadata(self):
         """Generate metadata files optimized for Graph RAG agents (NEW)"""
@@ -949,7 +1062,7 @@ TYPE=Ethernet
             node = {
                 "id": system_id,
                 "labels": ["Server"],
-                "properties": {k: v for k, v in config.items() if k.startswith('prop_') or k in ['environment', 'criticality', 'datacenter']},
+                "properties": {k: v for k, v in config.items() if k.startswith('prop_') or k in SERVER_NODE_FIELDS},
                 "description": f"{config['environment']} server {system_id} in {config['datacenter']} running {config.get('prop_business_service', 'system services')}"
             }
             all_nodes.append(node)
@@ -966,8 +1079,8 @@ TYPE=Ethernet
                 all_nodes.append(node)
         
         # Save agent-compatible data
-        (metadata_dir / "nodes.json").write_text(json.dumps(all_nodes, indent=2))
-        (metadata_dir / "relationships.json").write_text(json.dumps(self.agent_relationships, indent=2))
+        (metadata_dir / "nodes.json").write_bytes(json.dumps(all_nodes, indent=2).encode())
+        (metadata_dir / "relationships.json").write_bytes(json.dumps(self.agent_relationships, indent=2).encode())
         
         # Generate agent query examples for testing
         query_examples = {
@@ -987,39 +1100,41 @@ TYPE=Ethernet
             ]
         }
         
-        (metadata_dir / "agent_query_examples.json").write_text(json.dumps(query_examples, indent=2))
+        (metadata_dir / "agent_query_examples.json").write_bytes(json.dumps(query_examples, indent=2).encode())
         
         print(f"🤖 Generated {len(all_nodes)} nodes and {len(self.agent_relationships)} relationships for Graph RAG agents")
         print(f"📊 Node types: Server, Incident, SecurityEvent, Application")
 
-    def _generate_authentic_rhel_security_logs(self, log_dir: Path, config: Dict, system_id: str):
+    def _generate_authentic_rhel_security_logs(self, log_dir: Path, config: Dict, system_id: str, rng: random.Random):
         """Generate authentic RHEL /var/log/secure with real authentication events (NEW)"""
         # THIS IS THE REAL RHEL AUTHENTICATION LOG FILE
         secure_log = log_dir / "secure"
         
         # Generate realistic authentication events from real RHEL systems
         auth_events = []
+        hostname = config.get('prop_hostname', system_id)
+        now = datetime.now()
         for i in range(20):
-            days_ago = random.randint(1, 30)
-            timestamp = datetime.now() - timedelta(days=days_ago)
-            hostname = config.get('prop_hostname', system_id)
+            days_ago = rng.randint(1, 30)
+            timestamp = now - timedelta(days=days_ago)
+            stamp = timestamp.strftime('%b %d %H:%M:%S')
             
             # Real RHEL authentication log formats
             events = [
-                f"{timestamp.strftime('%b %d %H:%M:%S')} {hostname} sshd[{random.randint(1000, 9999)}]: Accepted publickey for root from 10.1.1.100 port {random.randint(40000, 60000)} ssh2: RSA SHA256:abc123def456",
-                f"{timestamp.strftime('%b %d %H:%M:%S')} {hostname} sshd[{random.randint(1000, 9999)}]: Failed password for invalid user admin from 203.0.113.45 port {random.randint(40000, 60000)} ssh2",
-                f"{timestamp.strftime('%b %d %H:%M:%S')} {hostname} sudo: root : TTY=pts/0 ; PWD=/root ; USER=root ; COMMAND=/bin/systemctl restart httpd",
-                f"{timestamp.strftime('%b %d %H:%M:%S')} {hostname} sshd[{random.randint(1000, 9999)}]: pam_unix(sshd:session): session opened for user root by (uid=0)",
-                f"{timestamp.strftime('%b %d %H:%M:%S')} {hostname} sshd[{random.randint(1000, 9999)}]: pam_unix(sshd:session): session closed for user root",
-                f"{timestamp.strftime('%b %d %H:%M:%S')} {hostname} su: pam_unix(su-l:session): session opened for user apache by root(uid=0)",
-                f"{timestamp.strftime('%b %d %H:%M:%S')} {hostname} systemd-logind[{random.randint(500, 999)}]: New session {random.randint(1, 100)} of user root.",
-                f"{timestamp.strftime('%b %d %H:%M:%S')} {hostname} sshd[{random.randint(1000, 9999)}]: Invalid user oracle from 192.168.1.100 port {random.randint(40000, 60000)}"
+                f"{stamp} {hostname} sshd[{rng.randint(1000, 9999)}]: Accepted publickey for root from 10.1.1.100 port {rng.randint(40000, 60000)} ssh2: RSA SHA256:abc123def456",
+                f"{stamp} {hostname} sshd[{rng.randint(1000, 9999)}]: Failed password for invalid user admin from 203.0.113.45 port {rng.randint(40000, 60000)} ssh2",
+                f"{stamp} {hostname} sudo: root : TTY=pts/0 ; PWD=/root ; USER=root ; COMMAND=/bin/systemctl restart httpd",
+                f"{stamp} {hostname} sshd[{rng.randint(1000, 9999)}]: pam_unix(sshd:session): session opened for user root by (uid=0)",
+                f"{stamp} {hostname} sshd[{rng.randint(1000, 9999)}]: pam_unix(sshd:session): session closed for user root",
+                f"{stamp} {hostname} su: pam_unix(su-l:session): session opened for user apache by root(uid=0)",
+                f"{stamp} {hostname} systemd-logind[{rng.randint(500, 999)}]: New session {rng.randint(1, 100)} of user root.",
+                f"{stamp} {hostname} sshd[{rng.randint(1000, 9999)}]: Invalid user oracle from 192.168.1.100 port {rng.randint(40000, 60000)}"
             ]
-            auth_events.append(random.choice(events))
+            auth_events.append(rng.choice(events))
         
-        secure_log.write_text("\n".join(sorted(auth_events, reverse=True)))
+        secure_log.write_bytes("\n".join(sorted(auth_events, reverse=True)).encode())
 
-    def _generate_selinux_denials(self, log_dir: Path, config: Dict):
+    def _generate_selinux_denials(self, log_dir: Path, config: Dict, rng: random.Random):
         """Generate authentic SELinux denial logs in /var/log/messages (NEW)"""
         messages_file = log_dir / "messages"
         
@@ -1030,23 +1145,25 @@ TYPE=Ethernet
             existing_content = ""
         
         selinux_denials = []
+        hostname = config.get('prop_hostname', 'localhost')
+        now = datetime.now()
         for i in range(5):
-            days_ago = random.randint(1, 15)
-            timestamp = datetime.now() - timedelta(days=days_ago)
-            hostname = config.get('prop_hostname', 'localhost')
+            days_ago = rng.randint(1, 15)
+            timestamp = now - timedelta(days=days_ago)
+            stamp = timestamp.strftime('%b %d %H:%M:%S')
             
             # Real SELinux denial formats from RHEL systems
             denials = [
-                f"{timestamp.strftime('%b %d %H:%M:%S')} {hostname} kernel: audit: type=1400 audit(1693996800.123:456): avc: denied {{ read }} for pid={random.randint(1000, 9999)} comm=\"httpd\" name=\"index.html\" dev=\"dm-0\" ino={random.randint(100000, 999999)} scontext=system_u:system_r:httpd_t:s0 tcontext=unconfined_u:object_r:admin_home_t:s0 tclass=file permissive=0",
-                f"{timestamp.strftime('%b %d %H:%M:%S')} {hostname} setroubleshoot: SELinux is preventing httpd from read access on the file index.html. For complete SELinux messages run: sealert -l {random.choice(['abc12345-def6-789a-bcde-f0123456789a', 'xyz98765-abc4-321z-yzab-c0987654321z'])}",
-                f"{timestamp.strftime('%b %d %H:%M:%S')} {hostname} kernel: audit: type=1400 audit(1693996801.456:457): avc: denied {{ name_connect }} for pid={random.randint(1000, 9999)} comm=\"mysqld\" dest=3306 scontext=system_u:system_r:mysqld_t:s0 tcontext=system_u:object_r:mysqld_port_t:s0 tclass=tcp_socket permissive=0"
+                f"{stamp} {hostname} kernel: audit: type=1400 audit(1693996800.123:456): avc: denied {{ read }} for pid={rng.randint(1000, 9999)} comm=\"httpd\" name=\"index.html\" dev=\"dm-0\" ino={rng.randint(100000, 999999)} scontext=system_u:system_r:httpd_t:s0 tcontext=unconfined_u:object_r:admin_home_t:s0 tclass=file permissive=0",
+                f"{stamp} {hostname} setroubleshoot: SELinux is preventing httpd from read access on the file index.html. For complete SELinux messages run: sealert -l {rng.choice(['abc12345-def6-789a-bcde-f0123456789a', 'xyz98765-abc4-321z-yzab-c0987654321z'])}",
+                f"{stamp} {hostname} kernel: audit: type=1400 audit(1693996801.456:457): avc: denied {{ name_connect }} for pid={rng.randint(1000, 9999)} comm=\"mysqld\" dest=3306 scontext=system_u:system_r:mysqld_t:s0 tcontext=system_u:object_r:mysqld_port_t:s0 tclass=tcp_socket permissive=0"
             ]
-            selinux_denials.append(random.choice(denials))
+            selinux_denials.append(rng.choice(denials))
         
         updated_content = existing_content + "\n" + "\n".join(selinux_denials)
-        messages_file.write_text(updated_content)
+        messages_file.write_bytes(updated_content.encode())
 
-    def _generate_httpd_security_logs(self, log_dir: Path, config: Dict, system_id: str):
+    def _generate_httpd_security_logs(self, log_dir: Path, config: Dict, system_id: str, rng: random.Random):
         """Generate authentic Apache httpd security logs (where WAF events actually go) (NEW)"""
         if any(service in config.get('services', []) for service in ['httpd', 'nginx']):
             httpd_dir = log_dir / "httpd"
@@ -1056,55 +1173,36 @@ TYPE=Ethernet
             error_log = httpd_dir / "error_log"
             security_events = []
             
+            now = datetime.now()
             for i in range(10):
-                days_ago = random.randint(1, 30)
-                timestamp = datetime.now() - timedelta(days=days_ago)
+                days_ago = rng.randint(1, 30)
+                timestamp = now - timedelta(days=days_ago)
+                stamp = timestamp.strftime('%a %b %d %H:%M:%S.%f %Y')
                 
                 # Real Apache security log formats
                 events = [
-                    f"[{timestamp.strftime('%a %b %d %H:%M:%S.%f %Y')}] [security2:error] [pid {random.randint(1000, 9999)}] [client 192.168.100.250:54321] ModSecurity: Warning. Pattern match \"(?i:union.+select)\" at ARGS:search. [file \"/etc/httpd/modsecurity.d/activated_rules/modsecurity_crs_41_sql_injection_attacks.conf\"] [line \"37\"] [id \"981231\"] [msg \"SQL Injection Attack Detected via libinjection\"] [data \"union select\"] [severity \"CRITICAL\"] [hostname \"web-prod-01.company.com\"] [uri \"/api/users\"] [unique_id \"abc123def456\"]",
-                    f"[{timestamp.strftime('%a %b %d %H:%M:%S.%f %Y')}] [core:error] [pid {random.randint(1000, 9999)}] [client 203.0.113.45:43210] AH00124: Request exceeded the limit of 10 internal redirects due to probable configuration error. Use 'LimitInternalRecursion' to increase the limit if necessary.",
-                    f"[{timestamp.strftime('%a %b %d %H:%M:%S.%f %Y')}] [authz_core:error] [pid {random.randint(1000, 9999)}] [client 203.0.113.45:43211] AH01630: client denied by server configuration: /var/www/html/admin/",
-                    f"[{timestamp.strftime('%a %b %d %H:%M:%S.%f %Y')}] [ssl:warn] [pid {random.randint(1000, 9999)}] AH01909: RSA certificate configured for www.company.com:443 does NOT include an ID which matches the server name"
+                    f"[{stamp}] [security2:error] [pid {rng.randint(1000, 9999)}] [client 192.168.100.250:54321] ModSecurity: Warning. Pattern match \"(?i:union.+select)\" at ARGS:search. [file \"/etc/httpd/modsecurity.d/activated_rules/modsecurity_crs_41_sql_injection_attacks.conf\"] [line \"37\"] [id \"981231\"] [msg \"SQL Injection Attack Detected via libinjection\"] [data \"union select\"] [severity \"CRITICAL\"] [hostname \"web-prod-01.company.com\"] [uri \"/api/users\"] [unique_id \"abc123def456\"]",
+                    f"[{stamp}] [core:error] [pid {rng.randint(1000, 9999)}] [client 203.0.113.45:43210] AH00124: Request exceeded the limit of 10 internal redirects due to probable configuration error. Use 'LimitInternalRecursion' to increase the limit if necessary.",
+                    f"[{stamp}] [authz_core:error] [pid {rng.randint(1000, 9999)}] [client 203.0.113.45:43211] AH01630: client denied by server configuration: /var/www/html/admin/",
+                    f"[{stamp}] [ssl:warn] [pid {rng.randint(1000, 9999)}] AH01909: RSA certificate configured for www.company.com:443 does NOT include an ID which matches the server name"
                 ]
-                security_events.append(random.choice(events))
+                security_events.append(rng.choice(events))
             
-            error_log.write_text("\n".join(sorted(security_events, reverse=True)))
+            error_log.write_bytes("\n".join(sorted(security_events, reverse=True)).encode())
 
-    def _generate_authentic_compliance_data(self, system_path: Path, config: Dict):
+    def _generate_authentic_compliance_data(self, system_path: Path, config: Dict, rng: random.Random):
         """Generate authentic RHEL compliance and security configuration files (NEW)"""
+        hostname = config.get('prop_hostname', 'localhost')
         
         # Generate authentic PAM configuration
         pam_dir = system_path / "etc" / "pam.d"
-        pam_dir.mkdir(parents=True, exist_ok=True)
         
         # Real PAM sshd configuration
         pam_sshd = pam_dir / "sshd"
-        pam_sshd_content = """#%PAM-1.0
-auth       required     pam_sepermit.so
-auth       substack     password-auth
-auth       include      postlogin
-# Used with polkit to reauthorize users in remote sessions
--auth      optional     pam_reauthorize.so prepare
-account    required     pam_nologin.so
-account    include      password-auth
-password   include      password-auth
-# pam_selinux.so close should be the first session rule
-session    required     pam_selinux.so close
-session    required     pam_loginuid.so
-# pam_selinux.so open should only be followed by sessions to be executed in the user context
-session    required     pam_selinux.so open env_params
-session    required     pam_namespace.so
-session    optional     pam_keyinit.so force revoke
-session    include      password-auth
-session    include      postlogin
-# Used with polkit to reauthorize users in remote sessions
--session   optional     pam_reauthorize.so prepare"""
-        pam_sshd.write_text(pam_sshd_content)
+        pam_sshd.write_bytes(PAM_SSHD_CONF)
         
         # Generate real CIS benchmark results (in admin's home where they'd actually be)
         admin_home = system_path / "root"
-        admin_home.mkdir(parents=True, exist_ok=True)
         
         cis_results = admin_home / "cis-scan-report-$(date +%Y%m%d).html"
         # Generate authentic CIS HTML report (how CIS-CAT actually outputs)
@@ -1113,9 +1211,9 @@ session    include      postlogin
 <head><title>CIS-CAT Pro Assessment Report</title></head>
 <body>
 <h1>CIS Red Hat Enterprise Linux 9 Benchmark v1.0.0</h1>
-<h2>Assessment Results for {config.get('prop_hostname', 'localhost')}</h2>
+<h2>Assessment Results for {hostname}</h2>
 <p>Assessment Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-<p>Overall Score: {random.randint(75, 95)}%</p>
+<p>Overall Score: {rng.randint(75, 95)}%</p>
 
 <h3>Rule Results</h3>
 <table border="1">
@@ -1129,7 +1227,7 @@ session    include      postlogin
 <p>Generated by CIS-CAT Pro Assessor v4.0</p>
 </body>
 </html>"""
-        cis_results.write_text(cis_html)
+        cis_results.write_bytes(cis_html.encode())
         
         # Generate STIG findings (in realistic location - admin's home)
         stig_results = admin_home / "STIG_RHEL9_Checklist.ckl"
@@ -1139,11 +1237,11 @@ session    include      postlogin
     <ASSET>
         <ROLE>None</ROLE>
         <ASSET_TYPE>Computing</ASSET_TYPE>
-        <HOST_NAME>{config.get('prop_hostname', 'localhost')}</HOST_NAME>
+        <HOST_NAME>{hostname}</HOST_NAME>
         <HOST_IP>{config.get('prop_ip', '10.1.1.100')}</HOST_IP>
         <HOST_MAC></HOST_MAC>
         <HOST_GUID></HOST_GUID>
-        <HOST_FQDN>{config.get('prop_hostname', 'localhost')}</HOST_FQDN>
+        <HOST_FQDN>{hostname}</HOST_FQDN>
         <TECH_AREA></TECH_AREA>
         <TARGET_KEY>2777</TARGET_KEY>
         <WEB_OR_DATABASE>false</WEB_OR_DATABASE>
@@ -1188,39 +1286,30 @@ session    include      postlogin
         </iSTIG>
     </STIGS>
 </CHECKLIST>"""
-        stig_results.write_text(stig_content)
+        stig_results.write_bytes(stig_content.encode())
         
         # Generate authentic sudoers configuration
         sudoers_dir = system_path / "etc" / "sudoers.d"
-        sudoers_dir.mkdir(parents=True, exist_ok=True)
         
         sudoers_app = sudoers_dir / "application_users"
-        sudoers_content = """# Application service accounts
-apache ALL=(ALL) NOPASSWD: /bin/systemctl restart httpd, /bin/systemctl reload httpd
-mysql ALL=(ALL) NOPASSWD: /bin/systemctl restart mysql, /bin/systemctl stop mysql
-# Emergency access for platform team
-%platform_engineering ALL=(ALL) ALL
-# Monitoring user
-monitoring ALL=(ALL) NOPASSWD: /bin/ps, /bin/netstat, /bin/ss, /usr/bin/top
-"""
-        sudoers_app.write_text(sudoers_content)
+        sudoers_app.write_bytes(SUDOERS_APPLICATION_USERS)
 
     def _generate_security_agent_data(self, system_path: Path, config: Dict, system_id: str):
         """Generate security data in REAL RHEL locations (FIXED for authenticity)"""
+        hostname = config.get('prop_hostname', system_id)
+        ip = config.get('prop_ip', '10.1.1.100')
         # Use real Red Hat Insights directory structure
         insights_dir = system_path / "var" / "lib" / "insights"
-        insights_dir.mkdir(parents=True, exist_ok=True)
         
         # Real Red Hat Insights data (AUTHENTIC file structure)
         client_results_dir = insights_dir / "client-results"
-        client_results_dir.mkdir(parents=True, exist_ok=True)
         
         # Real Insights data file (authentic name format)
         vuln_scan = client_results_dir / "insights-archive-2024-09-07.tar.gz.json"
         vulnerabilities = {
             "scan_date": datetime.now().isoformat(),
             "scanner": "Red Hat Insights Security",
-            "target": config.get('prop_hostname', system_id),
+            "target": hostname,
             "vulnerabilities": [
                 {
                     "cve_id": "CVE-2024-3094",
@@ -1266,38 +1355,22 @@ monitoring ALL=(ALL) NOPASSWD: /bin/ps, /bin/netstat, /bin/ss, /usr/bin/top
                 "unpatched": 3
             }
         }
-        vuln_scan.write_text(json.dumps(vulnerabilities, indent=2))
+        vuln_scan.write_bytes(json.dumps(vulnerabilities, indent=2).encode())
         
         # Real firewalld status (authentic RHEL location)  
         firewalld_dir = system_path / "etc" / "firewalld"
-        firewalld_dir.mkdir(parents=True, exist_ok=True)
         
         # Generate authentic firewalld zone configuration
         public_zone = firewalld_dir / "zones" / "public.xml"
-        public_zone.parent.mkdir(parents=True, exist_ok=True)
-        zone_content = """<?xml version="1.0" encoding="utf-8"?>
-<zone>
-  <short>Public</short>
-  <description>For use in public areas</description>
-  <service name="ssh"/>
-  <service name="http"/>
-  <service name="https"/>
-  <port port="8080" protocol="tcp"/>
-  <rule family="ipv4">
-    <source address="192.168.100.0/24"/>
-    <drop/>
-  </rule>
-</zone>"""
-        public_zone.write_text(zone_content)
+        public_zone.write_bytes(FIREWALLD_PUBLIC_ZONE)
         
         # Network scan results - put in admin's home directory (realistic location)
         admin_home = system_path / "root"
-        admin_home.mkdir(parents=True, exist_ok=True)
         network_scan = admin_home / "nmap_scan_$(date +%Y%m%d).log"
         network_data = {
             "scan_date": datetime.now().isoformat(),
-            "target": config.get('prop_ip', '10.1.1.100'),
-            "hostname": config.get('prop_hostname', system_id),
+            "target": ip,
+            "hostname": hostname,
             "open_ports": [
                 {"port": 22, "service": "ssh", "version": "OpenSSH 8.7", "risk": "LOW", "justified": True},
                 {"port": 80, "service": "http", "version": "Apache 2.4.53", "risk": "LOW", "justified": True},
@@ -1326,8 +1399,8 @@ monitoring ALL=(ALL) NOPASSWD: /bin/ps, /bin/netstat, /bin/ss, /usr/bin/top
             ]
         }
         # Generate authentic nmap-style output instead of JSON
-        nmap_output = f"""Starting Nmap scan on {config.get('prop_hostname', system_id)} ({config.get('prop_ip', '10.1.1.100')})
-Nmap scan report for {config.get('prop_hostname', system_id)} ({config.get('prop_ip', '10.1.1.100')})
+        nmap_output = f"""Starting Nmap scan on {hostname} ({ip})
+Nmap scan report for {hostname} ({ip})
 Host is up (0.0012s latency).
 
 PORT     STATE SERVICE VERSION
@@ -1337,121 +1410,92 @@ PORT     STATE SERVICE VERSION
 3306/tcp closed mysql
 
 Nmap done: 1 IP address (1 host up) scanned in 2.45 seconds"""
-        network_scan.write_text(nmap_output)
+        network_scan.write_bytes(nmap_output.encode())
         
         # Real user and group files (authentic RHEL location)
         passwd_file = system_path / "etc" / "passwd"
-        passwd_file.parent.mkdir(parents=True, exist_ok=True)
         # Generate authentic /etc/passwd content
-        passwd_content = """root:x:0:0:root:/root:/bin/bash
-bin:x:1:1:bin:/bin:/sbin/nologin
-daemon:x:2:2:daemon:/sbin:/sbin/nologin
-adm:x:3:4:adm:/var/adm:/sbin/nologin
-lp:x:4:7:lp:/var/spool/lpd:/sbin/nologin
-sync:x:5:0:sync:/sbin:/bin/sync
-shutdown:x:6:0:shutdown:/sbin:/sbin/shutdown
-halt:x:7:0:halt:/sbin:/sbin/halt
-mail:x:8:12:mail:/var/spool/mail:/sbin/nologin
-operator:x:11:0:operator:/root:/sbin/nologin
-games:x:12:100:games:/usr/games:/sbin/nologin
-ftp:x:14:50:FTP User:/var/ftp:/sbin/nologin
-nobody:x:65534:65534:Kernel Overflow User:/:/sbin/nologin
-dbus:x:81:81:System message bus:/:/sbin/nologin
-systemd-coredump:x:999:997:systemd Core Dumper:/:/sbin/nologin
-systemd-resolve:x:193:193:systemd Resolver:/:/sbin/nologin
-tss:x:59:59:Account used for TPM access:/dev/null:/sbin/nologin
-polkitd:x:998:996:User for polkitd:/:/sbin/nologin
-libstoragemgmt:x:997:995:daemon account for libstoragemgmt:/var/run/lsm:/sbin/nologin
-cockpit-ws:x:996:994:User for cockpit web service:/nonexisting:/sbin/nologin
-cockpit-wsinstance:x:995:993:User for cockpit-ws instances:/nonexisting:/sbin/nologin
-sssd:x:994:992:User for sssd:/:/sbin/nologin
-sshd:x:74:74:Privilege-separated SSH:/var/empty/sshd:/sbin/nologin
-chrony:x:993:991::/var/lib/chrony:/sbin/nologin
-apache:x:48:48:Apache:/usr/share/httpd:/sbin/nologin
-mysql:x:27:27:MySQL Server:/var/lib/mysql:/sbin/nologin
-monitoring:x:1001:1001:Monitoring User:/home/monitoring:/bin/bash"""
-        passwd_file.write_text(passwd_content)
+        passwd_file.write_bytes(ETC_PASSWD)
 
-    def _generate_performance_agent_data(self, system_path: Path, config: Dict):
+    def _generate_performance_agent_data(self, system_path: Path, config: Dict, rng: random.Random):
         """Generate performance data in REAL RHEL locations (FIXED for authenticity)"""
         # Use real SAR data location
         sar_dir = system_path / "var" / "log" / "sa"
-        sar_dir.mkdir(parents=True, exist_ok=True)
         
         # Generate authentic SAR data file (real RHEL performance tool)
-        today = datetime.now().strftime('%d')
+        # One clock read: the file name and the report header agree even across midnight
+        now = datetime.now()
+        today = now.strftime('%d')
         sar_file = sar_dir / f"sa{today}"
         
         # Also generate readable sar report
         perf_history = sar_dir / f"sar{today}.txt"
         # Generate authentic SAR output format (real RHEL performance data)
-        sar_output = f"""Linux {config.get('prop_hostname', 'localhost')} ({config['kernel']}) \t{datetime.now().strftime('%m/%d/%Y')} \t_x86_64_\t({config.get('prop_cpu_cores', '8')} CPU)
+        sar_output = f"""Linux {config.get('prop_hostname', 'localhost')} ({config['kernel']}) \t{now.strftime('%m/%d/%Y')} \t_x86_64_\t({config.get('prop_cpu_cores', '8')} CPU)
 
 12:00:01 AM     CPU     %user     %nice   %system   %iowait    %steal     %idle
-12:10:01 AM     all      {random.randint(10, 30)}.{random.randint(10, 99)}      0.00      {random.randint(5, 15)}.{random.randint(10, 99)}      {random.randint(1, 5)}.{random.randint(10, 99)}      0.00     {random.randint(60, 80)}.{random.randint(10, 99)}
-12:20:01 AM     all      {random.randint(15, 35)}.{random.randint(10, 99)}      0.00      {random.randint(8, 18)}.{random.randint(10, 99)}      {random.randint(2, 6)}.{random.randint(10, 99)}      0.00     {random.randint(55, 75)}.{random.randint(10, 99)}
-12:30:01 AM     all      {random.randint(20, 40)}.{random.randint(10, 99)}      0.00     {random.randint(10, 20)}.{random.randint(10, 99)}      {random.randint(1, 4)}.{random.randint(10, 99)}      0.00     {random.randint(50, 70)}.{random.randint(10, 99)}
+12:10:01 AM     all      {rng.randint(10, 30)}.{rng.randint(10, 99)}      0.00      {rng.randint(5, 15)}.{rng.randint(10, 99)}      {rng.randint(1, 5)}.{rng.randint(10, 99)}      0.00     {rng.randint(60, 80)}.{rng.randint(10, 99)}
+12:20:01 AM     all      {rng.randint(15, 35)}.{rng.randint(10, 99)}      0.00      {rng.randint(8, 18)}.{rng.randint(10, 99)}      {rng.randint(2, 6)}.{rng.randint(10, 99)}      0.00     {rng.randint(55, 75)}.{rng.randint(10, 99)}
+12:30:01 AM     all      {rng.randint(20, 40)}.{rng.randint(10, 99)}      0.00     {rng.randint(10, 20)}.{rng.randint(10, 99)}      {rng.randint(1, 4)}.{rng.randint(10, 99)}      0.00     {rng.randint(50, 70)}.{rng.randint(10, 99)}
 
-Average:        all      {random.randint(18, 32)}.{random.randint(10, 99)}      0.00     {random.randint(8, 16)}.{random.randint(10, 99)}      {random.randint(1, 5)}.{random.randint(10, 99)}      0.00     {random.randint(55, 75)}.{random.randint(10, 99)}
+Average:        all      {rng.randint(18, 32)}.{rng.randint(10, 99)}      0.00     {rng.randint(8, 16)}.{rng.randint(10, 99)}      {rng.randint(1, 5)}.{rng.randint(10, 99)}      0.00     {rng.randint(55, 75)}.{rng.randint(10, 99)}
 
 12:00:01 AM kbmemfree kbmemused  %memused kbbuffers  kbcached  kbcommit   %commit  kbactive   kbinact   kbdirty
-12:10:01 AM   {random.randint(5000000, 8000000)}  {random.randint(25000000, 30000000)}     {random.randint(70, 85)}.{random.randint(10, 99)}    {random.randint(200000, 400000)}  {random.randint(8000000, 12000000)}  {random.randint(15000000, 20000000)}     {random.randint(45, 65)}.{random.randint(10, 99)} {random.randint(12000000, 16000000)}  {random.randint(4000000, 6000000)}      {random.randint(100, 500)}
-12:20:01 AM   {random.randint(4500000, 7500000)}  {random.randint(26000000, 31000000)}     {random.randint(72, 87)}.{random.randint(10, 99)}    {random.randint(250000, 450000)}  {random.randint(8500000, 12500000)}  {random.randint(16000000, 21000000)}     {random.randint(48, 68)}.{random.randint(10, 99)} {random.randint(13000000, 17000000)}  {random.randint(4200000, 6200000)}      {random.randint(150, 600)}
+12:10:01 AM   {rng.randint(5000000, 8000000)}  {rng.randint(25000000, 30000000)}     {rng.randint(70, 85)}.{rng.randint(10, 99)}    {rng.randint(200000, 400000)}  {rng.randint(8000000, 12000000)}  {rng.randint(15000000, 20000000)}     {rng.randint(45, 65)}.{rng.randint(10, 99)} {rng.randint(12000000, 16000000)}  {rng.randint(4000000, 6000000)}      {rng.randint(100, 500)}
+12:20:01 AM   {rng.randint(4500000, 7500000)}  {rng.randint(26000000, 31000000)}     {rng.randint(72, 87)}.{rng.randint(10, 99)}    {rng.randint(250000, 450000)}  {rng.randint(8500000, 12500000)}  {rng.randint(16000000, 21000000)}     {rng.randint(48, 68)}.{rng.randint(10, 99)} {rng.randint(13000000, 17000000)}  {rng.randint(4200000, 6200000)}      {rng.randint(150, 600)}
 
-Average:      {random.randint(5000000, 7000000)}  {random.randint(25000000, 29000000)}     {random.randint(72, 85)}.{random.randint(10, 99)}    {random.randint(220000, 420000)}  {random.randint(8200000, 12200000)}  {random.randint(15500000, 20500000)}     {random.randint(47, 67)}.{random.randint(10, 99)} {random.randint(12500000, 16500000)}  {random.randint(4100000, 6100000)}      {random.randint(125, 550)}"""
+Average:      {rng.randint(5000000, 7000000)}  {rng.randint(25000000, 29000000)}     {rng.randint(72, 85)}.{rng.randint(10, 99)}    {rng.randint(220000, 420000)}  {rng.randint(8200000, 12200000)}  {rng.randint(15500000, 20500000)}     {rng.randint(47, 67)}.{rng.randint(10, 99)} {rng.randint(12500000, 16500000)}  {rng.randint(4100000, 6100000)}      {rng.randint(125, 550)}"""
         
-        perf_history.write_text(sar_output)
+        perf_history.write_bytes(sar_output.encode())
         
         # Generate /proc/loadavg (real RHEL location)
         proc_dir = system_path / "proc"
-        proc_dir.mkdir(parents=True, exist_ok=True)
         loadavg_file = proc_dir / "loadavg"
-        loadavg_content = f"{random.uniform(0.5, 4.0):.2f} {random.uniform(0.8, 3.5):.2f} {random.uniform(1.0, 3.0):.2f} {random.randint(1, 5)}/{random.randint(150, 300)} {random.randint(1000, 9999)}"
-        loadavg_file.write_text(loadavg_content)
+        loadavg_content = f"{rng.uniform(0.5, 4.0):.2f} {rng.uniform(0.8, 3.5):.2f} {rng.uniform(1.0, 3.0):.2f} {rng.randint(1, 5)}/{rng.randint(150, 300)} {rng.randint(1000, 9999)}"
+        loadavg_file.write_bytes(loadavg_content.encode())
 
-    def _generate_compliance_agent_data(self, system_path: Path, config: Dict):
+    def _generate_compliance_agent_data(self, system_path: Path, config: Dict, rng: random.Random):
         """Generate compliance data in REAL RHEL locations (FIXED for authenticity)"""
         # Use real OpenSCAP directory structure
         openscap_dir = system_path / "var" / "lib" / "openscap"
-        openscap_dir.mkdir(parents=True, exist_ok=True)
         
         # Generate authentic OpenSCAP result file (real RHEL compliance tool)
         compliance_report = openscap_dir / "ssg-rhel9-xccdf-result.xml"
         # Generate authentic OpenSCAP XML format instead of JSON
+        scan_time = datetime.now().isoformat()
+        hostname = config.get('prop_hostname', 'localhost')
         openscap_xml = f"""<?xml version="1.0" encoding="UTF-8"?>
-<TestResult xmlns="http://checklists.nist.gov/xccdf/1.2" id="xccdf_org.ssgproject.content_testresult_default-profile" start-time="{datetime.now().isoformat()}" end-time="{datetime.now().isoformat()}" test-system="{config.get('prop_hostname', 'localhost')}" version="0.1.66">
+<TestResult xmlns="http://checklists.nist.gov/xccdf/1.2" id="xccdf_org.ssgproject.content_testresult_default-profile" start-time="{scan_time}" end-time="{scan_time}" test-system="{hostname}" version="0.1.66">
   <benchmark href="/usr/share/xml/scap/ssg/content/ssg-rhel9-xccdf.xml" id="xccdf_org.ssgproject.content_benchmark_RHEL-9"/>
   <title>OSCAP Scan Result</title>
   <identity authenticated="true" privileged="true">root</identity>
   <profile idref="xccdf_org.ssgproject.content_profile_cis"/>
-  <target>{config.get('prop_hostname', 'localhost')}</target>
+  <target>{hostname}</target>
   <target-address>{config.get('prop_ip', '10.1.1.100')}</target-address>
   
-  <rule-result idref="xccdf_org.ssgproject.content_rule_accounts_password_minlen_login_defs" severity="medium" time="{datetime.now().isoformat()}">
+  <rule-result idref="xccdf_org.ssgproject.content_rule_accounts_password_minlen_login_defs" severity="medium" time="{scan_time}">
     <result>pass</result>
   </rule-result>
   
-  <rule-result idref="xccdf_org.ssgproject.content_rule_accounts_passwords_pam_faillock_deny" severity="medium" time="{datetime.now().isoformat()}">
+  <rule-result idref="xccdf_org.ssgproject.content_rule_accounts_passwords_pam_faillock_deny" severity="medium" time="{scan_time}">
     <result>fail</result>
     <message>Account lockout policy not configured</message>
   </rule-result>
   
-  <rule-result idref="xccdf_org.ssgproject.content_rule_service_sshd_enabled" severity="high" time="{datetime.now().isoformat()}">
+  <rule-result idref="xccdf_org.ssgproject.content_rule_service_sshd_enabled" severity="high" time="{scan_time}">
     <result>pass</result>
   </rule-result>
   
-  <score system="urn:xccdf:scoring:absolute" maximum="100">{random.randint(75, 95)}</score>
+  <score system="urn:xccdf:scoring:absolute" maximum="100">{rng.randint(75, 95)}</score>
 </TestResult>"""
-        compliance_report.write_text(openscap_xml)
+        compliance_report.write_bytes(openscap_xml.encode())
 
     def _generate_approval_gate_data(self, system_path: Path, config: Dict):
         """Generate risk data in REAL RHEL locations (FIXED for authenticity)"""
         # Use real Red Hat Insights directory for findings
         insights_dir = system_path / "var" / "lib" / "insights"
-        insights_dir.mkdir(parents=True, exist_ok=True)
         
         client_results_dir = insights_dir / "client-results"
-        client_results_dir.mkdir(parents=True, exist_ok=True)
         
         # Generate Red Hat Insights findings (real RHEL location)
         approval_queue = client_results_dir / "advisor-recommendations.json"
@@ -1518,10 +1562,11 @@ Average:      {random.randint(5000000, 7000000)}  {random.randint(25000000, 2900
                 "LOW": {"approver": "Platform_Team", "timeline": "30_days", "escalation": "Security_Team"}
             }
         }
-        approval_queue.write_text(json.dumps(approval_data, indent=2))
+        approval_queue.write_bytes(json.dumps(approval_data, indent=2).encode())
 
-    def _cleanup_fake_directories(self, system_path: Path):
-        """Remove fake directories that don't exist on real RHEL systems (AUTHENTICITY FIX)"""
+    def _cleanup_fake_directories(self, system_path: Path) -> List[str]:
+        """Remove fake directories that don't exist on real RHEL systems (AUTHENTICITY FIX); returns what was removed"""
+        removed = []
         fake_dirs = [
             system_path / "var" / "security",      #  Not real RHEL
             system_path / "var" / "performance",   #  Not real RHEL
@@ -1532,14 +1577,18 @@ Average:      {random.randint(5000000, 7000000)}  {random.randint(25000000, 2900
             system_path / "var" / "log" / "security"     #  Not real RHEL
         ]
         
-        import shutil
+        # Remove directly instead of exists() first: one syscall per path, and usually nothing is there
         for fake_dir in fake_dirs:
-            if fake_dir.exists():
+            try:
                 shutil.rmtree(fake_dir)
-                print(f"   🧹 Removed fake directory: {fake_dir.name}")
+            except FileNotFoundError:
+                continue
+            removed.append(f"   🧹 Removed fake directory: {fake_dir.name}")
+        return removed
 
-    def _cleanup_fake_files(self, system_path: Path):
-        """Remove fake files that don't exist on real RHEL systems (AUTHENTICITY FIX)"""
+    def _cleanup_fake_files(self, system_path: Path) -> List[str]:
+        """Remove fake files that don't exist on real RHEL systems (AUTHENTICITY FIX); returns what was removed"""
+        removed = []
         fake_files = [
             system_path / "var" / "lib" / "insights" / "insights_findings.json",  #  Not real filename
             system_path / "var" / "lib" / "insights" / "vulnerabilities.json",   #  Not real filename
@@ -1547,9 +1596,12 @@ Average:      {random.randint(5000000, 7000000)}  {random.randint(25000000, 2900
         ]
         
         for fake_file in fake_files:
-            if fake_file.exists():
+            try:
                 fake_file.unlink()
-                print(f"   🧹 Removed fake file: {fake_file.name}")
+            except FileNotFoundError:
+                continue
+            removed.append(f"   🧹 Removed fake file: {fake_file.name}")
+        return removed
 
 if __name__ == "__main__":
     import sys
@@ -1578,13 +1630,10 @@ if __name__ == "__main__":
     print("   📊 Supports Cypher queries and semantic vector search")
     
     # Show enterprise statistics
-    envs = {}
-    types = {}
+    envs, types = Counter(), Counter()
     for system_id, config in generator.systems.items():
-        env = config['environment']
-        sys_type = system_id.split('-')[0]
-        envs[env] = envs.get(env, 0) + 1
-        types[sys_type] = types.get(sys_type, 0) + 1
+        envs[config['environment']] += 1
+        types[system_id.partition('-')[0]] += 1
     
     print(f"\n📊 Enterprise Distribution:")
     print(f"   Environments: {dict(sorted(envs.items()))}")